@@ -0,0 +1,72 @@
+# カテゴリ選択と楽天の取得を重ねて実行する asyncio 版のパイプライン
+# モデルがカテゴリIDを1つ書き終わるたびに、そのカテゴリのランキング取得を始める
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from settings import RAKUTEN_MAX_WORKERS
+from category_search import STAPLE_ROOTS
+from generation import stream_category_ids, fetch_category
+import tracing
+
+
+def staple_category_ids(rice_ratio, bread_ratio, noodle_ratio):
+    # 比重が0より大きい主食の大カテゴリ。カテゴリ選択を待たずに先に取得しておく
+    ratios = {"rice": rice_ratio, "bread": bread_ratio, "noodle": noodle_ratio}
+    return [category_id for staple, ratio in ratios.items() if ratio > 0 for category_id in STAPLE_ROOTS[staple]]
+
+
+async def select_and_fetch(user_request, categories, start_date, rice_ratio, bread_ratio, noodle_ratio,
+                           mode=None, use_cache=True, prefetch=True):
+    # (カテゴリIDの文字列, レシピ, 取得の記録) を返す
+    # 記録には、カテゴリ選択の開始から各カテゴリの取得が終わるまでの時間 "ready" も残す
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    done = object()
+    start = time.monotonic()
+
+    def produce():
+        # スレッド上でモデルの出力を読み、IDをイベントループのキューに渡す
+        try:
+            for category_id in stream_category_ids(user_request, categories, start_date,
+                                                   rice_ratio, bread_ratio, noodle_ratio, mode, use_cache):
+                loop.call_soon_threadsafe(queue.put_nowait, category_id)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, done)
+
+    async def fetch(category_id):
+        recipes, stat = await loop.run_in_executor(executor, fetch_category, category_id)
+        stat["ready"] = round(time.monotonic() - start, 3)
+        return recipes, stat
+
+    executor = ThreadPoolExecutor(max_workers=max(1, RAKUTEN_MAX_WORKERS))
+    try:
+        tasks = {}
+        if prefetch:
+            for category_id in staple_category_ids(rice_ratio, bread_ratio, noodle_ratio):
+                tasks[category_id] = asyncio.ensure_future(fetch(category_id))
+
+        # 選択はスレッドで動かし、取得用のスレッドを占有しないよう専用の executor を使う
+        producer = loop.run_in_executor(None, tracing.bind(produce))
+        selected_ids = []
+        while True:
+            category_id = await queue.get()
+            if category_id is done:
+                break
+            selected_ids.append(category_id)
+            if category_id not in tasks:
+                tasks[category_id] = asyncio.ensure_future(fetch(category_id))
+        await producer
+
+        # 選ばれたカテゴリを先に、先読みした主食カテゴリを後ろに並べる
+        order = selected_ids + [category_id for category_id in tasks if category_id not in selected_ids]
+        results = await asyncio.gather(*(tasks[category_id] for category_id in order))
+    finally:
+        executor.shutdown(wait=False)
+
+    all_recipes = []
+    fetch_stats = []
+    for recipes, stat in results:
+        all_recipes.extend(recipes)
+        fetch_stats.append(stat)
+    return ",".join(selected_ids), all_recipes, fetch_stats
@@ -0,0 +1,223 @@
+# 複数の世帯・数週間分の献立をまとめて作る
+#   python batch.py requests.jsonl -o plans.jsonl
+# 入力は1行に1件のJSON:
+#   {"id": "任意", "user_request": "和食メイン", "start_date": "2026-11-02",
+#    "meal_types": ["朝食", "昼食", "夕食"], "rice_ratio": 50, "bread_ratio": 25, "noodle_ratio": 25,
+#    "weeks": 4, "use_cache": true}
+# 要求をまたいで、同じ条件のカテゴリ選択と同じカテゴリのレシピ取得は1回だけ行い、
+# できた順に1行ずつ結果を書き出す。Gemini の同時呼び出し数は --gemini-concurrency で制限する
+import argparse
+import json
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+
+import settings
+from clients import load_category_data, get_plan_cache
+from generation import get_category_ids, fetch_category
+from llm_cache import request_key, fingerprint
+from meal_plan import plan_problem
+from pipeline import meal_plan_params, plan_cache_key, create_meal_plan
+from rakuten import parse_category_ids
+
+DEFAULT_MEAL_TYPES = ["朝食", "昼食", "夕食"]
+MAX_WEEKS = 12
+
+
+class SharedCalls:
+    # 同じキーの呼び出しを1回にまとめ、実行中なら終わるのを待って同じ結果（または例外）を返す
+    # 失敗した結果は覚えておかない（一時的なエラーを、あとから同じキーを呼ぶ要求にまで返さない）
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures = {}
+        self.calls = 0
+
+    def __call__(self, key, function, *args):
+        with self._lock:
+            self.calls += 1
+            future = self._futures.get(key)
+            owner = future is None
+            if owner:
+                future = self._futures[key] = Future()
+        if owner:
+            try:
+                future.set_result(function(*args))
+            except Exception as e:
+                # 実行中に待っていた呼び出しには同じ例外を返し、次の呼び出しからはやり直す
+                with self._lock:
+                    self._futures.pop(key, None)
+                future.set_exception(e)
+        return future.result()
+
+    def stats(self):
+        with self._lock:
+            return {"calls": self.calls, "unique": len(self._futures)}
+
+
+def parse_request(data):
+    # 1行分の要求を確かめ、足りない項目は画面と同じ既定値で埋める
+    if not isinstance(data, dict):
+        raise ValueError("要求はJSONのオブジェクトにしてください")
+    user_request = str(data.get("user_request") or "").strip()
+    if not user_request:
+        raise ValueError("user_request がありません")
+    meal_types = data.get("meal_types") or DEFAULT_MEAL_TYPES
+    if not isinstance(meal_types, list) or any(meal_type not in DEFAULT_MEAL_TYPES for meal_type in meal_types):
+        raise ValueError(f"meal_types は {DEFAULT_MEAL_TYPES} から選んでください")
+    weeks = int(data.get("weeks", 1))
+    if not 1 <= weeks <= MAX_WEEKS:
+        raise ValueError(f"weeks は1から{MAX_WEEKS}にしてください")
+    return {
+        "id": data.get("id"),
+        "user_request": user_request,
+        "start_date": date.fromisoformat(data["start_date"]) if data.get("start_date") else date.today(),
+        "meal_types": meal_types,
+        "ratios": tuple(int(data.get(name, default)) for name, default in
+                        (("rice_ratio", 50), ("bread_ratio", 25), ("noodle_ratio", 25))),
+        "weeks": weeks,
+        "use_cache": bool(data.get("use_cache", True)),
+    }
+
+
+class BatchPlanner:
+    def __init__(self):
+        self.categories = load_category_data()
+        self.selections = SharedCalls()
+        self.fetches = SharedCalls()
+
+    def sources(self, params):
+        # カテゴリ選択は応答キャッシュと同じ条件（要望・季節・曜日・行事・比重）でまとめる
+        start_date = date.fromisoformat(params["start_date"])
+        ratios = (params["rice_ratio"], params["bread_ratio"], params["noodle_ratio"])
+        use_cache = params["use_cache"]
+        key = request_key("category_ids", params["user_request"], start_date, [], *ratios, use_cache=use_cache)
+        category_ids = self.selections(key, get_category_ids, params["user_request"], self.categories,
+                                       start_date, *ratios, None, use_cache)
+        recipes = []
+        fetch_stats = []
+        for category_id in parse_category_ids(category_ids, 20):
+            category_recipes, stat = self.fetches(category_id, fetch_category, category_id)
+            recipes.extend(category_recipes)
+            fetch_stats.append(stat)
+        return category_ids, recipes, fetch_stats
+
+    def plan(self, request):
+        # 1週ずつ順に作り、前の週までに使ったレシピは次の週の候補から外す
+        weeks = []
+        used_urls = set()
+        for week in range(request["weeks"]):
+            params = meal_plan_params(
+                request["user_request"], request["start_date"] + timedelta(days=7 * week), request["meal_types"],
+                *request["ratios"], use_cache=request["use_cache"],
+            )
+            exclude_urls = frozenset(used_urls)
+            extra = {"exclude": fingerprint(sorted(exclude_urls))} if exclude_urls else {}
+            result, state = get_plan_cache().get_or_compute(
+                plan_cache_key(params, **extra),
+                lambda: create_meal_plan(params, sources=self.sources, exclude_urls=exclude_urls),
+                bypass=not request["use_cache"],
+                validate=lambda result: plan_problem(result["meal_plan"], params["meal_types"]),
+            )
+            for meals in result["meal_plan"].values():
+                used_urls.update(meal_info["url"] for meal_info in meals.values() if meal_info.get("url"))
+            weeks.append({
+                "start_date": params["start_date"],
+                "meal_plan": result["meal_plan"],
+                "materials_summary": result["materials_summary"],
+                "category_ids": result["category_ids"],
+                "plan_cache": state,
+                "trace": result.get("trace", {}).get("totals"),
+                "warning": result.get("warning"),
+            })
+        return weeks
+
+    def stats(self):
+        return {"category_selections": self.selections.stats(), "category_fetches": self.fetches.stats()}
+
+
+def read_requests(lines):
+    # (行番号, 要求, 読めなかった理由) を順に返す。空行は飛ばす
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            yield number, parse_request(json.loads(line)), None
+        except (ValueError, KeyError, TypeError) as e:
+            yield number, None, str(e) or type(e).__name__
+
+
+def run_batch(lines, write, max_workers=settings.BATCH_MAX_WORKERS, log=None):
+    # できた順に write(1行分の辞書) を呼ぶ。(成功数, 失敗数) を返す
+    planner = BatchPlanner()
+    ok = failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="batch-plan") as executor:
+        futures = {}
+        for number, request, error in read_requests(lines):
+            if error is not None:
+                write({"line": number, "error": error})
+                failed += 1
+                continue
+            futures[executor.submit(timed, planner.plan, request)] = (number, request)
+        for done, future in enumerate(as_completed(futures), 1):
+            number, request = futures[future]
+            record = {"line": number, "id": number if request["id"] is None else request["id"],
+                      "user_request": request["user_request"]}
+            try:
+                weeks, elapsed = future.result()
+            except Exception as e:
+                record["error"] = str(e) or type(e).__name__
+                failed += 1
+                message = f"失敗 {record['error']}"
+            else:
+                record.update(start_date=request["start_date"].isoformat(), elapsed=round(elapsed, 3), weeks=weeks)
+                ok += 1
+                partial = sum(1 for week in weeks if week["warning"])
+                message = f"{len(weeks)}週分 {elapsed:.1f}秒" + (f"（{partial}週分は一部が欠けています）" if partial else "")
+            write(record)
+            if log:
+                log(f"[{done}/{len(futures)}] 行 {number}: {message}")
+    if log:
+        log(f"完了: 成功 {ok} 件 / 失敗 {failed} 件 {planner.stats()} 献立キャッシュ: {get_plan_cache().stats()}")
+    return ok, failed
+
+
+def timed(function, *args):
+    start = time.monotonic()
+    return function(*args), time.monotonic() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="JSONLの要求から献立をまとめて作り、JSONLで書き出す")
+    parser.add_argument("input", help="要求のJSONLファイル（- なら標準入力）")
+    parser.add_argument("-o", "--output", help="結果のJSONLファイル（省略時は標準出力）")
+    parser.add_argument("--workers", type=int, default=settings.BATCH_MAX_WORKERS, help="同時に作る要求の数")
+    parser.add_argument("--gemini-concurrency", type=int, default=settings.GEMINI_MAX_CONCURRENCY or 4,
+                        help="Gemini を同時に呼び出す数の上限")
+    args = parser.parse_args(argv)
+
+    # モデルを作る前に設定する（get_model が上限付きで包む）
+    settings.GEMINI_MAX_CONCURRENCY = args.gemini_concurrency
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    output = sys.stdout if not args.output else open(args.output, "w", encoding="utf-8")
+
+    def write(record):
+        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output.flush()
+
+    def log(message):
+        print(message, file=sys.stderr, flush=True)
+
+    try:
+        ok, failed = run_batch(source, write, args.workers, log)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    return 1 if failed and not ok else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+# 献立作成パイプラインのベンチマーク
+# 楽天・Gemini の代わりに記録済み（なければ合成した）応答を返す偽物を使い、通信せずに各段階を計測する
+#   python benchmark.py                              合成データで計測して表を出力
+#   python benchmark.py --fixtures bench_fixtures    記録した応答で計測
+#   python benchmark.py --record bench_fixtures      本物のAPIを呼んで応答を記録する（APIキーが必要）
+#   python benchmark.py --json result.json --baseline previous.json   前回より遅くなった段階があれば終了コード1
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+
+SAMPLE_REQUEST = "和食中心で簡単なもの"
+SAMPLE_START = date(2026, 10, 19)
+MEAL_TYPES = ["朝食", "昼食", "夕食"]
+RATIOS = (50, 25, 25)
+
+# 合成レシピに使う語
+DISHES = ("照り焼き", "生姜焼き", "煮物", "炒め", "丼", "カレー", "グラタン", "焼きそば", "うどん", "サンド",
+          "トースト", "スープ", "唐揚げ", "ハンバーグ", "南蛮", "蒸し", "ソテー", "パスタ", "オムレツ", "餃子")
+INGREDIENTS = ("鶏もも肉", "豚バラ肉", "牛こま", "鮭", "さば", "卵", "玉ねぎ", "にんじん", "じゃがいも", "キャベツ",
+               "白菜", "大根", "なす", "ピーマン", "しめじ", "豆腐", "しょうゆ", "みりん", "酒", "砂糖", "塩", "こしょう",
+               "ごま油", "バター", "味噌", "片栗粉", "にんにく", "しょうが", "長ねぎ", "トマト")
+
+
+def _use_temp_storage(directory):
+    # キャッシュ・ストアは一時ディレクトリに作り、ランキングのキャッシュは毎回外れるようにする
+    os.environ.update({
+        "RAKUTEN_CACHE_PATH": os.path.join(directory, "rankings.sqlite3"),
+        "RAKUTEN_CACHE_TTL": "0",
+        "RAKUTEN_CACHE_MAX_STALE": "0",
+        "RAKUTEN_OFFLINE": "0",
+        "RECIPE_SOURCE": "api",
+        "LLM_CACHE_PATH": os.path.join(directory, "llm.sqlite3"),
+        "LLM_CACHE_BYPASS": "1",
+        "JOB_DB_PATH": os.path.join(directory, "jobs.sqlite3"),
+        "RECIPE_STORE_PATH": os.path.join(directory, "recipes.sqlite3"),
+        "PLAN_ARCHIVE_PATH": os.path.join(directory, "plans.sqlite3"),
+    })
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    # プロンプトの種類ごとに記録した応答を返す Gemini の代わり。プロンプトのトークン数を記録する
+    def __init__(self, category_text, meal_plan_text, chunk_size=40):
+        self.category_text = category_text
+        self.meal_plan_text = meal_plan_text
+        self.chunk_size = chunk_size
+        self.prompt_tokens = []
+
+    def generate_content(self, prompt, stream=False, generation_config=None):
+        from recipe_pool import estimate_tokens
+
+        self.prompt_tokens.append(estimate_tokens(prompt))
+        text = self.category_text if "カテゴリID" in prompt else self.meal_plan_text
+        if stream:
+            return [FakeResponse(text[i:i + self.chunk_size]) for i in range(0, len(text), self.chunk_size)]
+        return FakeResponse(text)
+
+
+class FakeRakutenClient:
+    # カテゴリIDごとに記録したランキングを返す楽天クライアントの代わり
+    def __init__(self, rankings, latency=0.0):
+        self.rankings = rankings
+        self.latency = latency
+
+    def ranking(self, category_id, hits=10):
+        if self.latency:
+            time.sleep(self.latency)
+        return self.rankings.get(category_id.strip(), [])[:hits]
+
+    def category_stats(self, category_id):
+        return {}
+
+    def stats(self):
+        return {}
+
+
+def synthetic_fixtures(categories, category_count=20, hits=10, seed=0):
+    # 記録がないときに使う、再現できる合成データ
+    rng = random.Random(seed)
+    category_ids = [category_id for category_id in categories.ids if "-" in category_id][:category_count]
+    rankings = {}
+    for category_id in category_ids:
+        name = categories.name(category_id)
+        rankings[category_id] = [
+            {
+                "recipeTitle": f"{name}の{rng.choice(DISHES)}{i + 1}",
+                "recipeUrl": f"https://recipe.rakuten.co.jp/recipe/{category_id}-{i}/",
+                "recipeMaterial": rng.sample(INGREDIENTS, rng.randint(3, 12)),
+            }
+            for i in range(hits)
+        ]
+    return ",".join(category_ids), rankings
+
+
+def synthetic_meal_plan_text(recipe_count, days=7, seed=0):
+    # select_recipes と同じ形式の献立テキスト
+    from meal_plan import plan_dates
+
+    rng = random.Random(seed)
+    weekdays = ["月", "火", "水", "木", "金", "土", "日"]
+    numbers = rng.sample(range(1, recipe_count + 1), min(recipe_count, days * len(MEAL_TYPES)))
+    lines = []
+    for day, plan_date in enumerate(plan_dates(SAMPLE_START, days)):
+        lines.append(f"**{plan_date} ({weekdays[(SAMPLE_START.weekday() + day) % 7]}):**")
+        for meal, meal_type in enumerate(MEAL_TYPES):
+            lines.append(f"{meal_type}: {numbers[(day * len(MEAL_TYPES) + meal) % len(numbers)]}.レシピ")
+            lines.append("理由: 季節に合い、手軽に作れるため。")
+    return "\n".join(lines)
+
+
+def load_fixtures(directory):
+    with open(os.path.join(directory, "category_ids.txt"), encoding="utf-8") as f:
+        category_text = f.read()
+    with open(os.path.join(directory, "meal_plan.txt"), encoding="utf-8") as f:
+        meal_plan_text = f.read()
+    rankings = {}
+    rakuten_dir = os.path.join(directory, "rakuten")
+    for name in sorted(os.listdir(rakuten_dir)):
+        if name.endswith(".json"):
+            with open(os.path.join(rakuten_dir, name), encoding="utf-8") as f:
+                rankings[name[:-len(".json")]] = json.load(f)
+    return category_text, rankings, meal_plan_text
+
+
+def record_fixtures(directory):
+    # 本物の楽天・Gemini を1回ずつ呼び、応答をそのまま保存する
+    from clients import load_category_data
+    from generation import get_category_ids, fetch_recipe_ranking, select_recipes
+    from recipe_pool import dedupe_recipes
+
+    os.makedirs(os.path.join(directory, "rakuten"), exist_ok=True)
+    category_text = get_category_ids(SAMPLE_REQUEST, load_category_data(), SAMPLE_START, *RATIOS, use_cache=False)
+    with open(os.path.join(directory, "category_ids.txt"), "w", encoding="utf-8") as f:
+        f.write(category_text)
+    recipes = []
+    for category_id in category_text.split(","):
+        ranking = fetch_recipe_ranking(category_id)
+        recipes.extend(ranking)
+        with open(os.path.join(directory, "rakuten", f"{category_id}.json"), "w", encoding="utf-8") as f:
+            json.dump(ranking, f, ensure_ascii=False)
+    text = select_recipes(dedupe_recipes(recipes), SAMPLE_REQUEST, SAMPLE_START, MEAL_TYPES, *RATIOS)
+    with open(os.path.join(directory, "meal_plan.txt"), "w", encoding="utf-8") as f:
+        f.write(text)
+    print(f"{directory} に記録しました（{len(recipes)} 件のレシピ）")
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(name, run, model, iterations):
+    # 時間は tracemalloc なしで計測し、メモリは別に1回だけ計測する
+    times = []
+    model.prompt_tokens.clear()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    tokens = model.prompt_tokens[:]
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "stage": name,
+        "iterations": iterations,
+        "p50_ms": round(percentile(times, 0.5) * 1000, 3),
+        "p95_ms": round(percentile(times, 0.95) * 1000, 3),
+        "peak_kib": round(peak / 1024, 1),
+        "prompt_tokens": sum(tokens) // iterations,
+    }
+
+
+def run_benchmark(fixtures=None, category_count=20, hits=10, plan_count=300, iterations=20, latency=0.0):
+    import clients
+    from generation import get_category_ids, get_recipes, select_recipes
+    from meal_plan import parse_meal_plan, plan_dates
+    from planner import solve_meal_plan
+    from recipe_pool import dedupe_recipes
+    from export import generate_html, generate_archive_html
+
+    categories = clients.load_category_data()
+    if fixtures:
+        category_text, rankings, meal_plan_text = load_fixtures(fixtures)
+    else:
+        category_text, rankings = synthetic_fixtures(categories, category_count, hits)
+        meal_plan_text = synthetic_meal_plan_text(category_count * hits)
+    model = FakeModel(category_text, meal_plan_text)
+    clients._instances["model"] = model
+    clients._instances["rakuten_client"] = FakeRakutenClient(rankings, latency)
+
+    category_ids = get_category_ids(SAMPLE_REQUEST, categories, SAMPLE_START, *RATIOS, use_cache=False)
+    recipes = dedupe_recipes(get_recipes(category_ids)[0])
+    meal_plan_text = select_recipes(recipes, SAMPLE_REQUEST, SAMPLE_START, MEAL_TYPES, *RATIOS)
+    meal_plan, materials_summary = parse_meal_plan(meal_plan_text, MEAL_TYPES)
+    html_path = os.path.join(tempfile.gettempdir(), "benchmark_meal_plan.html")
+    archive_path = os.path.join(tempfile.gettempdir(), "benchmark_archive.html")
+    saved_plans = [(f"plan_{i}", meal_plan, materials_summary) for i in range(plan_count)]
+
+    stages = [
+        ("get_category_ids", lambda: get_category_ids(SAMPLE_REQUEST, categories, SAMPLE_START, *RATIOS, use_cache=False)),
+        ("get_recipes", lambda: get_recipes(category_ids)),
+        ("select_recipes", lambda: select_recipes(recipes, SAMPLE_REQUEST, SAMPLE_START, MEAL_TYPES, *RATIOS)),
+        ("parse_meal_plan", lambda: parse_meal_plan(meal_plan_text, MEAL_TYPES)),
+        ("solve_meal_plan", lambda: solve_meal_plan(recipes, MEAL_TYPES, plan_dates(SAMPLE_START), *RATIOS)),
+        ("generate_html", lambda: generate_html(meal_plan, materials_summary, html_path)),
+        (f"generate_archive_html[{plan_count}]", lambda: generate_archive_html(iter(saved_plans), archive_path)),
+    ]
+    results = [measure(name, run, model, iterations) for name, run in stages]
+    return {
+        "sizes": {"categories": len(category_ids.split(",")), "recipes": len(recipes), "plans": plan_count},
+        "stages": results,
+    }
+
+
+def compare(results, baseline, tolerance):
+    # 前回の結果より p50 が tolerance の割合を超えて遅くなった段階を返す
+    previous = {stage["stage"]: stage for stage in baseline["stages"]}
+    regressions = []
+    for stage in results["stages"]:
+        before = previous.get(stage["stage"])
+        if before and before["p50_ms"] > 0 and stage["p50_ms"] > before["p50_ms"] * (1 + tolerance):
+            regressions.append((stage["stage"], before["p50_ms"], stage["p50_ms"]))
+    return regressions
+
+
+def print_table(results):
+    print(f"規模: {results['sizes']}")
+    print(f"{'段階':<32}{'p50(ms)':>10}{'p95(ms)':>10}{'peak(KiB)':>12}{'tokens':>8}")
+    for stage in results["stages"]:
+        print(f"{stage['stage']:<32}{stage['p50_ms']:>10}{stage['p95_ms']:>10}{stage['peak_kib']:>12}{stage['prompt_tokens']:>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="献立作成パイプラインのベンチマーク")
+    parser.add_argument("--fixtures", help="記録した応答のディレクトリ（省略時は合成データ）")
+    parser.add_argument("--record", help="本物のAPIを呼んで応答をこのディレクトリに記録する")
+    parser.add_argument("--categories", type=int, default=20, help="合成データのカテゴリ数")
+    parser.add_argument("--hits", type=int, default=10, help="合成データの1カテゴリあたりのレシピ数")
+    parser.add_argument("--plans", type=int, default=300, help="アーカイブに書き出す献立の数")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0, help="楽天の偽物が1回ごとに待つ秒数")
+    parser.add_argument("--json", help="結果をJSONで保存する")
+    parser.add_argument("--baseline", help="比較する前回の結果（JSON）")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="この割合を超えて遅くなったら失敗にする")
+    args = parser.parse_args(argv)
+
+    if args.record:
+        record_fixtures(args.record)
+        return 0
+
+    with tempfile.TemporaryDirectory() as directory:
+        _use_temp_storage(directory)
+        results = run_benchmark(args.fixtures, args.categories, args.hits, args.plans, args.iterations, args.latency)
+    print_table(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for stage, before, after in regressions:
+            print(f"遅くなりました: {stage} {before}ms → {after}ms", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
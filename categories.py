@@ -0,0 +1,137 @@
+import csv
+import os
+import re
+
+CATEGORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "categories.tsv")
+CATEGORY_URL = "https://recipe.rakuten.co.jp/category/{}/"
+CATEGORY_ID_PATTERN = re.compile(r"\d+(?:-\d+)*")
+CATEGORY_ID_SPLIT = re.compile(r"[^\d-]+")
+
+
+def parent_id(category_id):
+    # "10-275" → "10", "25-701-1997" → "25-701", "10" → None
+    if "-" not in category_id:
+        return None
+    return category_id.rsplit("-", 1)[0]
+
+
+class CategoryIndex:
+    # 楽天レシピのカテゴリ表を、ID→名前・親・子の索引として保持する
+    # URLはIDから組み立てられるので、形式が異なるものだけを個別に保存する
+    __slots__ = ("ids", "names", "parents", "children", "roots", "_urls", "_tsv")
+
+    def __init__(self, rows):
+        ids = []
+        names = {}
+        urls = {}
+        for category_id, name, url in rows:
+            ids.append(category_id)
+            names[category_id] = name
+            if url != CATEGORY_URL.format(category_id):
+                urls[category_id] = url
+
+        parents = {}
+        children = {}
+        roots = []
+        for category_id in ids:
+            parent = parent_id(category_id)
+            if parent not in names:
+                parent = None
+            parents[category_id] = parent
+            if parent is None:
+                roots.append(category_id)
+            else:
+                children.setdefault(parent, []).append(category_id)
+
+        self.ids = tuple(ids)
+        self.names = names
+        self.parents = parents
+        self.children = {k: tuple(v) for k, v in children.items()}
+        self.roots = tuple(roots)
+        self._urls = urls
+        self._tsv = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, category_id):
+        return category_id in self.names
+
+    def name(self, category_id):
+        return self.names.get(category_id)
+
+    def url(self, category_id):
+        if category_id not in self.names:
+            return None
+        return self._urls.get(category_id) or CATEGORY_URL.format(category_id)
+
+    def parent(self, category_id):
+        return self.parents.get(category_id)
+
+    def get(self, category_id):
+        if category_id not in self.names:
+            return None
+        return {
+            "id": category_id,
+            "name": self.names[category_id],
+            "url": self.url(category_id),
+            "parent": self.parents[category_id],
+        }
+
+    def descendants(self, category_id):
+        # 子孫カテゴリを表の順番で返す（自分自身は含まない）
+        result = []
+        stack = list(reversed(self.children.get(category_id, ())))
+        while stack:
+            child = stack.pop()
+            result.append(child)
+            stack.extend(reversed(self.children.get(child, ())))
+        return result
+
+    def as_tsv(self):
+        # 元の埋め込み表と同じ形式の文字列（初回のみ組み立てる）
+        if self._tsv is None:
+            lines = ["category_full_id\tcategory_name\tcategory_url"]
+            lines.extend(f"{i}\t{self.names[i]}\t{self.url(i)}" for i in self.ids)
+            self._tsv = "\n".join(lines)
+        return self._tsv
+
+
+def load_category_index(file_path=CATEGORY_FILE):
+    with open(file_path, "r", encoding="utf-8") as f:
+        reader = csv.reader(f, delimiter="\t")
+        next(reader, None)  # ヘッダー行
+        rows = [row for row in reader if len(row) >= 3]
+    return CategoryIndex(rows)
+
+
+def format_for_prompt(index, category_ids):
+    # モデルに渡すカテゴリ一覧（URLは含めない）
+    return "\n".join(f"{category_id}\t{index.names[category_id]}" for category_id in category_ids)
+
+
+def extract_category_ids(text, index, limit=20):
+    # モデルの出力からカテゴリ表に存在するIDだけを順番通りに取り出す
+    ids = []
+    for category_id in CATEGORY_ID_PATTERN.findall(text):
+        if category_id in index and category_id not in ids:
+            ids.append(category_id)
+    return ids[:limit]
+
+
+def stream_extract_category_ids(chunks, index, limit=20):
+    # ストリーミング出力から、区切り文字まで書き終わったIDを順に返す
+    # 最後のIDは出力が終わった時点で確定させる
+    buffer = ""
+    seen = []
+    for chunk in chunks:
+        buffer += chunk
+        *complete, buffer = CATEGORY_ID_SPLIT.split(buffer)
+        for category_id in extract_category_ids(" ".join(complete), index, limit):
+            if category_id not in seen and len(seen) < limit:
+                seen.append(category_id)
+                yield category_id
+    for category_id in extract_category_ids(buffer, index, limit):
+        if category_id not in seen and len(seen) < limit:
+            seen.append(category_id)
+            yield category_id
@@ -0,0 +1,155 @@
+import math
+import re
+from collections import Counter
+
+# 献立には使わない大カテゴリ（サラダ・お菓子・調味料・飲みもの・調理器具）
+EXCLUDED_ROOTS = ("18", "19", "21", "27", "40")
+
+# 主食の大カテゴリ（ごはんもの・パン・麺類）
+STAPLE_ROOTS = {
+    "rice": ("14",),
+    "bread": ("22",),
+    "noodle": ("15", "16"),
+}
+
+# 月ごとの季節カテゴリと行事カテゴリ
+SEASON_ROOTS = {
+    1: ("55", "49"), 2: ("55",), 3: ("52", "51"), 4: ("52",), 5: ("52",), 6: ("53",),
+    7: ("53",), 8: ("53",), 9: ("54",), 10: ("54",), 11: ("54",), 12: ("55", "50"),
+}
+
+# 名前からお菓子・デザートとわかるカテゴリ（行事・季節の大カテゴリの配下に多い）も除く
+SWEETS_PATTERN = re.compile(r"お菓子|菓子パン|ケーキ|チョコ|クッキー|デザート|スイーツ|バレンタイン|ホワイトデー|アイス(?!バイン)")
+
+SEASON_BOOST = 0.15
+STAPLE_BOOST = 0.3
+
+_SPLIT_PATTERN = re.compile(r"[\s、。,，・/（）()「」]+")
+
+# 要望の言い回しで、カテゴリ名の照合には意味のない語
+QUERY_STOPWORDS = ("を使った", "を使う", "使った", "使う", "中心", "多め", "多く", "メイン", "が喜ぶ", "喜ぶ",
+                   "な料理", "にしたい", "したい", "がいい")
+# カテゴリ名に出てこない言い方を、カテゴリ名で使われる言い方に足す
+QUERY_SYNONYMS = {"和食": "和風", "洋食": "洋風", "子供": "子ども こども", "ヘルシー": "低カロリー"}
+
+
+def expand_query(text):
+    for word in QUERY_STOPWORDS:
+        text = text.replace(word, " ")
+    for word, synonyms in QUERY_SYNONYMS.items():
+        if word in text:
+            text += " " + synonyms
+    return text
+
+
+def char_ngrams(text, sizes=(2, 3)):
+    # 日本語は分かち書きしないので、文字 n-gram で表す
+    # 1文字は "イン" のように無関係な語どうしを結びつけてしまうので使わない（1文字だけの語はそのまま入れる）
+    grams = []
+    for chunk in _SPLIT_PATTERN.split(text):
+        if 0 < len(chunk) < min(sizes):
+            grams.append(chunk)
+        for n in sizes:
+            grams.extend(chunk[i:i + n] for i in range(len(chunk) - n + 1))
+    return grams
+
+
+class CategoryRanker:
+    # カテゴリ名（と親カテゴリ名）に対する文字 n-gram の TF-IDF 索引
+    # 通信なしで要望・季節・主食の比重からカテゴリを順位付けする
+    def __init__(self, index):
+        self.index = index
+        self.ids = [i for i in index.ids if self._root(i) not in EXCLUDED_ROOTS and not self._is_sweets(i)]
+
+        documents = []
+        for category_id in self.ids:
+            path = []
+            parent = index.parent(category_id)
+            while parent is not None:
+                path.append(index.name(parent))
+                parent = index.parent(parent)
+            # 自分の名前を親より重く扱う
+            name = index.name(category_id)
+            documents.append(Counter(char_ngrams(" ".join([name, name] + path))))
+
+        doc_freq = Counter()
+        for grams in documents:
+            doc_freq.update(grams.keys())
+        total = len(documents)
+        self.idf = {gram: math.log((1 + total) / (1 + df)) + 1 for gram, df in doc_freq.items()}
+
+        # gram → [(文書番号, 正規化済みの重み)] の転置索引
+        self.postings = {}
+        for doc, grams in enumerate(documents):
+            weights = {gram: count * self.idf[gram] for gram, count in grams.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for gram, weight in weights.items():
+                self.postings.setdefault(gram, []).append((doc, weight / norm))
+
+        self._roots = [self._root(i) for i in self.ids]
+
+    def _is_sweets(self, category_id):
+        # 自分か親の名前がお菓子のカテゴリ（"バレンタイン" の配下など）
+        while category_id is not None:
+            if SWEETS_PATTERN.search(self.index.name(category_id)):
+                return True
+            category_id = self.index.parent(category_id)
+        return False
+
+    def _root(self, category_id):
+        return category_id.split("-", 1)[0]
+
+    def text_scores(self, query):
+        grams = Counter(g for g in char_ngrams(expand_query(query)) if g in self.idf)
+        weights = {gram: count * self.idf[gram] for gram, count in grams.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        scores = {}
+        for gram, weight in weights.items():
+            for doc, doc_weight in self.postings[gram]:
+                scores[doc] = scores.get(doc, 0.0) + weight / norm * doc_weight
+        return scores
+
+    def rank(self, user_request, start_date, rice_ratio, bread_ratio, noodle_ratio, top_k=150, per_root=None):
+        # [(カテゴリID, スコア, 要望との一致度)] をスコアの高い順に返す
+        text = self.text_scores(user_request)
+        boosts = {}
+        for root in SEASON_ROOTS.get(start_date.month, ()):
+            boosts[root] = boosts.get(root, 0.0) + SEASON_BOOST
+        total_ratio = (rice_ratio + bread_ratio + noodle_ratio) or 1
+        for key, ratio in (("rice", rice_ratio), ("bread", bread_ratio), ("noodle", noodle_ratio)):
+            for root in STAPLE_ROOTS[key]:
+                boosts[root] = boosts.get(root, 0.0) + STAPLE_BOOST * ratio / total_ratio
+
+        scored = []
+        for doc, category_id in enumerate(self.ids):
+            match = text.get(doc, 0.0)
+            score = match + boosts.get(self._roots[doc], 0.0)
+            if score > 0:
+                scored.append((category_id, score, match))
+        scored.sort(key=lambda item: -item[1])
+
+        # 1つの大カテゴリに偏らないよう、大カテゴリごとの件数に上限を設ける
+        # 同じ名前のカテゴリ（例: 12-98 と 12-98-1 のキャベツ）は1つだけ残す
+        per_root = per_root or max(3, top_k // 4)
+        counts = Counter()
+        names = set()
+        ranked = []
+        for item in scored:
+            root = self._root(item[0])
+            name = self.index.name(item[0])
+            if counts[root] >= per_root or name in names:
+                continue
+            counts[root] += 1
+            names.add(name)
+            ranked.append(item)
+            if len(ranked) >= top_k:
+                break
+        return ranked
+
+
+def is_confident(ranked, count=20, min_match=0.2, min_strong=3):
+    # count 個そろい、そのうち要望との一致度が min_match 以上のものが min_strong 個以上あれば、LLMを使わずに決めてよい
+    # 短い要望が合うカテゴリは数個なので、残りは季節・主食の比重で選んだもので埋まる
+    if len(ranked) < count:
+        return False
+    return sum(1 for _, _, match in ranked[:count] if match >= min_match) >= min_strong
@@ -0,0 +1,180 @@
+import os
+import threading
+
+import settings
+from categories import CATEGORY_FILE, load_category_index
+from category_search import CategoryRanker
+from jobs import JobQueue
+from llm_cache import ResponseCache
+from materials import MaterialClassifier
+from plan_archive import PlanArchive
+from plan_cache import PlanCache
+from rakuten import RateLimiter, RakutenClient
+from recipe_cache import RankingCache
+from recipe_refs import RecipeRefs
+from recipe_store import RecipeStore
+from tracing import METRICS, TracedModel, start_metrics_server
+
+# プロセス全体で共有するクライアント類。最初に使われたときに1度だけ作る
+# Gemini SDK・requests・Streamlit はここで必要になるまで import しない
+_instances = {}
+_lock = threading.RLock()
+
+
+def _singleton(name, factory):
+    instance = _instances.get(name)
+    if instance is None:
+        with _lock:
+            instance = _instances.get(name)
+            if instance is None:
+                instance = factory()
+                _instances[name] = instance
+    return instance
+
+
+def get_secret(name):
+    # 環境変数（.env を含む）を優先し、なければ Streamlit の secrets から読む
+    value = os.getenv(name)
+    if value:
+        return value
+    import streamlit as st
+    return st.secrets[name]
+
+
+class LimitedModel:
+    # 同時に実行する generate_content の数を制限する（複数の献立をまとめて作るときなど）
+    def __init__(self, model, max_concurrency):
+        self._model = model
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+
+    def generate_content(self, prompt, stream=False, **kwargs):
+        if stream:
+            return self._limited_stream(prompt, kwargs)
+        with self._semaphore:
+            return self._model.generate_content(prompt, **kwargs)
+
+    def _limited_stream(self, prompt, kwargs):
+        # 読み始めたときに枠を取り、読み終わる（または途中でやめる）まで持つ
+        with self._semaphore:
+            yield from self._model.generate_content(prompt, stream=True, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._model, name)
+
+
+def get_model():
+    def create():
+        import google.generativeai as genai
+        genai.configure(api_key=get_secret("GEMINI_API_KEY"))
+        # 呼び出しごとの時間とトークン数を記録する
+        model = TracedModel(genai.GenerativeModel(
+            model_name=settings.MODEL_NAME,
+            generation_config=settings.generation_config,
+        ))
+        if settings.GEMINI_MAX_CONCURRENCY > 0:
+            model = LimitedModel(model, settings.GEMINI_MAX_CONCURRENCY)
+        return model
+    return _singleton("model", create)
+
+
+def get_rakuten_limiter():
+    return _singleton("rakuten_limiter", lambda: RateLimiter(settings.RAKUTEN_QPS, settings.RAKUTEN_BURST))
+
+
+def get_rakuten_client():
+    return _singleton("rakuten_client", lambda: RakutenClient(
+        get_secret("RAKUTEN_APP_ID"),
+        limiter=get_rakuten_limiter(),
+        max_retries=settings.RAKUTEN_MAX_RETRIES,
+        max_retry_wait=settings.RAKUTEN_MAX_RETRY_WAIT,
+        pool_size=settings.RAKUTEN_MAX_WORKERS,
+    ))
+
+
+def get_ranking_cache():
+    def create():
+        cache = RankingCache(
+            settings.RAKUTEN_CACHE_PATH,
+            ttl=settings.RAKUTEN_CACHE_TTL,
+            max_stale=settings.RAKUTEN_CACHE_MAX_STALE,
+            offline=settings.RAKUTEN_OFFLINE,
+        )
+        METRICS.register(lambda: _stats_gauges("ranking_cache", cache.stats()))
+        return cache
+    return _singleton("ranking_cache", create)
+
+
+def get_recipe_store():
+    return _singleton("recipe_store", lambda: RecipeStore(settings.RECIPE_STORE_PATH))
+
+
+def get_llm_cache():
+    def create():
+        cache = ResponseCache(
+            settings.LLM_CACHE_PATH,
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+            max_bytes=settings.LLM_CACHE_MAX_BYTES,
+        )
+        METRICS.register(lambda: _stats_gauges("llm_cache", cache.stats()))
+        return cache
+    return _singleton("llm_cache", create)
+
+
+def get_job_queue():
+    def create():
+        queue = JobQueue(
+            settings.JOB_DB_PATH,
+            max_workers=settings.JOB_MAX_WORKERS,
+            retention=settings.JOB_RETENTION,
+            heartbeat=settings.JOB_HEARTBEAT,
+        )
+        METRICS.register(lambda: _stats_gauges("jobs", queue.stats()))
+        return queue
+    return _singleton("job_queue", create)
+
+
+def get_plan_cache():
+    def create():
+        cache = PlanCache(
+            settings.PLAN_CACHE_PATH,
+            max_entries=settings.PLAN_CACHE_MAX_ENTRIES,
+            max_bytes=settings.PLAN_CACHE_MAX_BYTES,
+            ttl=settings.PLAN_CACHE_TTL,
+            lease=settings.PLAN_CACHE_LEASE,
+        )
+        METRICS.register(lambda: _stats_gauges("plan_cache", cache.stats()))
+        return cache
+    return _singleton("plan_cache", create)
+
+
+def start_metrics():
+    # METRICS_PORT が設定されていれば、プロセスで1度だけ /metrics を公開する
+    if settings.METRICS_PORT > 0:
+        _singleton("metrics_server", lambda: start_metrics_server(settings.METRICS_PORT))
+
+
+def _stats_gauges(prefix, stats):
+    # stats() の数値だけを "prefix_名前" のゲージにする
+    return [(f"{prefix}_{name}", {}, value) for name, value in stats.items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)]
+
+
+def get_plan_archive():
+    return _singleton("plan_archive", lambda: PlanArchive(settings.PLAN_ARCHIVE_PATH))
+
+
+def get_recipe_refs():
+    return _singleton("recipe_refs", RecipeRefs)
+
+
+def load_category_data(file_path=CATEGORY_FILE):
+    # カテゴリ表はプロセスごとに1度だけ読み込み、全セッションで共有する
+    return _singleton(("categories", file_path), lambda: load_category_index(file_path))
+
+
+def get_category_ranker():
+    return _singleton("category_ranker", lambda: CategoryRanker(load_category_data()))
+
+
+def get_material_classifier():
+    return _singleton("material_classifier", lambda: MaterialClassifier(load_category_data()))
@@ -0,0 +1 @@
+# tests/ からこのディレクトリのモジュールを import できるように、pytest にここを sys.path へ入れさせる
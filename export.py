@@ -0,0 +1,194 @@
+import argparse
+import html
+import io
+import json
+import os
+import sys
+import zipfile
+from string import Template
+
+
+def save_meal_plan(meal_plan, materials_summary, save_path):
+    data = {
+        "meal_plan": meal_plan,
+        "materials_summary": materials_summary
+    }
+    with open(save_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def load_meal_plan(file):
+    content = file.getvalue().decode("utf-8")
+    data = json.loads(content)
+    return data["meal_plan"], data["materials_summary"]
+
+
+def read_meal_plan(path):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data["meal_plan"], data["materials_summary"]
+
+
+# HTMLの部品はモジュールの読み込み時に1度だけ組み立てる。差し込む値はすべて escape してから渡す
+PAGE_HEAD = Template("""<!DOCTYPE html>
+<html lang="ja">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$title</title>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; padding: 20px; }
+        h1, h2, h3 { color: #333; }
+        .meal { margin-bottom: 20px; }
+        .materials { background-color: #f4f4f4; padding: 10px; margin-top: 20px; }
+        .plan { border-top: 2px solid #ccc; margin-top: 40px; }
+    </style>
+</head>
+<body>
+    <h1>$title</h1>
+""")
+PLAN_HEAD = Template("""<section class="plan" id="$anchor">
+    <h1>$title</h1>
+""")
+PLAN_TAIL = "</section>\n"
+DAY = Template("<h2>$date</h2>\n")
+MEAL = Template("""<div class="meal">
+    <h3>$meal_type: $recipe</h3>
+    <p><strong>理由:</strong> $reason</p>
+    <p><strong>材料:</strong> $materials</p>
+    <p><a href="$url" target="_blank" rel="noopener">レシピを見る</a></p>
+</div>
+""")
+MATERIALS_HEAD = "<h2>1週間分の材料まとめ</h2>\n<div class='materials'>\n"
+MATERIALS_SECTION = Template("<h3>$text</h3>\n")
+MATERIALS_LINE = Template("<p>$text</p>\n")
+MATERIALS_TAIL = "</div>\n"
+INDEX_HEAD = "<h2>目次</h2>\n<ul>\n"
+INDEX_ITEM = Template('<li><a href="#$anchor">$title</a></li>\n')
+INDEX_TAIL = "</ul>\n"
+PAGE_TAIL = "</body>\n</html>\n"
+
+
+def _escape(value):
+    return html.escape(str(value or ""), quote=True)
+
+
+def _safe_url(url):
+    # http(s) 以外（javascript: など）はリンクにしない
+    url = str(url or "").strip()
+    return _escape(url) if url.startswith(("http://", "https://")) else "#"
+
+
+def render_plan(meal_plan, materials_summary, write):
+    # 1つの献立を、部品ごとに write() へ書き出す
+    for date, meals in meal_plan.items():
+        write(DAY.substitute(date=_escape(date)))
+        for meal_type, details in meals.items():
+            write(MEAL.substitute(
+                meal_type=_escape(meal_type),
+                recipe=_escape(details.get("recipe")),
+                reason=_escape(details.get("reason")),
+                materials=_escape(details.get("materials")),
+                url=_safe_url(details.get("url")),
+            ))
+
+    write(MATERIALS_HEAD)
+    for line in materials_summary or []:
+        # "**肉・魚:**" のような区分の見出しは h3 にする
+        if line.startswith("**") and line.endswith("**"):
+            write(MATERIALS_SECTION.substitute(text=_escape(line.strip("*"))))
+        else:
+            write(MATERIALS_LINE.substitute(text=_escape(line)))
+    write(MATERIALS_TAIL)
+
+
+def generate_html(meal_plan, materials_summary, html_path, title="1週間分の献立"):
+    # 組み立てながらファイルに書き出す（文書全体をメモリに持たない）
+    with open(html_path, "w", encoding="utf-8") as f:
+        write_html(meal_plan, materials_summary, f.write, title)
+
+
+def write_html(meal_plan, materials_summary, write, title="1週間分の献立"):
+    write(PAGE_HEAD.substitute(title=_escape(title)))
+    render_plan(meal_plan, materials_summary, write)
+    write(PAGE_TAIL)
+
+
+def generate_archive_html(plans, html_path, title="献立のアーカイブ"):
+    # plans は (名前, 献立, 材料まとめ) を順に返すもの。1つずつ読んで書き出すので、何百件あっても1回で済む
+    # 目次は最後に付ける
+    index = []
+    with open(html_path, "w", encoding="utf-8") as f:
+        f.write(PAGE_HEAD.substitute(title=_escape(title)))
+        for number, (name, meal_plan, materials_summary) in enumerate(plans, 1):
+            anchor = f"plan-{number}"
+            index.append((anchor, name))
+            f.write(PLAN_HEAD.substitute(anchor=anchor, title=_escape(name)))
+            render_plan(meal_plan, materials_summary, f.write)
+            f.write(PLAN_TAIL)
+        f.write(INDEX_HEAD)
+        for anchor, name in index:
+            f.write(INDEX_ITEM.substitute(anchor=anchor, title=_escape(name)))
+        f.write(INDEX_TAIL)
+        f.write(PAGE_TAIL)
+    return len(index)
+
+
+def generate_archive_zip(plans, zip_path):
+    # 献立ごとに HTML と JSON を1つのZIPに入れる。各ファイルはZIPの中へ直接書き出す
+    count = 0
+    used_names = set()
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, meal_plan, materials_summary in plans:
+            base = _archive_name(name, used_names)
+            with archive.open(f"{base}.html", "w") as raw, io.TextIOWrapper(raw, encoding="utf-8") as f:
+                write_html(meal_plan, materials_summary, f.write, name)
+            with archive.open(f"{base}.json", "w") as raw, io.TextIOWrapper(raw, encoding="utf-8") as f:
+                json.dump({"meal_plan": meal_plan, "materials_summary": materials_summary}, f, ensure_ascii=False, indent=2)
+            count += 1
+    return count
+
+
+def _archive_name(name, used_names):
+    base = "".join(c if c.isalnum() or c in "-_." else "_" for c in os.path.splitext(os.path.basename(name))[0]) or "meal_plan"
+    candidate = base
+    suffix = 2
+    while candidate in used_names:
+        candidate = f"{base}_{suffix}"
+        suffix += 1
+    used_names.add(candidate)
+    return candidate
+
+
+def iter_saved_plans(paths):
+    # 保存したJSONファイルを1つずつ読み込む（読めないファイルは飛ばす）
+    for path in paths:
+        try:
+            meal_plan, materials_summary = read_meal_plan(path)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"{path}: {e}", file=sys.stderr)
+            continue
+        yield os.path.basename(path), meal_plan, materials_summary
+
+
+def main(argv=None):
+    # 保存した献立をまとめて書き出す
+    #   python export.py --html archive.html 保存/*.json
+    #   python export.py --zip archive.zip 保存/*.json
+    parser = argparse.ArgumentParser(description="保存した献立をまとめてHTMLまたはZIPに書き出す")
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument("--html", help="1つのHTMLページに書き出す")
+    output.add_argument("--zip", help="献立ごとのHTMLとJSONをZIPに書き出す")
+    parser.add_argument("paths", nargs="+", help="保存した献立のJSONファイル")
+    args = parser.parse_args(argv)
+
+    if args.html:
+        count = generate_archive_html(iter_saved_plans(args.paths), args.html)
+    else:
+        count = generate_archive_zip(iter_saved_plans(args.paths), args.zip)
+    print(f"{count} 件の献立を書き出しました")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
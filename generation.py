@@ -0,0 +1,567 @@
+# 献立作成パイプラインの各段階（Streamlit に依存しない）
+# Gemini のモデルや楽天のクライアントは clients から必要になったときに取得する
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from settings import (
+    MODEL_NAME, RAKUTEN_MAX_WORKERS, CATEGORY_SELECTION_MODE, TOP_CATEGORY_COUNT, CATEGORY_PREFILTER_TOP_K,
+    CATEGORY_CONFIDENT_MATCH, CATEGORY_CONFIDENT_COUNT, RECIPE_PROMPT_TOKEN_BUDGET, MEAL_PLAN_STREAMING, MEAL_PLAN_FORMAT,
+    JSON_SECTION_RETRIES, DAYS_PER_CALL, PARALLEL_MAX_WORKERS, MATERIALS_SUMMARY, LLM_CACHE_BYPASS, RECIPE_SOURCE,
+    PLANNER_REASONS,
+)
+from clients import (
+    get_model, get_rakuten_client, get_ranking_cache, get_llm_cache, get_recipe_store,
+    get_category_ranker, get_material_classifier,
+)
+from rakuten import fetch_ranking, fetch_rankings, parse_category_ids
+from categories import format_for_prompt, extract_category_ids, stream_extract_category_ids
+from category_search import is_confident
+from recipe_pool import format_recipe_list, attach_recipe_details, find_recipe, find_recipe_no
+from materials import aggregate_materials
+from meal_plan import (
+    MealPlanParser, parse_meal_plan, plan_dates, meal_plan_schema, validate_meal_plan_json,
+    merge_day_plans, realign_plan_dates, plan_problem,
+)
+from llm_cache import request_key, fingerprint
+from planner import solve_meal_plan, local_reason
+import tracing
+
+
+def get_category_ids(user_request, categories, start_date, rice_ratio, bread_ratio, noodle_ratio, mode=None, use_cache=True):
+    return ",".join(stream_category_ids(user_request, categories, start_date, rice_ratio, bread_ratio, noodle_ratio, mode, use_cache))
+
+
+def stream_category_ids(user_request, categories, start_date, rice_ratio, bread_ratio, noodle_ratio, mode=None, use_cache=True):
+    # 選ばれたカテゴリIDを、モデルが出力した順に1つずつ返す
+    # 季節・曜日・主食の比重が同じような要求なら、前回選んだカテゴリを再利用する
+    mode = mode or CATEGORY_SELECTION_MODE
+    key = request_key("category_ids", user_request, start_date, [], rice_ratio, bread_ratio, noodle_ratio, mode=mode, model=MODEL_NAME)
+    cache = get_llm_cache()
+    if use_cache and not LLM_CACHE_BYPASS:
+        cached = cache.get(key)
+        if cached is not None:
+            tracing.count(llm_cache_hits=1)
+            yield from parse_category_ids(cached, 20)
+            return
+
+    selected_ids = []
+    for category_id in select_category_ids(user_request, categories, start_date, rice_ratio, bread_ratio, noodle_ratio, mode):
+        selected_ids.append(category_id)
+        yield category_id
+    if selected_ids:
+        cache.put(key, "category_ids", ",".join(selected_ids))
+
+
+def select_category_ids(user_request, categories, start_date, rice_ratio, bread_ratio, noodle_ratio, mode):
+    # 選んだカテゴリIDを1つずつ返すジェネレーター
+    # 日本語の曜日名を取得
+    weekdays = ["月", "火", "水", "木", "金", "土", "日"]
+    start_weekday = weekdays[start_date.weekday()]
+    request_info = f"""
+    ユーザーの要求: {user_request}
+    開始日: {start_date.strftime('%Y-%m-%d')} ({start_weekday})
+    主食の比重: ごはんもの {rice_ratio}%, パン {bread_ratio}%, 麺類 {noodle_ratio}%
+    """
+
+    candidate_ids = categories.ids
+    if mode in ("prefilter", "local"):
+        # 通信なしでカテゴリを順位付けし、上位の候補だけをモデルに渡す
+        ranker = get_category_ranker()
+        if mode == "local":
+            ranked = ranker.rank(user_request, start_date, rice_ratio, bread_ratio, noodle_ratio, top_k=20, per_root=4)
+            if is_confident(ranked, 20, CATEGORY_CONFIDENT_MATCH, CATEGORY_CONFIDENT_COUNT):
+                yield from (category_id for category_id, _, _ in ranked)
+                return
+        ranked = ranker.rank(user_request, start_date, rice_ratio, bread_ratio, noodle_ratio, top_k=CATEGORY_PREFILTER_TOP_K)
+        if ranked:
+            candidate_ids = [category_id for category_id, _, _ in ranked]
+    elif mode == "hierarchical":
+        # 1段階目: 大カテゴリだけを見せて、展開するカテゴリを選ばせる
+        prompt = f"""
+    #以下は料理・食材の大カテゴリとそのカテゴリIDのリストです：
+    {format_for_prompt(categories, categories.roots)}
+    {request_info}
+    #条件
+    この要求と日付、曜日に合う食材・料理を探すのに適した大カテゴリを最大{TOP_CATEGORY_COUNT}個選び、必ずそのカテゴリIDをカンマ区切りで出力してください。
+    日付と曜日から季節や特別なイベント（例：お正月、クリスマス、ハロウィンなど）を考慮してください。
+    また、それ以外は絶対に出力しないでください。
+    出力形式: カテゴリID1,カテゴリID2,カテゴリID3
+    """
+        response = get_model().generate_content(prompt)
+        top_ids = [i for i in extract_category_ids(response.text, categories, TOP_CATEGORY_COUNT) if i in categories.roots]
+        if top_ids:
+            # 2段階目: 選ばれた大カテゴリの配下だけを展開する
+            candidate_ids = []
+            for top_id in top_ids:
+                candidate_ids.append(top_id)
+                candidate_ids.extend(categories.descendants(top_id))
+
+    prompt = f"""
+    #以下は食材とそのカテゴリIDのリストです：
+    {format_for_prompt(categories, candidate_ids)}
+    {request_info}
+    #条件
+    この要求と日付、曜日に合う食材・料理を20個選び、必ずそのカテゴリIDをカンマ区切りで出力してください。
+    日付と曜日から季節や特別なイベント（例：お正月、クリスマス、ハロウィンなど）を考慮し、適切な食材を選んでください。
+    また、それ以外は絶対に出力しないでください。
+    出力形式: カテゴリID1,カテゴリID2,カテゴリID3
+    """
+
+    # ストリーミングで受け取り、IDが1つ書き終わるたびに返す
+    yield from stream_extract_category_ids(iter_stream_text(get_model().generate_content(prompt, stream=True)), categories, 20)
+
+
+def fetch_recipe_ranking(category_id):
+    # 各カテゴリから最大10件のレシピを取得（レート制限と再試行はクライアント側で行う）
+    return get_rakuten_client().ranking(category_id, hits=10)
+
+
+def get_recipe(category_id):
+    import requests
+
+    try:
+        recipes, _ = get_ranking_cache().get_or_fetch(category_id.strip(), fetch_recipe_ranking)
+        return recipes
+    except (requests.exceptions.RequestException, ValueError):
+        return []
+
+
+def get_recipes(category_ids):
+    # カテゴリごとのディスクキャッシュを読み通し、足りない分だけレート制限を守りながら並列に取得する
+    # RECIPE_SOURCE="store" なら、まずローカルのレシピストアから1回の問い合わせでまとめて読む
+    client = get_rakuten_client()
+    category_ids = parse_category_ids(category_ids, 20)
+    stored = get_recipe_store().by_categories(category_ids) if RECIPE_SOURCE == "store" else {}
+    missing = [category_id for category_id in category_ids if category_id not in stored]
+    before = {category_id: client.category_stats(category_id) for category_id in missing}
+    results = fetch_rankings(missing, fetch_recipe_ranking, None, RAKUTEN_MAX_WORKERS, cache=get_ranking_cache())
+    results = {result["category_id"]: result for result in results}
+    all_recipes = []
+    fetch_stats = []
+    for category_id in category_ids:
+        if category_id in stored:
+            all_recipes.extend(tag_category(category_id, stored[category_id]))
+            fetch_stats.append(store_stat(category_id, stored[category_id]))
+            continue
+        result = results[category_id]
+        remember_ranking(result)
+        all_recipes.extend(tag_category(category_id, result["recipes"]))
+        fetch_stats.append(fetch_stat(result, before[category_id]))
+    return all_recipes, fetch_stats
+
+
+def fetch_category(category_id):
+    # 1カテゴリ分をキャッシュ経由で取得し、(レシピ, 取得の記録) を返す
+    if RECIPE_SOURCE == "store":
+        stored = get_recipe_store().by_categories([category_id]).get(category_id)
+        if stored is not None:
+            return tag_category(category_id, stored), store_stat(category_id, stored)
+    before = get_rakuten_client().category_stats(category_id)
+    result = fetch_ranking(category_id, fetch_recipe_ranking, None, cache=get_ranking_cache())
+    remember_ranking(result)
+    return tag_category(category_id, result["recipes"]), fetch_stat(result, before)
+
+
+def tag_category(category_id, recipes):
+    # どのカテゴリのランキングから来たかをレシピに残す（プランナーが主食の判定に使う）
+    return [dict(recipe, categoryId=category_id) for recipe in recipes]
+
+
+def remember_ranking(result):
+    # ストアを使う設定なら、楽天から取得したカテゴリをストアにも入れておく
+    if RECIPE_SOURCE == "store" and not result["error"] and result["recipes"]:
+        get_recipe_store().ingest(result["category_id"], result["recipes"])
+
+
+def store_stat(category_id, recipes):
+    return {
+        "category_id": category_id,
+        "count": len(recipes),
+        "elapsed": 0.0,
+        "waited": 0.0,
+        "retries": 0,
+        "cache": "store",
+        "error": None,
+    }
+
+
+def fetch_stat(result, before):
+    # 今回の取得で増えた待ち時間・再試行回数だけを記録する
+    after = get_rakuten_client().category_stats(result["category_id"])
+    return {
+        "category_id": result["category_id"],
+        "count": len(result["recipes"]),
+        "elapsed": round(result["elapsed"], 3),
+        "waited": round(after.get("waited", 0.0) - before.get("waited", 0.0), 3),
+        "retries": after.get("retries", 0) - before.get("retries", 0),
+        "cache": result["cache"],
+        "error": result["error"],
+    }
+
+
+# 献立作成の共通条件（テキスト出力・JSON出力の両方で使う）
+SELECT_RULES = """
+    - 似た料理は絶対出さないでください。
+    - 前日の残りなどは考慮しないでください。
+    - 朝食は簡単に準備できるものを選んでください。
+    - 夕食は朝昼に比べ手が込んでいるものを選んでください。
+    - 主食そのもの、または主食にあうおかずなどを選択してください。
+    - 絶対にサラダやスイーツ、味噌汁などを選ばないでください。
+    - 開始日から季節や特別なイベント、曜日を考慮し、適切なレシピを選んでください。
+    - レシピNOは必ず上のリストの番号をそのまま使ってください。
+    """
+
+
+# 材料まとめをモデルに作らせる場合だけ加える条件
+MATERIALS_RULES = """
+    - 材料まとめでは、同じ材料を使用する場合はまとめて記載してください。ステップバイステップで、表記の重複がないことを確認してください。
+    - 材料の量は、レシピに記載がない場合は適切な量を推定してください。「適量」という表現は禁止です。
+    """
+
+
+def build_select_prompt(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio):
+    # recipes は dedupe_recipes 済みのもの。URLと材料は後でレシピ番号から埋めるので送らない
+    recipes_info = format_recipe_list(recipes, RECIPE_PROMPT_TOKEN_BUDGET)
+    
+    meal_types_str = ", ".join(meal_types)
+    
+    # 日本語の曜日名を取得
+    weekdays = ["月", "火", "水", "木", "金", "土", "日"]
+    
+    prompt = f"""
+    ユーザーの要求: {user_request}
+    開始日: {start_date.strftime('%Y-%m-%d')} ({weekdays[start_date.weekday()]})
+    食事タイプ: {meal_types_str}
+    主食の比重: ごはんもの {rice_ratio}%, パン {bread_ratio}%, 麺類 {noodle_ratio}%
+    
+    以下は、その要求に基づいて選ばれた食材から作れるレシピのリストです：
+    {recipes_info}
+    
+    これらのレシピから、ユーザーの要求に最も適した1週間分の献立（{meal_types_str}）を作成してください。
+    各食事について、条件をもとに1日ごとにステップバイステップでレシピを選定し、そのレシピ番号と理由を記載してください。
+    主食の比重に従ってレシピを選択してください。
+    開始日から季節や特別なイベント（例：お正月、クリスマス、ハロウィンなど）、さらに曜日も考慮し、適切なレシピを選んでください。
+    """
+    if MATERIALS_SUMMARY == "llm":
+        prompt += """
+    最後に、1週間分の献立で必要な材料の総まとめを作成してください。
+    """
+
+    prompt += """
+    #必ず以下の出力形式に則って出力してください
+    **[日付] ([曜日]):**
+    """
+
+    for meal_type in meal_types:
+        prompt += f"""
+    {meal_type}: [レシピNO].[レシピ名]
+    理由: [選んだ理由]
+    """
+
+    prompt += """
+    ...
+    """
+    if MATERIALS_SUMMARY == "llm":
+        prompt += """
+    1週間分の材料まとめ:
+    
+    **肉・魚:**
+    [材料名]: [必要な量]
+
+    **野菜:**
+    [材料名]: [必要な量]
+
+    **調味料など:**
+    [材料名]: [必要な量]
+    ...
+    """
+
+    prompt += """
+    #条件
+    - 必ず開始日から7日分の献立を出力してください。
+    """ + SELECT_RULES
+    if MATERIALS_SUMMARY == "llm":
+        prompt += MATERIALS_RULES
+    return prompt
+
+
+def select_recipes(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio):
+    prompt = build_select_prompt(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio)
+    response = get_model().generate_content(prompt)
+    return response.text.strip()
+
+
+def build_select_json_prompt(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio, dates, include_materials=True, used_recipes=None):
+    recipes_info = format_recipe_list(recipes, RECIPE_PROMPT_TOKEN_BUDGET)
+    meal_types_str = ", ".join(meal_types)
+    weekdays = ["月", "火", "水", "木", "金", "土", "日"]
+
+    prompt = f"""
+    ユーザーの要求: {user_request}
+    開始日: {start_date.strftime('%Y-%m-%d')} ({weekdays[start_date.weekday()]})
+    食事タイプ: {meal_types_str}
+    主食の比重: ごはんもの {rice_ratio}%, パン {bread_ratio}%, 麺類 {noodle_ratio}%
+
+    以下は、その要求に基づいて選ばれた食材から作れるレシピのリストです：
+    {recipes_info}
+
+    これらのレシピから、ユーザーの要求に最も適した献立（{meal_types_str}）を次の日付について作成し、JSONで出力してください。
+    日付: {", ".join(dates)}
+    days の各要素の date には上の日付をそのまま使い、meals には食事タイプごとに meal_type、recipe_no（レシピNO）、reason（選んだ理由）を入れてください。
+    主食の比重に従ってレシピを選択してください。
+    """
+    if include_materials:
+        prompt += """
+    materials_summary には献立全体で必要な材料を meat_fish（肉・魚）、vegetables（野菜）、seasonings（調味料など）に分け、name と amount で記載してください。
+    """
+    if used_recipes:
+        prompt += f"""
+    次のレシピNOは他の日ですでに使っているので、これらと同じ・似た料理は選ばないでください: {", ".join(str(no) for no in used_recipes)}
+    """
+    prompt += """
+    #条件
+    """ + SELECT_RULES
+    if include_materials:
+        prompt += MATERIALS_RULES
+    return prompt
+
+
+def generate_json(prompt, schema):
+    response = get_model().generate_content(
+        prompt,
+        generation_config={"response_mime_type": "application/json", "response_schema": schema},
+    )
+    return response.text
+
+
+def select_recipes_json(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio):
+    # 構造化出力で献立を作成する。検証に失敗した日付・材料まとめだけを作り直す
+    # (献立, 材料まとめ, 生のJSONテキストのリスト) を返す
+    # 材料まとめをローカルで集計する場合は、日ごとの献立だけを作らせる
+    dates = plan_dates(start_date)
+    include_materials = MATERIALS_SUMMARY == "llm"
+    prompt = build_select_json_prompt(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio, dates, include_materials)
+    raw_texts = [generate_json(prompt, meal_plan_schema(include_materials))]
+    plan, materials_summary, failed = validate_meal_plan_json(raw_texts[0], meal_types, dates, recipes, include_materials)
+
+    for _ in range(JSON_SECTION_RETRIES):
+        failed_dates = [date for date in failed if date != "materials"]
+        if failed_dates:
+            used_recipes = sorted({find_recipe_no(meal["recipe"]) for meals in plan.values() for meal in meals.values()} - {None})
+            prompt = build_select_json_prompt(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio, failed_dates, include_materials=False, used_recipes=used_recipes)
+            raw_texts.append(generate_json(prompt, meal_plan_schema(include_materials=False)))
+            retried_plan, _, _ = validate_meal_plan_json(raw_texts[-1], meal_types, failed_dates, recipes, include_materials=False)
+            plan.update(retried_plan)
+        if "materials" in failed:
+            materials_summary = summarize_materials_json(recipes, plan, raw_texts)
+        failed = [date for date in dates if date not in plan]
+        if include_materials and not materials_summary:
+            failed.append("materials")
+        if not failed:
+            break
+
+    plan = {date: plan[date] for date in dates if date in plan}
+    return plan, materials_summary, raw_texts
+
+
+def summarize_materials_json(recipes, plan, raw_texts):
+    # 材料まとめだけを作り直す
+    chosen = []
+    for meals in plan.values():
+        for meal in meals.values():
+            recipe = find_recipe(meal["recipe"], recipes)
+            if recipe is not None:
+                chosen.append(f"{recipe['recipeTitle']} - 材料: {', '.join(recipe.get('recipeMaterial', []))}")
+    prompt = f"""
+    以下は1週間分の献立で使うレシピと材料です：
+    {chr(10).join(chosen)}
+
+    必要な材料の総まとめを meat_fish（肉・魚）、vegetables（野菜）、seasonings（調味料など）に分け、name と amount でJSONで出力してください。
+    同じ材料はまとめて記載し、量がわからない場合は適切な量を推定してください。「適量」という表現は禁止です。
+    """
+    schema = meal_plan_schema()["properties"]["materials_summary"]
+    raw_texts.append(generate_json(prompt, {"type": "OBJECT", "properties": {"materials_summary": schema}, "required": ["materials_summary"]}))
+    _, materials_summary, _ = validate_meal_plan_json(raw_texts[-1], [], [], recipes)
+    return materials_summary
+
+
+def generate_days_json(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio, dates):
+    # 指定した日付だけの献立を作る（材料まとめは作らない）。失敗した日付だけ作り直す
+    plan = {}
+    raw_texts = []
+    pending = list(dates)
+    for _ in range(1 + JSON_SECTION_RETRIES):
+        prompt = build_select_json_prompt(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio, pending, include_materials=False)
+        raw_texts.append(generate_json(prompt, meal_plan_schema(include_materials=False)))
+        day_plan, _, pending = validate_meal_plan_json(raw_texts[-1], meal_types, pending, recipes, include_materials=False)
+        plan.update(day_plan)
+        if not pending:
+            break
+    return plan, raw_texts
+
+
+def select_recipes_parallel(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio):
+    # 1週間を数日ずつに分けて並列に生成し、最後に似た料理の差し替えと材料まとめを行う
+    dates = plan_dates(start_date)
+    groups = [dates[i:i + DAYS_PER_CALL] for i in range(0, len(dates), DAYS_PER_CALL)]
+    with ThreadPoolExecutor(max_workers=min(PARALLEL_MAX_WORKERS, len(groups))) as executor:
+        results = list(executor.map(
+            tracing.bind(lambda group: generate_days_json(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio, group)),
+            groups,
+        ))
+
+    day_plans = {}
+    raw_texts = []
+    for plan, texts in results:
+        day_plans.update(plan)
+        raw_texts.extend(texts)
+    plan = merge_day_plans(day_plans, dates, meal_types, recipes)
+    materials_summary = summarize_materials_json(recipes, plan, raw_texts) if MATERIALS_SUMMARY == "llm" else []
+    return plan, materials_summary, raw_texts
+
+
+def select_recipes_solver(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio):
+    # レシピの割り当てはローカルのプランナーで行い、モデルには理由だけを書かせる（PLANNER_REASONS="local" なら呼ばない）
+    dates = plan_dates(start_date)
+    assignment = solve_meal_plan(recipes, meal_types, dates, rice_ratio, bread_ratio, noodle_ratio)
+    plan = {
+        date: {
+            meal_type: {
+                "recipe": f"{recipe_no}.{recipes[recipe_no - 1]['recipeTitle']}",
+                "reason": local_reason(meal_type, recipes[recipe_no - 1]),
+                "materials": "",
+                "url": "",
+            }
+            for meal_type, recipe_no in meals.items()
+        }
+        for date, meals in assignment.items()
+    }
+    raw_texts = []
+    if PLANNER_REASONS == "llm":
+        raw_texts.append(write_reasons(plan, user_request, start_date))
+        for (date, meal_type), reason in parse_reasons(raw_texts[-1]).items():
+            if date in plan and meal_type in plan[date] and reason:
+                plan[date][meal_type]["reason"] = reason
+    materials_summary = summarize_materials_json(recipes, plan, raw_texts) if MATERIALS_SUMMARY == "llm" else []
+    return plan, materials_summary, raw_texts
+
+
+def write_reasons(plan, user_request, start_date):
+    weekdays = ["月", "火", "水", "木", "金", "土", "日"]
+    lines = [
+        f"{date} {meal_type}: {meal['recipe']}"
+        for date, meals in plan.items()
+        for meal_type, meal in meals.items()
+    ]
+    prompt = f"""
+    ユーザーの要求: {user_request}
+    開始日: {start_date.strftime('%Y-%m-%d')} ({weekdays[start_date.weekday()]})
+
+    以下の献立はすでに決まっています：
+    {chr(10).join(lines)}
+
+    それぞれの食事について、このレシピを選んだ理由を1文で書き、JSONで出力してください。
+    reasons の各要素には date、meal_type をそのまま使い、reason に理由を入れてください。
+    開始日から季節や特別なイベント、曜日も考慮してください。
+    """
+    return generate_json(prompt, reasons_schema())
+
+
+def reasons_schema():
+    return {
+        "type": "OBJECT",
+        "properties": {
+            "reasons": {
+                "type": "ARRAY",
+                "items": {
+                    "type": "OBJECT",
+                    "properties": {
+                        "date": {"type": "STRING"},
+                        "meal_type": {"type": "STRING"},
+                        "reason": {"type": "STRING"},
+                    },
+                    "required": ["date", "meal_type", "reason"],
+                },
+            },
+        },
+        "required": ["reasons"],
+    }
+
+
+def parse_reasons(text):
+    # {(日付, 食事タイプ): 理由}。壊れたJSONなら空にして、ローカルの理由をそのまま使う
+    try:
+        items = json.loads(text).get("reasons", [])
+    except (ValueError, AttributeError):
+        return {}
+    return {
+        (item.get("date"), item.get("meal_type")): str(item.get("reason", "")).strip()
+        for item in items if isinstance(item, dict)
+    }
+
+
+def generate_meal_plan(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio, use_cache=True, on_progress=None):
+    # 献立を作成し、(献立, 材料まとめ, 生成されたテキスト) を返す
+    # 同じレシピ一覧で似た要求の献立がキャッシュにあれば、日付だけ合わせて再利用する
+    # on_progress(書き終わった日までの献立) はストリーミング時に1日分書き終えるたびに呼ばれる
+    def generate():
+        if MEAL_PLAN_FORMAT == "solver":
+            plan, materials_summary, raw_texts = select_recipes_solver(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio)
+            return {"plan": plan, "materials_summary": materials_summary, "text": "\n".join(raw_texts)}
+        if MEAL_PLAN_FORMAT in ("json", "parallel"):
+            select = select_recipes_parallel if MEAL_PLAN_FORMAT == "parallel" else select_recipes_json
+            plan, materials_summary, raw_texts = select(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio)
+            return {"plan": plan, "materials_summary": materials_summary, "text": "\n".join(raw_texts)}
+        if MEAL_PLAN_STREAMING:
+            parser = MealPlanParser(meal_types)
+            chunks = []
+            for chunk in stream_select_recipes(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio):
+                chunks.append(chunk)
+                if parser.feed(chunk) and on_progress is not None:
+                    on_progress(parser.completed_plan())
+            parser.finish()
+            return {"plan": parser.plan, "materials_summary": parser.materials_summary, "text": "".join(chunks).strip()}
+        text = select_recipes(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio)
+        plan, materials_summary = parse_meal_plan(text, meal_types)
+        return {"plan": plan, "materials_summary": materials_summary, "text": text}
+
+    key = request_key(
+        "meal_plan", user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio,
+        format=MEAL_PLAN_FORMAT, materials=MATERIALS_SUMMARY, model=MODEL_NAME,
+        recipes=fingerprint(recipe.get("recipeUrl") for recipe in recipes),
+    )
+    # 欠けのある献立はキャッシュに残さない（似た要求すべてに同じ失敗を返してしまうため）
+    result, hit = get_llm_cache().get_or_generate(
+        key, "meal_plan", generate, bypass=not use_cache or LLM_CACHE_BYPASS,
+        validate=lambda value: plan_problem(value["plan"], meal_types),
+    )
+    if hit:
+        tracing.count(llm_cache_hits=1)
+    plan = realign_plan_dates(result["plan"], start_date) if hit else result["plan"]
+    return plan, result["materials_summary"], result["text"]
+
+
+def stream_select_recipes(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio):
+    # 生成されたテキストを届いた順に少しずつ返す
+    prompt = build_select_prompt(recipes, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio)
+    yield from iter_stream_text(get_model().generate_content(prompt, stream=True))
+
+
+def iter_stream_text(response):
+    # ストリーミング応答からテキストだけを順に取り出す
+    for chunk in response:
+        try:
+            text = chunk.text
+        except ValueError:
+            # 本文を含まないチャンク（終了理由のみなど）は読み飛ばす
+            continue
+        if text:
+            yield text
+
+
+def finalize_meal_plan(meal_plan, materials_summary, recipes):
+    # レシピ番号からURLと材料を埋め、材料まとめをローカルで集計する場合は作り直す
+    attach_recipe_details(meal_plan, recipes)
+    if MATERIALS_SUMMARY == "local":
+        materials_summary = aggregate_materials(meal_plan, recipes, get_material_classifier())
+    return meal_plan, materials_summary
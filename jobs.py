@@ -0,0 +1,183 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_MAX_WORKERS = 2
+DEFAULT_RETENTION = 24 * 3600
+DEFAULT_HEARTBEAT = 10
+
+# ジョブの状態
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+
+
+def job_key(params):
+    # 同じパラメータのジョブを見分けるキー
+    raw = json.dumps(params, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class JobQueue:
+    # バックグラウンドのワーカーでジョブを実行し、状態と結果をSQLiteに保存する
+    # 同じキーのジョブが実行中なら、新しく始めずにそのジョブのIDを返す
+    # 同じファイルを複数のプロセスで使えるよう、ジョブには実行するプロセスの owner を記録し、
+    # 各プロセスは heartbeat 秒ごとに生存を書き込む。3回分途絶えたプロセスのジョブだけを失敗にする
+    def __init__(self, path, max_workers=DEFAULT_MAX_WORKERS, retention=DEFAULT_RETENTION, heartbeat=DEFAULT_HEARTBEAT):
+        self.path = path
+        self.retention = retention
+        self.heartbeat = heartbeat
+        self.owner = uuid.uuid4().hex
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY,"
+            " key TEXT NOT NULL,"
+            " status TEXT NOT NULL,"
+            " progress INTEGER NOT NULL DEFAULT 0,"
+            " message TEXT NOT NULL DEFAULT '',"
+            " params TEXT NOT NULL,"
+            " partial TEXT,"
+            " result TEXT,"
+            " error TEXT,"
+            " created_at REAL NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " owner TEXT)"
+        )
+        # owner の列がない古いファイルには列を足す
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "owner" not in columns:
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_key ON jobs (key)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS workers ("
+            " owner TEXT PRIMARY KEY,"
+            " heartbeat REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._active = {}
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="meal-plan-job")
+        self._stats = {"submitted": 0, "attached": 0, "abandoned": 0}
+        self._beat()
+        self._stopped = threading.Event()
+        threading.Thread(target=self._heartbeat_loop, name="job-heartbeat", daemon=True).start()
+
+    def _beat(self):
+        # 生存を書き込み、止まったプロセスのジョブを失敗にして、古いジョブを消す
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO workers (owner, heartbeat) VALUES (?, ?)", (self.owner, now)
+            )
+            expired = now - self.heartbeat * 3
+            abandoned = self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE status IN (?, ?)"
+                " AND (owner IS NULL OR owner NOT IN (SELECT owner FROM workers WHERE heartbeat >= ?))",
+                (FAILED, "作成していたプロセスが停止したため中断されました。", now, *ACTIVE_STATUSES, expired),
+            ).rowcount
+            self._conn.execute("DELETE FROM workers WHERE heartbeat < ?", (expired,))
+            self._conn.execute("DELETE FROM jobs WHERE updated_at < ?", (now - self.retention,))
+            self._conn.commit()
+            self._stats["abandoned"] += abandoned
+
+    def _heartbeat_loop(self):
+        while not self._stopped.wait(self.heartbeat):
+            try:
+                self._beat()
+            except sqlite3.Error:
+                # ほかのプロセスの書き込みで一時的に失敗しても、次の回でやり直す
+                continue
+
+    def close(self):
+        # このプロセスの登録を消す（実行中のジョブは、ほかのプロセスから見て期限切れ後に失敗になる）
+        self._stopped.set()
+        self._executor.shutdown(wait=False)
+        with self._lock:
+            self._conn.execute("DELETE FROM workers WHERE owner = ?", (self.owner,))
+            self._conn.commit()
+
+    def submit(self, key, params, run):
+        # run(params, report) を実行するジョブを登録し、(ジョブID, 既存のジョブに合流したかどうか) を返す
+        with self._lock:
+            job_id = self._active.get(key)
+            if job_id is not None:
+                self._stats["attached"] += 1
+                return job_id, True
+            job_id = uuid.uuid4().hex
+            now = time.time()
+            self._conn.execute(
+                "INSERT INTO jobs (id, key, status, params, created_at, updated_at, owner) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, key, QUEUED, json.dumps(params, ensure_ascii=False), now, now, self.owner),
+            )
+            self._conn.commit()
+            self._active[key] = job_id
+            self._stats["submitted"] += 1
+        self._executor.submit(self._run, job_id, key, params, run)
+        return job_id, False
+
+    def _run(self, job_id, key, params, run):
+        def report(progress, message, partial=None):
+            fields = {"progress": progress, "message": message}
+            if partial is not None:
+                fields["partial"] = json.dumps(partial, ensure_ascii=False)
+            self._update(job_id, **fields)
+
+        self._update(job_id, status=RUNNING)
+        try:
+            result = run(params, report)
+        except Exception as e:
+            fields = {"status": FAILED, "error": str(e) or type(e).__name__}
+        else:
+            fields = {"status": DONE, "progress": 100, "message": "", "result": json.dumps(result, ensure_ascii=False)}
+        # 結果の保存と実行中の一覧からの削除を同時に行い、終わったジョブに合流しないようにする
+        with self._lock:
+            self._write(job_id, fields)
+            if self._active.get(key) == job_id:
+                del self._active[key]
+
+    def _update(self, job_id, **fields):
+        with self._lock:
+            self._write(job_id, fields)
+
+    def _write(self, job_id, fields):
+        fields["updated_at"] = time.time()
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        self._conn.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+        self._conn.commit()
+
+    def get(self, job_id):
+        # ジョブの状態を辞書で返す（見つからなければ None）
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT id, status, progress, message, params, partial, result, error, created_at, updated_at"
+                " FROM jobs WHERE id = ?", (job_id,)
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            job = dict(zip([column[0] for column in cursor.description], row))
+        for name in ("params", "partial", "result"):
+            if job[name] is not None:
+                job[name] = json.loads(job[name])
+        return job
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["active"] = len(self._active)
+            for status, count in self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status"):
+                stats[status] = count
+        return stats
@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from datetime import date, timedelta
+
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+# 開始日から7日以内にあれば献立に影響する行事（月, 日, 名前）
+EVENTS = (
+    (1, 1, "正月"), (2, 3, "節分"), (2, 14, "バレンタイン"), (3, 3, "ひな祭り"),
+    (5, 5, "こどもの日"), (7, 7, "七夕"), (10, 31, "ハロウィン"), (12, 24, "クリスマス"), (12, 31, "大晦日"),
+)
+
+_SEASONS = {12: "冬", 1: "冬", 2: "冬", 3: "春", 4: "春", 5: "春", 6: "夏", 7: "夏", 8: "夏", 9: "秋", 10: "秋", 11: "秋"}
+_REQUEST_SEPARATORS = re.compile(r"[\s、。,，・/]+")
+
+
+def normalize_user_request(user_request):
+    # 表記ゆれ・区切り・順番の違いを吸収する（"和食メイン、簡単" と "簡単 和食メイン" は同じ）
+    text = unicodedata.normalize("NFKC", user_request or "").lower()
+    parts = sorted({part for part in _REQUEST_SEPARATORS.split(text) if part})
+    return " ".join(parts)
+
+
+def date_features(start_date, days=7):
+    # 日付そのものではなく、季節・曜日・期間内の行事で比較する
+    window = [start_date + timedelta(days=i) for i in range(days)]
+    events = [name for month, day, name in EVENTS if any(d.month == month and d.day == day for d in window)]
+    return {"season": _SEASONS[start_date.month], "weekday": start_date.weekday(), "events": events}
+
+
+def bucket_ratios(rice_ratio, bread_ratio, noodle_ratio, step=20):
+    # 主食の比重を合計100に直してから step 刻みに丸める
+    total = (rice_ratio + bread_ratio + noodle_ratio) or 1
+    return [int(round(ratio * 100 / total / step) * step) for ratio in (rice_ratio, bread_ratio, noodle_ratio)]
+
+
+def request_key(kind, user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio, **extra):
+    params = {
+        "kind": kind,
+        "request": normalize_user_request(user_request),
+        "date": date_features(start_date) if isinstance(start_date, date) else None,
+        "meal_types": list(meal_types or []),
+        "ratios": bucket_ratios(rice_ratio, bread_ratio, noodle_ratio),
+        "extra": extra,
+    }
+    raw = json.dumps(params, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def fingerprint(values):
+    # レシピ一覧などの同一性を短いハッシュで表す
+    digest = hashlib.sha256()
+    for value in values:
+        digest.update(str(value).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+class ResponseCache:
+    # LLMの応答をSQLiteに保存するキャッシュ。件数と合計サイズの上限を超えたら最後に使われた時刻が古いものから消す
+    def __init__(self, path, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " kind TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return json.loads(row[0])
+
+    def put(self, key, kind, value):
+        payload = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, kind, payload, size, created_at, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, kind, payload, len(payload.encode("utf-8")), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall()
+        evicted = []
+        for key, size in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            count -= 1
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self._stats["evictions"] += len(evicted)
+
+    def get_or_generate(self, key, kind, generate, bypass=False, validate=None):
+        # (値, キャッシュから返したかどうか) を返す。bypass=True なら読まずに作り直して上書きする
+        # validate(値) が問題点（空でない文字列）を返した値は、保存せずにそのまま返す（欠けの扱いは呼び出し側に任せる）
+        # キャッシュにあった値が通らなければ、なかったものとして作り直す
+        if not bypass:
+            value = self.get(key)
+            if value is not None and not (validate and validate(value)):
+                return value, True
+        value = generate()
+        if not (validate and validate(value)):
+            self.put(key, kind, value)
+        return value, False
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"], stats["bytes"] = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return stats
@@ -0,0 +1,197 @@
+import re
+import unicodedata
+
+from recipe_pool import find_recipe
+
+# 表記ゆれの同義語表（正規化後の名前 → 代表表記）
+SYNONYMS = {
+    "玉ねぎ": ("たまねぎ", "タマネギ", "玉葱", "たま葱"),
+    "にんじん": ("人参", "ニンジン"),
+    "じゃがいも": ("ジャガイモ", "じゃが芋", "馬鈴薯"),
+    "長ねぎ": ("長ネギ", "ねぎ", "ネギ", "葱", "白ねぎ", "白ネギ"),
+    "しょうゆ": ("醤油", "醬油", "しょう油", "濃口醤油", "こいくち醤油"),
+    "砂糖": ("さとう", "上白糖"),
+    "こしょう": ("胡椒", "コショウ", "こしょー"),
+    "塩こしょう": ("塩コショウ", "塩胡椒", "塩・こしょう", "塩・胡椒", "塩、こしょう"),
+    "みりん": ("味醂", "本みりん"),
+    "酒": ("料理酒", "日本酒", "お酒"),
+    "にんにく": ("ニンニク", "大蒜", "にんにくチューブ", "おろしにんにく"),
+    "しょうが": ("生姜", "ショウガ", "しょうがチューブ", "生姜チューブ", "おろし生姜", "おろししょうが"),
+    "しいたけ": ("椎茸", "シイタケ"),
+    "卵": ("たまご", "玉子", "タマゴ", "鶏卵"),
+    "ごま油": ("ゴマ油", "胡麻油"),
+    "なす": ("茄子", "ナス"),
+    "キャベツ": ("きゃべつ",),
+    "大根": ("だいこん", "ダイコン"),
+    "ほうれん草": ("ほうれんそう", "ホウレンソウ"),
+    "味噌": ("みそ", "ミソ"),
+    "片栗粉": ("かたくり粉",),
+    "マヨネーズ": ("マヨ",),
+}
+
+# 買い物に必要ないもの
+IGNORED = {"水", "お水", "湯", "お湯", "熱湯", "氷"}
+
+# 区分の判定に使うキーワード。材料名の途中には一致させず、
+# 語尾（"鶏もも肉" の "肉"）→ 語頭（"豚バラ" の "豚"）の順に、それぞれ最も長く一致したものの区分にする
+SECTION_KEYWORDS = {
+    "肉・魚": (
+        "肉", "鶏", "豚", "牛", "ひき肉", "挽き肉", "ベーコン", "ハム", "ソーセージ", "ウインナー",
+        "ささみ", "手羽",
+        "魚", "鮭", "さけ", "サーモン", "さば", "鯖", "あじ", "ぶり", "たら", "鱈", "まぐろ", "マグロ",
+        "えび", "エビ", "海老", "いか", "イカ", "たこ", "タコ", "あさり", "ホタテ", "ツナ", "しらす", "ちくわ",
+    ),
+    "野菜": (
+        "玉ねぎ", "にんじん", "じゃがいも", "長ねぎ", "ねぎ", "キャベツ", "白菜", "大根", "トマト", "なす",
+        "ピーマン", "もやし", "ほうれん草", "小松菜", "ブロッコリー", "きのこ", "しめじ", "しいたけ", "えのき",
+        "にんにく", "しょうが", "大葉", "レタス", "きゅうり", "かぼちゃ", "ごぼう", "れんこん", "いも", "芋", "菜",
+        "コーン", "ベジタブル", "レモン", "りんご", "バナナ",
+        "わかめ", "ひじき", "もずく", "めかぶ", "昆布", "のり", "海苔",
+    ),
+    "卵・大豆・乳製品": (
+        "卵", "卵黄", "卵白", "うずらの卵", "豆腐", "厚揚げ", "油揚げ", "納豆", "豆乳", "大豆", "おから",
+        "牛乳", "チーズ", "ヨーグルト", "生クリーム",
+    ),
+    "ごはん・麺・パン": (
+        "ご飯", "ごはん", "米", "白米", "玄米", "もち", "餅", "うどん", "そば", "そうめん", "麺", "ラーメン",
+        "パスタ", "スパゲッティ", "スパゲティ", "マカロニ", "ペンネ", "春雨", "パン", "食パン",
+    ),
+    "調味料など": (
+        "しょうゆ", "砂糖", "塩", "こしょう", "みりん", "酒", "酢", "油", "オイル", "味噌", "マヨネーズ", "ケチャップ",
+        "ソース", "だし", "顆粒", "コンソメ", "スープの素", "の素", "鶏がら", "鶏ガラ", "片栗粉", "小麦粉", "薄力粉",
+        "米粉", "パン粉", "バター", "ごま", "つゆ", "めんつゆ", "ポン酢", "はちみつ", "カレー粉", "スパイス",
+    ),
+}
+SECTION_ORDER = ("肉・魚", "野菜", "卵・大豆・乳製品", "ごはん・麺・パン", "調味料など")
+
+# キーワードの語頭・語尾では誤った区分になる材料（"牛乳" は "牛" で始まるが肉ではない）
+SECTION_EXCEPTIONS = {
+    "牛乳": "卵・大豆・乳製品",
+    "鶏がらスープ": "調味料など",
+    "鶏ガラスープ": "調味料など",
+    "魚醤": "調味料など",
+    "魚粉": "調味料など",
+    "うどん粉": "調味料など",
+    "そば粉": "調味料など",
+    "そばつゆ": "調味料など",
+    "卵麺": "ごはん・麺・パン",
+    "たらの芽": "野菜",
+}
+
+# カテゴリ表の大カテゴリから区分のキーワードを補う（カテゴリ名は材料名と一致するか語尾が一致するときだけ使う）
+SECTION_ROOTS = {"10": "肉・魚", "11": "肉・魚", "12": "野菜", "34": "野菜", "35": "卵・大豆・乳製品", "19": "調味料など"}
+
+_BRACKETS = re.compile(r"[（(【\[〈《].*?[）)】\]〉》]")
+_LEADING_MARKS = re.compile(r"^(?:[★☆●○◎◇◆■□▲△▼▽・※＊*♪]+|[A-Za-z](?=[぀-ヿ一-鿿]))\s*")
+_OPTIONAL_WORDS = re.compile(r"^(?:お好みで|好みで)\s*|\s*(?:お好みで|適量|少々|少量)+$")
+
+
+_CANONICAL = {}
+for _canonical, _variants in SYNONYMS.items():
+    _CANONICAL[unicodedata.normalize("NFKC", _canonical)] = _canonical
+    for _variant in _variants:
+        _CANONICAL[unicodedata.normalize("NFKC", _variant)] = _canonical
+
+
+def normalize_material(name):
+    # 記号・補足・量の表現を除いて、同義語表の代表表記にそろえる
+    name = unicodedata.normalize("NFKC", name or "").strip()
+    name = _BRACKETS.sub("", name)
+    name = _LEADING_MARKS.sub("", name)
+    name = _OPTIONAL_WORDS.sub("", name).strip(" :：・、")
+    return _CANONICAL.get(name, name)
+
+
+# 部位や切り方の違う肉を、検索ではまとめて扱う（"鶏肉" で "鶏もも肉" も見つかるように）
+#   (まとめた名前, 検索語の別名, 材料名の判定)
+MATERIAL_FAMILIES = (
+    ("鶏肉", ("鶏", "とり", "チキン", "とり肉"), re.compile(r"^(?:鶏|とり)(?:.*肉|もも|むね|モモ|ムネ)|ささみ|手羽|チキン")),
+    ("豚肉", ("豚", "ぶた", "ぶた肉", "ポーク"), re.compile(r"^(?:豚|ぶた)(?:.*肉|バラ|ロース|こま|ヒレ|ひれ|もも|肩)")),
+    ("牛肉", ("牛", "ビーフ"), re.compile(r"^牛(?:.*肉|バラ|ロース|こま|ヒレ|ひれ|もも|すじ|肩)")),
+    ("ひき肉", ("挽き肉", "挽肉", "ミンチ"), re.compile(r"[ひび]き肉|挽き?肉|ミンチ")),
+)
+
+
+def material_terms(name):
+    # 献立の索引に入れる語。代表表記と、当てはまればまとめた名前（"鶏もも肉" → ["鶏もも肉", "鶏肉"]）
+    name = normalize_material(name)
+    if not name:
+        return []
+    terms = [name]
+    for family, _, pattern in MATERIAL_FAMILIES:
+        if pattern.search(name) and family not in terms:
+            terms.append(family)
+    return terms
+
+
+def material_query(name):
+    # 検索語を代表表記にそろえる。"鶏" や "豚" はまとめた名前で探す
+    name = normalize_material(name)
+    for family, aliases, _ in MATERIAL_FAMILIES:
+        if name in aliases:
+            return family
+    return name
+
+
+class MaterialClassifier:
+    # 材料名を SECTION_ORDER の区分に振り分ける
+    # カテゴリ表を渡すと、肉・魚・野菜・大豆・調味料のカテゴリ名もキーワードに加える
+    def __init__(self, index=None):
+        suffixes = {}
+        prefixes = {}
+        for section, words in SECTION_KEYWORDS.items():
+            for word in words:
+                suffixes[word] = prefixes[word] = section
+        if index is not None:
+            # "うど" が "うどん" に一致しないように、カテゴリ名は語頭では照合しない
+            for root, section in SECTION_ROOTS.items():
+                for category_id in index.descendants(root):
+                    for word in re.split(r"[・（）()]", index.name(category_id)):
+                        word = normalize_material(word)
+                        if len(word) >= 2 and not word.startswith("その他") and word not in suffixes:
+                            suffixes[word] = section
+        # 長いキーワードから順に照合する
+        self.suffixes = sorted(suffixes.items(), key=lambda item: -len(item[0]))
+        self.prefixes = sorted(prefixes.items(), key=lambda item: -len(item[0]))
+        self._cache = {}
+
+    def classify(self, name):
+        section = self._cache.get(name)
+        if section is None:
+            section = (
+                SECTION_EXCEPTIONS.get(name)
+                or next((s for word, s in self.suffixes if name.endswith(word)), None)
+                or next((s for word, s in self.prefixes if name.startswith(word)), "調味料など")
+            )
+            self._cache[name] = section
+        return section
+
+
+def aggregate_materials(meal_plan, recipes, classifier):
+    # 献立で選ばれたレシピの材料を集計し、材料まとめの行のリストを返す
+    # 楽天のランキングAPIは分量を返さないので、何品で使うかを記載する
+    counts = {}
+    for meals in meal_plan.values():
+        for meal_info in meals.values():
+            recipe = find_recipe(meal_info.get("recipe", ""), recipes)
+            if recipe is not None:
+                materials = recipe.get("recipeMaterial", [])
+            else:
+                materials = [m for m in meal_info.get("materials", "").split(",") if m.strip()]
+            names = {normalize_material(material) for material in materials}
+            for name in names:
+                if name and name not in IGNORED:
+                    counts[name] = counts.get(name, 0) + 1
+
+    sections = {section: [] for section in SECTION_ORDER}
+    for name, count in counts.items():
+        sections[classifier.classify(name)].append((name, count))
+
+    lines = []
+    for section in SECTION_ORDER:
+        if not sections[section]:
+            continue
+        lines.append(f"**{section}:**")
+        for name, count in sorted(sections[section], key=lambda item: (-item[1], item[0])):
+            lines.append(f"{name}: {count}品で使用")
+    return lines
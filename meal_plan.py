@@ -0,0 +1,301 @@
+import json
+from datetime import timedelta
+
+from recipe_pool import find_recipe_no, title_similarity, is_excluded
+
+MATERIALS_HEADER = "1週間分の材料まとめ:"
+
+# この値以上タイトルが似ているレシピは「似た料理」とみなす
+SIMILAR_TITLE_THRESHOLD = 0.5
+
+# JSON出力の材料まとめの区分（キー, 表示名）
+MATERIAL_SECTIONS = (("meat_fish", "肉・魚"), ("vegetables", "野菜"), ("seasonings", "調味料など"))
+
+
+class MealPlanParser:
+    # 献立テキストを1行ずつ解析する。ストリーミングの途中経過を少しずつ渡してもよい
+    # feed() は書き終わった（次の日付に進んだ）日付のリストを返す
+    def __init__(self, meal_types):
+        self.meal_types = list(meal_types)
+        self.plan = {}
+        self.materials_summary = []
+        self.completed_dates = []
+        self._buffer = ""
+        self._current_date = None
+        self._current_meal = None
+        self._in_materials = False
+
+    def feed(self, text):
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split("\n")
+        completed = []
+        for line in lines:
+            finished_date = self._parse_line(line)
+            if finished_date is not None:
+                completed.append(finished_date)
+        return completed
+
+    def finish(self):
+        completed = []
+        if self._buffer:
+            finished_date = self._parse_line(self._buffer)
+            self._buffer = ""
+            if finished_date is not None:
+                completed.append(finished_date)
+        finished_date = self._close_day()
+        if finished_date is not None:
+            completed.append(finished_date)
+        return completed
+
+    def completed_plan(self):
+        # 書き終わった日付だけの献立
+        return {date: self.plan[date] for date in self.completed_dates}
+
+    def _close_day(self):
+        finished_date = self._current_date
+        self._current_date = None
+        self._current_meal = None
+        if finished_date is not None:
+            self.completed_dates.append(finished_date)
+        return finished_date
+
+    def _parse_line(self, line):
+        line = line.strip()
+        if not line:
+            return None
+
+        # 見出しは "## 1週間分の材料まとめ:" や "**1週間分の材料まとめ:**" で出力されることもある
+        if line.lstrip("#* ").startswith(MATERIALS_HEADER):
+            self._in_materials = True
+            return self._close_day()
+
+        if self._in_materials:
+            self.materials_summary.append(line)
+            return None
+
+        if line.startswith("**") and "(" in line and ")" in line:
+            finished_date = self._close_day()
+            self._current_date = line.strip("*").split("(")[0].strip()
+            self.plan[self._current_date] = {}
+            return finished_date
+
+        current_date = self._current_date
+        if any(line.startswith(f"{meal_type}:") for meal_type in self.meal_types):
+            if current_date is None:
+                return None
+            self._current_meal = line.split(":")[0]
+            recipe = line.split(":", 1)[1].strip()
+            self.plan[current_date][self._current_meal] = {"recipe": recipe, "reason": "", "materials": "", "url": ""}
+        elif current_date and self._current_meal:
+            meal_info = self.plan[current_date][self._current_meal]
+            if line.startswith("理由:"):
+                meal_info["reason"] = line.split(":", 1)[1].strip()
+            elif line.startswith("材料:"):
+                meal_info["materials"] = line.split(":", 1)[1].strip()
+            elif line.startswith("URL:"):
+                meal_info["url"] = line.split(":", 1)[1].strip()
+        return None
+
+
+def parse_meal_plan(meal_plan, meal_types):
+    parser = MealPlanParser(meal_types)
+    parser.feed(meal_plan)
+    parser.finish()
+    return parser.plan, parser.materials_summary
+
+
+def plan_dates(start_date, days=7):
+    return [(start_date + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
+
+
+def missing_meals(meal_plan, meal_types, days=7):
+    # 献立として使えない箇所の一覧。日数が足りない、または区分にレシピがない日を返す
+    missing = [f"{days - len(meal_plan)}日分"] if len(meal_plan) < days else []
+    for date, meals in list(meal_plan.items())[:days]:
+        for meal_type in meal_types:
+            if not (meals or {}).get(meal_type, {}).get("recipe"):
+                missing.append(f"{date}の{meal_type}")
+    return missing
+
+
+def plan_problem(meal_plan, meal_types, days=7):
+    # 欠けがあれば理由の文字列、なければ None
+    missing = missing_meals(meal_plan, meal_types, days)
+    if not missing:
+        return None
+    shown = "、".join(missing[:5]) + (f" ほか{len(missing) - 5}件" if len(missing) > 5 else "")
+    return f"献立の一部を作れませんでした（{shown}が足りません）。作れた分だけを表示しています。"
+
+
+def realign_plan_dates(meal_plan, start_date):
+    # 別の週に作った献立の日付を、開始日からの日付に付け直す（順番はそのまま）
+    dates = plan_dates(start_date, len(meal_plan))
+    return {date: meals for date, meals in zip(dates, meal_plan.values())}
+
+
+def meal_plan_schema(include_materials=True):
+    # Gemini の response_schema に渡すスキーマ
+    item = {
+        "type": "OBJECT",
+        "properties": {"name": {"type": "STRING"}, "amount": {"type": "STRING"}},
+        "required": ["name", "amount"],
+    }
+    properties = {
+        "days": {
+            "type": "ARRAY",
+            "items": {
+                "type": "OBJECT",
+                "properties": {
+                    "date": {"type": "STRING"},
+                    "meals": {
+                        "type": "ARRAY",
+                        "items": {
+                            "type": "OBJECT",
+                            "properties": {
+                                "meal_type": {"type": "STRING"},
+                                "recipe_no": {"type": "INTEGER"},
+                                "reason": {"type": "STRING"},
+                            },
+                            "required": ["meal_type", "recipe_no", "reason"],
+                        },
+                    },
+                },
+                "required": ["date", "meals"],
+            },
+        },
+    }
+    required = ["days"]
+    if include_materials:
+        properties["materials_summary"] = {
+            "type": "OBJECT",
+            "properties": {key: {"type": "ARRAY", "items": item} for key, _ in MATERIAL_SECTIONS},
+            "required": [key for key, _ in MATERIAL_SECTIONS],
+        }
+        required.append("materials_summary")
+    return {"type": "OBJECT", "properties": properties, "required": required}
+
+
+def format_materials_summary(materials):
+    # {"meat_fish": [{"name", "amount"}], ...} をテキスト版と同じ行のリストにする
+    lines = []
+    for key, label in MATERIAL_SECTIONS:
+        if not materials.get(key):
+            continue
+        lines.append(f"**{label}:**")
+        for item in materials[key]:
+            lines.append(f"{item['name']}: {item['amount']}")
+    return lines
+
+
+def _validate_materials(materials):
+    if not isinstance(materials, dict):
+        return None
+    sections = {}
+    for key, _ in MATERIAL_SECTIONS:
+        items = materials.get(key)
+        if not isinstance(items, list):
+            return None
+        sections[key] = [
+            {"name": str(item["name"]).strip(), "amount": str(item.get("amount", "")).strip()}
+            for item in items
+            if isinstance(item, dict) and str(item.get("name", "")).strip()
+        ]
+    return sections
+
+
+def validate_meal_plan_json(data, meal_types, dates, recipes, include_materials=True):
+    # JSON出力を検証し、(献立, 材料まとめの行, 失敗した区分) を返す
+    # 失敗した区分は日付の文字列、または材料まとめなら "materials"
+    # 日付はモデルの出力ではなく dates の順番で割り当てる
+    if isinstance(data, str):
+        try:
+            data = json.loads(data)
+        except ValueError:
+            data = {}
+    if not isinstance(data, dict):
+        data = {}
+
+    days = data.get("days") if isinstance(data.get("days"), list) else []
+    by_date = {day.get("date"): day for day in days if isinstance(day, dict)}
+
+    plan = {}
+    failed = []
+    for i, date in enumerate(dates):
+        day = by_date.get(date)
+        if day is None and i < len(days) and isinstance(days[i], dict) and days[i].get("date") not in dates:
+            day = days[i]
+        meals = {}
+        for meal in (day or {}).get("meals") or []:
+            if not isinstance(meal, dict):
+                continue
+            meal_type = meal.get("meal_type")
+            recipe_no = meal.get("recipe_no")
+            if meal_type not in meal_types or meal_type in meals:
+                continue
+            if not isinstance(recipe_no, int) or not 1 <= recipe_no <= len(recipes):
+                continue
+            meals[meal_type] = {
+                "recipe": f"{recipe_no}.{recipes[recipe_no - 1]['recipeTitle']}",
+                "reason": str(meal.get("reason", "")).strip(),
+                "materials": "",
+                "url": "",
+            }
+        if all(meal_type in meals for meal_type in meal_types):
+            plan[date] = {meal_type: meals[meal_type] for meal_type in meal_types}
+        else:
+            failed.append(date)
+
+    materials_summary = []
+    if include_materials:
+        materials = _validate_materials(data.get("materials_summary"))
+        if materials is None:
+            failed.append("materials")
+        else:
+            materials_summary = format_materials_summary(materials)
+    return plan, materials_summary, failed
+
+
+def merge_day_plans(day_plans, dates, meal_types, recipes, threshold=SIMILAR_TITLE_THRESHOLD):
+    # 日ごとに別々に作った献立をまとめ、週の中で同じ・似た料理が出ないよう差し替える
+    # 差し替え候補は朝食なら材料の少ない順、夕食なら材料の多い順に選ぶ（サラダ・お菓子などは候補にしない）
+    merged = {}
+    used = []
+    for date in dates:
+        meals = day_plans.get(date)
+        if not meals:
+            continue
+        merged[date] = {}
+        for meal_type in meal_types:
+            meal = meals.get(meal_type)
+            if meal is None:
+                continue
+            recipe_no = find_recipe_no(meal["recipe"])
+            if recipe_no is None or _is_similar(recipe_no, used, recipes, threshold):
+                replacement = _pick_replacement(meal_type, used, recipes, threshold)
+                if replacement is not None:
+                    recipe_no = replacement
+                    meal = dict(meal, recipe=f"{recipe_no}.{recipes[recipe_no - 1]['recipeTitle']}",
+                                reason="他の日と似た料理を避けるために差し替えました。", materials="", url="")
+            if recipe_no is not None:
+                used.append(recipe_no)
+            merged[date][meal_type] = meal
+    return merged
+
+
+def _is_similar(recipe_no, used, recipes, threshold):
+    if not 1 <= recipe_no <= len(recipes):
+        return True
+    title = recipes[recipe_no - 1]["recipeTitle"]
+    return any(no == recipe_no or title_similarity(title, recipes[no - 1]["recipeTitle"]) >= threshold for no in used)
+
+
+def _pick_replacement(meal_type, used, recipes, threshold):
+    candidates = [no for no in range(1, len(recipes) + 1) if not is_excluded(recipes[no - 1])]
+    if meal_type == "朝食":
+        candidates.sort(key=lambda no: len(recipes[no - 1].get("recipeMaterial", [])))
+    elif meal_type == "夕食":
+        candidates.sort(key=lambda no: -len(recipes[no - 1].get("recipeMaterial", [])))
+    for no in candidates:
+        if not _is_similar(no, used, recipes, threshold):
+            return no
+    return None
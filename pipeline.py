@@ -0,0 +1,130 @@
+# 「献立を作成」の一連の処理（カテゴリ選択 → レシピ取得 → 献立作成 → 仕上げ）
+# バックグラウンドのジョブから呼ばれるので Streamlit には依存しない
+import asyncio
+from datetime import date
+
+import settings
+from settings import PIPELINE_MODE, METRICS_LOG_PATH
+from clients import load_category_data, get_plan_cache
+from plan_cache import plan_key
+from recipe_pool import dedupe_recipes
+from meal_plan import plan_problem
+from generation import get_category_ids, get_recipes, generate_meal_plan, finalize_meal_plan
+from async_pipeline import select_and_fetch
+import tracing
+
+
+def meal_plan_params(user_request, start_date, meal_types, rice_ratio, bread_ratio, noodle_ratio, use_cache=True):
+    # ジョブとして保存できるよう、JSONにできる値だけの辞書にする
+    return {
+        "user_request": user_request,
+        "start_date": start_date.isoformat(),
+        "meal_types": list(meal_types),
+        "rice_ratio": rice_ratio,
+        "bread_ratio": bread_ratio,
+        "noodle_ratio": noodle_ratio,
+        "use_cache": use_cache,
+    }
+
+
+def plan_cache_key(params, **extra):
+    # 出力形式やモデルなど、結果が変わる設定もキーに含める
+    return plan_key(params, format=settings.MEAL_PLAN_FORMAT, model=settings.MODEL_NAME,
+                    reasons=settings.PLANNER_REASONS, materials=settings.MATERIALS_SUMMARY, **extra)
+
+
+def cached_meal_plan(params, report=None):
+    # 完成した献立をプロセスをまたいで共有する。同じ条件を作成中なら、その完成を待って同じ結果を返す
+    # use_cache=False のときは作り直して上書きする
+    report = report or (lambda progress, message, partial=None: None)
+    result, state = get_plan_cache().get_or_compute(
+        plan_cache_key(params), lambda: create_meal_plan(params, report), bypass=not params.get("use_cache", True),
+        on_wait=lambda: report(10, "同じ条件の献立をほかの画面で作成中です。完成を待っています"),
+        validate=lambda result: plan_problem(result["meal_plan"], params["meal_types"]),
+    )
+    tracing.METRICS.inc("plan_cache_total", state=state)
+    return dict(result, plan_cache=state)
+
+
+def create_meal_plan(params, report=None, sources=None, exclude_urls=None):
+    # report(進捗0-100, メッセージ, 途中までの献立) で経過を知らせる
+    # sources(params) を渡すと、カテゴリ選択とレシピ取得をそれで置き換える（(カテゴリID, レシピ, 取得の記録) を返す）
+    # exclude_urls のレシピは、残りで献立を埋められる限り候補から外す（数週間分を続けて作るときなど）
+    report = report or (lambda progress, message, partial=None: None)
+    user_request = params["user_request"]
+    start_date = date.fromisoformat(params["start_date"])
+    meal_types = params["meal_types"]
+    ratios = (params["rice_ratio"], params["bread_ratio"], params["noodle_ratio"])
+    use_cache = params.get("use_cache", True)
+    categories = load_category_data()
+
+    with tracing.trace("meal_plan", METRICS_LOG_PATH or None, params=params) as trace:
+        report(10, "カテゴリを選んでいます")
+        if sources is not None:
+            with tracing.stage("select_and_fetch"):
+                category_ids, recipes, fetch_stats = sources(params)
+                count_fetches(fetch_stats)
+        elif PIPELINE_MODE == "async":
+            # カテゴリIDが出力されるたびにレシピの取得を始める
+            with tracing.stage("select_and_fetch"):
+                category_ids, recipes, fetch_stats = asyncio.run(select_and_fetch(
+                    user_request, categories, start_date, *ratios, use_cache=use_cache))
+                count_fetches(fetch_stats)
+        else:
+            with tracing.stage("select_categories"):
+                category_ids = get_category_ids(user_request, categories, start_date, *ratios, use_cache=use_cache)
+            with tracing.stage("fetch_recipes"):
+                recipes, fetch_stats = get_recipes(category_ids)
+                count_fetches(fetch_stats)
+
+        report(30, "レシピを取得しました")
+        recipes = dedupe_recipes(recipes)
+        if exclude_urls:
+            remaining = [recipe for recipe in recipes if recipe.get("recipeUrl") not in exclude_urls]
+            if len(remaining) >= 7 * len(meal_types):
+                recipes = remaining
+        if not recipes:
+            raise ValueError("レシピを取得できませんでした。もう一度お試しください。")
+
+        report(50, "献立を作成しています")
+
+        def show_progress(partial_plan):
+            # 1日分を書き終えるたびに途中経過を知らせる
+            report(min(50 + len(partial_plan) * 4, 78), "献立を作成しています", partial_plan)
+
+        with tracing.stage("generate_meal_plan"):
+            meal_plan, materials_summary, meal_plan_text = generate_meal_plan(
+                recipes, user_request, start_date, meal_types, *ratios,
+                use_cache=use_cache, on_progress=show_progress,
+            )
+
+        report(80, "材料をまとめています")
+        with tracing.stage("finalize"):
+            meal_plan, materials_summary = finalize_meal_plan(meal_plan, materials_summary, recipes)
+        # 欠けがあっても作れた分は返し、足りないものを warning で知らせる（共有キャッシュには残さない）
+        if not any(meal_plan.values()):
+            raise ValueError("献立を作成できませんでした。もう一度お試しください。")
+        warning = plan_problem(meal_plan, meal_types)
+    # ジョブと献立キャッシュに保存されるので、取得したレシピ一覧は件数だけを残す（一覧はランキングキャッシュにある）
+    return {
+        "category_ids": category_ids,
+        "recipe_count": len(recipes),
+        "fetch_stats": fetch_stats,
+        "meal_plan_text": meal_plan_text,
+        "meal_plan": meal_plan,
+        "materials_summary": materials_summary,
+        "trace": trace.summary(),
+        "warning": warning,
+    }
+
+
+def count_fetches(fetch_stats):
+    # 楽天を実際に呼んだ回数（再試行を含む）とキャッシュの結果を、実行中の段階に記録する
+    states = [stat["cache"] for stat in fetch_stats]
+    tracing.count(
+        rakuten_calls=sum(1 + stat["retries"] for stat in fetch_stats if stat["cache"] in ("miss", None)),
+        rakuten_retries=sum(stat["retries"] for stat in fetch_stats),
+        rakuten_errors=sum(1 for stat in fetch_stats if stat["error"]),
+        ranking_cache_hits=sum(1 for state in states if state in ("fresh", "stale", "store")),
+        ranking_cache_misses=sum(1 for state in states if state == "miss"),
+    )
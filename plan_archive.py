@@ -0,0 +1,208 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+import zlib
+
+from materials import material_terms, material_query
+
+# 検索語の区切り（要望は空白や読点で区切って書かれることが多い）
+_TERM_SEPARATORS = re.compile(r"[\s、。,，・/]+")
+
+
+def _fts_phrase(text):
+    # FTS5 の検索式に入れる語を二重引用符でくくる
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _normalize_text(text):
+    return unicodedata.normalize("NFKC", text or "").lower()
+
+
+def _terms(text):
+    # 検索語を区切りで分けた語のリスト。語ごとに AND で探す
+    return [term for term in _TERM_SEPARATORS.split(_normalize_text(text)) if term]
+
+
+def _bigrams(text):
+    # 要望の語ごとの2文字ずつの語（trigram で探せない2文字の検索語に使う）
+    return {term[i:i + 2] for term in _terms(text) for i in range(len(term) - 1)}
+
+
+class PlanArchive:
+    # 作成した献立をSQLiteに保存する。本文は圧縮したJSONで持ち、
+    # 期間・要望・レシピURL・材料の索引で「先月の鶏肉を使った献立」のように探せるようにする
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS plans ("
+            " id INTEGER PRIMARY KEY,"
+            " created_at REAL NOT NULL,"
+            " start_date TEXT,"
+            " end_date TEXT,"
+            " user_request TEXT NOT NULL DEFAULT '',"
+            " payload BLOB NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS plans_dates ON plans (start_date, end_date)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS plan_recipes ("
+            " plan_id INTEGER NOT NULL REFERENCES plans (id) ON DELETE CASCADE,"
+            " url TEXT NOT NULL,"
+            " PRIMARY KEY (url, plan_id))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS plan_materials ("
+            " plan_id INTEGER NOT NULL REFERENCES plans (id) ON DELETE CASCADE,"
+            " material TEXT NOT NULL,"
+            " PRIMARY KEY (material, plan_id))"
+        )
+        # 要望と材料の全文検索。3文字以上は trigram、2文字の要望の語は plan_request_grams で探す
+        # 材料は materials.py の代表表記とまとめた名前（"鶏肉" など）で入れる
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS plans_fts USING fts5(user_request, materials, tokenize='trigram')"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS plan_request_grams ("
+            " gram TEXT NOT NULL,"
+            " plan_id INTEGER NOT NULL REFERENCES plans (id) ON DELETE CASCADE,"
+            " PRIMARY KEY (gram, plan_id))"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+        # 索引がなかった頃のファイルは、保存済みの献立から索引を作り直す
+        indexed = self._conn.execute("SELECT COUNT(*) FROM plans_fts").fetchone()[0]
+        if indexed < self._conn.execute("SELECT COUNT(*) FROM plans").fetchone()[0]:
+            self.reindex()
+
+    def save(self, meal_plan, materials_summary, user_request="", params=None):
+        # 保存した献立のIDを返す
+        dates = sorted(meal_plan)
+        payload = json.dumps(
+            {"meal_plan": meal_plan, "materials_summary": materials_summary, "params": params},
+            ensure_ascii=False, separators=(",", ":"),
+        )
+        with self._lock:
+            plan_id = self._conn.execute(
+                "INSERT INTO plans (created_at, start_date, end_date, user_request, payload) VALUES (?, ?, ?, ?, ?)",
+                (time.time(), dates[0] if dates else None, dates[-1] if dates else None, user_request or "",
+                 zlib.compress(payload.encode("utf-8"))),
+            ).lastrowid
+            self._index(plan_id, meal_plan, user_request or "")
+            self._conn.commit()
+        return plan_id
+
+    def _index(self, plan_id, meal_plan, user_request):
+        urls = set()
+        materials = set()
+        for meals in meal_plan.values():
+            for meal_info in meals.values():
+                if meal_info.get("url"):
+                    urls.add(meal_info["url"])
+                for material in meal_info.get("materials", "").split(","):
+                    materials.update(material_terms(material))
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO plan_recipes (plan_id, url) VALUES (?, ?)", [(plan_id, url) for url in urls]
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO plan_materials (plan_id, material) VALUES (?, ?)", [(plan_id, m) for m in materials]
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO plan_request_grams (gram, plan_id) VALUES (?, ?)",
+            [(gram, plan_id) for gram in _bigrams(user_request)],
+        )
+        self._conn.execute("DELETE FROM plans_fts WHERE rowid = ?", (plan_id,))
+        self._conn.execute(
+            "INSERT INTO plans_fts (rowid, user_request, materials) VALUES (?, ?, ?)",
+            (plan_id, _normalize_text(user_request), " ".join(sorted(materials))),
+        )
+
+    def reindex(self):
+        # 保存済みのすべての献立から索引を作り直し、件数を返す
+        with self._lock:
+            rows = self._conn.execute("SELECT id, user_request, payload FROM plans").fetchall()
+            for plan_id, user_request, payload in rows:
+                meal_plan = json.loads(zlib.decompress(payload).decode("utf-8"))["meal_plan"]
+                self._index(plan_id, meal_plan, user_request)
+            self._conn.commit()
+        return len(rows)
+
+    def get(self, plan_id):
+        # {"id", "created_at", "start_date", "end_date", "user_request", "meal_plan", "materials_summary", "params"}
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, created_at, start_date, end_date, user_request, payload FROM plans WHERE id = ?", (plan_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        plan = dict(zip(("id", "created_at", "start_date", "end_date", "user_request"), row[:5]))
+        plan.update(json.loads(zlib.decompress(row[5]).decode("utf-8")))
+        return plan
+
+    def search(self, start=None, end=None, text=None, recipe_url=None, material=None, limit=50):
+        # 条件に合う献立の一覧（本文なし）を新しい順に返す。条件はすべて AND
+        #   start / end:  献立の期間がこの範囲と重なるもの（"YYYY-MM-DD"）
+        #   text:         要望に含まれる語。空白・読点で区切った語ごとに AND で探す
+        #                 （3文字以上は全文検索、2文字は2文字ずつの索引、1文字は部分一致）
+        #   recipe_url:   このレシピを使ったもの
+        #   material:     材料。代表表記・まとめた名前で一致するもの（"鶏肉" で "鶏もも肉" も）と、
+        #                 3文字以上なら材料名の一部に含むもの
+        conditions = []
+        params = []
+        if start:
+            conditions.append("end_date >= ?")
+            params.append(str(start))
+        if end:
+            conditions.append("start_date <= ?")
+            params.append(str(end))
+        for term in _terms(text):
+            if len(term) >= 3:
+                conditions.append("id IN (SELECT rowid FROM plans_fts WHERE plans_fts MATCH ?)")
+                params.append(f"user_request : {_fts_phrase(term)}")
+            elif len(term) == 2:
+                conditions.append("id IN (SELECT plan_id FROM plan_request_grams WHERE gram = ?)")
+                params.append(term)
+            else:
+                conditions.append("instr(lower(user_request), ?) > 0")
+                params.append(term)
+        if recipe_url:
+            conditions.append("id IN (SELECT plan_id FROM plan_recipes WHERE url = ?)")
+            params.append(recipe_url)
+        if material:
+            material = material_query(material)
+            if len(material) >= 3:
+                conditions.append(
+                    "(id IN (SELECT plan_id FROM plan_materials WHERE material = ?)"
+                    " OR id IN (SELECT rowid FROM plans_fts WHERE plans_fts MATCH ?))"
+                )
+                params.extend([material, f"materials : {_fts_phrase(material)}"])
+            else:
+                conditions.append("id IN (SELECT plan_id FROM plan_materials WHERE material = ?)")
+                params.append(material)
+        sql = "SELECT id, created_at, start_date, end_date, user_request FROM plans"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(zip(("id", "created_at", "start_date", "end_date", "user_request"), row)) for row in rows]
+
+    def delete(self, plan_id):
+        with self._lock:
+            self._conn.execute("DELETE FROM plans_fts WHERE rowid = ?", (plan_id,))
+            self._conn.execute("DELETE FROM plans WHERE id = ?", (plan_id,))
+            self._conn.commit()
+
+    def stats(self):
+        with self._lock:
+            count, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(length(payload)), 0) FROM plans").fetchone()
+        return {"plans": count, "bytes": size}
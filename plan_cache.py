@@ -0,0 +1,236 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+
+from llm_cache import normalize_user_request, bucket_ratios
+
+DEFAULT_MAX_ENTRIES = 200
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+DEFAULT_TTL = 24 * 3600
+DEFAULT_LEASE = 600
+DEFAULT_POLL_INTERVAL = 0.5
+
+MEAL_TYPE_ORDER = ("朝食", "昼食", "夕食")
+
+# get_or_compute の結果の出どころ
+HIT = "hit"
+COMPUTED = "computed"
+WAITED = "waited"
+
+
+def plan_key(params, **extra):
+    # 完成した献立を見分けるキー。要望の表記ゆれ・食事の選び順・比重の倍率の違いは同じとみなす
+    # 日付は献立そのものに入るので正規化しない。extra には出力形式など結果が変わる設定を渡す
+    normalized = {
+        "request": normalize_user_request(params["user_request"]),
+        "start_date": params["start_date"],
+        "meal_types": sorted(params["meal_types"], key=lambda m: MEAL_TYPE_ORDER.index(m) if m in MEAL_TYPE_ORDER else len(MEAL_TYPE_ORDER)),
+        "ratios": bucket_ratios(params["rice_ratio"], params["bread_ratio"], params["noodle_ratio"], step=1),
+        "extra": extra,
+    }
+    raw = json.dumps(normalized, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class PlanCache:
+    # 完成した献立をSQLiteに保存し、同じサーバーの別のプロセスとも共有する
+    # 同じキーを計算中なら（別のプロセスでも）新しく始めずに、その結果ができるのを待つ
+    #   プロセス内: キーごとの Event で待つ
+    #   プロセス間: leases 表の行を「計算中」の印にし、結果が書かれるまで poll_interval ごとに確認する
+    #               計算していたプロセスが落ちても、lease 秒たてば次に待っていたものが引き継ぐ
+    def __init__(self, path, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES, ttl=DEFAULT_TTL,
+                 lease=DEFAULT_LEASE, poll_interval=DEFAULT_POLL_INTERVAL):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.lease = lease
+        self.poll_interval = poll_interval
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY,"
+            " payload BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS leases ("
+            " key TEXT PRIMARY KEY,"
+            " owner TEXT NOT NULL,"
+            " expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._owner = uuid.uuid4().hex
+        self._inflight = {}
+        self._stats = {"hits": 0, "misses": 0, "waits": 0, "evictions": 0}
+
+    def get(self, key, since=None):
+        # since を渡すと、その時刻より前に書かれた値は返さない
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT payload, created_at FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None or (self.ttl and now - row[1] > self.ttl) or (since is not None and row[1] < since):
+                return None
+            self._conn.execute("UPDATE results SET last_used = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return json.loads(zlib.decompress(row[0]).decode("utf-8"))
+
+    def _usable(self, key, since, validate):
+        value = self.get(key, since)
+        if value is None or (validate and validate(value)):
+            return None
+        return value
+
+    def put(self, key, value):
+        payload = zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, payload, size, created_at, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, payload, len(payload), now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now):
+        # 期限切れを消し、件数と合計サイズの上限を超えていれば最後に使われた時刻が古いものから消す
+        evicted = 0
+        if self.ttl:
+            evicted += self._conn.execute("DELETE FROM results WHERE created_at < ?", (now - self.ttl,)).rowcount
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        if count > self.max_entries or total > self.max_bytes:
+            keys = []
+            for key, size in self._conn.execute("SELECT key, size FROM results ORDER BY last_used").fetchall():
+                if count <= self.max_entries and total <= self.max_bytes:
+                    break
+                keys.append((key,))
+                count -= 1
+                total -= size
+            self._conn.executemany("DELETE FROM results WHERE key = ?", keys)
+            evicted += len(keys)
+        self._stats["evictions"] += evicted
+
+    def _acquire(self, key):
+        # 計算中の印を取れたら True。ほかのプロセスが期限内の印を持っていれば False
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT owner, expires_at FROM leases WHERE key = ?", (key,)).fetchone()
+                if row is not None and row[0] != self._owner and row[1] > now:
+                    return False
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO leases (key, owner, expires_at) VALUES (?, ?, ?)",
+                    (key, self._owner, now + self.lease),
+                )
+                return True
+            finally:
+                self._conn.commit()
+
+    def _release(self, key):
+        with self._lock:
+            self._conn.execute("DELETE FROM leases WHERE key = ? AND owner = ?", (key, self._owner))
+            self._conn.commit()
+
+    def _leased(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT expires_at FROM leases WHERE key = ?", (key,)).fetchone()
+        return row is not None and row[0] > time.time()
+
+    def get_or_compute(self, key, compute, bypass=False, on_wait=None, validate=None):
+        # (値, HIT / COMPUTED / WAITED) を返す
+        # bypass=True なら、呼び出した時刻より前に書かれた値は使わずに作り直して上書きする
+        # validate(値) が問題点を返す値は、読んでも使わない。作った値なら保存せずにそのまま返す
+        # 同じプロセスで計算中のものが失敗したら、待っていた呼び出しにも同じ例外を返す
+        since = time.time() if bypass else None
+        if since is None:
+            value = self._usable(key, None, validate)
+            if value is not None:
+                with self._lock:
+                    self._stats["hits"] += 1
+                return value, HIT
+
+        while True:
+            with self._lock:
+                flight = self._inflight.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._inflight[key] = {"event": threading.Event(), "value": None, "error": None, "since": since}
+                else:
+                    self._stats["waits"] += 1
+            if leader:
+                break
+            if on_wait:
+                on_wait()
+            flight["event"].wait()
+            if flight["error"] is not None:
+                raise flight["error"]
+            if since is None or flight["since"] is not None:
+                return flight["value"], WAITED
+            # 作り直しを頼まれたのに古い値を使ってよい計算に合流していたので、書かれた時刻を確かめ直す
+
+        try:
+            value, state = self._compute_once(key, compute, since, validate, on_wait)
+            flight["value"] = value
+            return value, state
+        except Exception as e:
+            flight["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            flight["event"].set()
+
+    def _compute_once(self, key, compute, since, validate, on_wait):
+        waited = False
+        while not self._acquire(key):
+            # ほかのプロセスが計算中。結果が書かれるか、印が消える（失敗・期限切れ）まで待つ
+            if not waited:
+                waited = True
+                with self._lock:
+                    self._stats["waits"] += 1
+                if on_wait:
+                    on_wait()
+            while self._leased(key):
+                time.sleep(self.poll_interval)
+                value = self._usable(key, since, validate)
+                if value is not None:
+                    return value, WAITED
+            value = self._usable(key, since, validate)
+            if value is not None:
+                return value, WAITED
+        try:
+            # 印を取るまでの間に、ほかのプロセスが書き終えているかもしれない
+            value = self._usable(key, since, validate)
+            if value is not None:
+                return value, WAITED
+            with self._lock:
+                self._stats["misses"] += 1
+            value = compute()
+            if not (validate and validate(value)):
+                self.put(key, value)
+            return value, COMPUTED
+        finally:
+            self._release(key)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["inflight"] = len(self._inflight)
+            stats["entries"], stats["bytes"] = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+            ).fetchone()
+        return stats
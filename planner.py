@@ -0,0 +1,161 @@
+# モデルを使わずに、取得したレシピを日付×食事タイプに割り当てる献立プランナー
+# 主食の比重・似た料理の禁止・サラダ/スイーツ/味噌汁の除外を必ず守り、その中で
+# 朝食は材料の少ないもの、夕食は材料の多いものになるよう貪欲法＋局所探索で最適化する
+import unicodedata
+
+from category_search import STAPLE_ROOTS
+from meal_plan import SIMILAR_TITLE_THRESHOLD
+from recipe_pool import title_similarity, is_excluded
+
+STAPLES = ("rice", "bread", "noodle")
+STAPLE_LABELS = {"rice": "ごはんに合う一品", "bread": "パンの料理", "noodle": "麺料理"}
+
+# カテゴリがわからないときにタイトルから主食を判定するキーワード（どちらでもなければごはんもの）
+STAPLE_KEYWORDS = {
+    "noodle": ("麺", "うどん", "そば", "そうめん", "ラーメン", "パスタ", "スパゲ", "ペンネ", "マカロニ", "ペペロンチーノ", "ちゃんぽん", "冷やし中華", "ビーフン"),
+    "bread": ("パン", "トースト", "サンド", "ピザ", "ホットドッグ", "ベーグル", "バーガー"),
+}
+# 主食の判定で誤って一致する語
+STAPLE_FALSE_FRIENDS = ("フライパン", "パン粉", "そばつゆ", "そば粉")
+
+RANK_WEIGHT = 0.05
+MAX_SEARCH_ROUNDS = 20
+
+
+def _root(recipe):
+    category_id = recipe.get("categoryId")
+    return category_id.split("-")[0] if category_id else None
+
+
+def _title(recipe):
+    title = unicodedata.normalize("NFKC", recipe.get("recipeTitle", ""))
+    for word in STAPLE_FALSE_FRIENDS:
+        title = title.replace(word, "")
+    return title
+
+
+def staple_of(recipe):
+    # カテゴリ（主食の大カテゴリ）を優先し、なければタイトルで判定する
+    root = _root(recipe)
+    for staple, roots in STAPLE_ROOTS.items():
+        if root in roots:
+            return staple
+    title = _title(recipe)
+    for staple in ("noodle", "bread"):
+        if any(word in title for word in STAPLE_KEYWORDS[staple]):
+            return staple
+    return "rice"
+
+
+def staple_quotas(slot_count, rice_ratio, bread_ratio, noodle_ratio):
+    # 比重どおりの主食ごとの品数（最大剰余法で合計を slot_count にそろえる）。比重がすべて0なら制約なし
+    ratios = dict(zip(STAPLES, (rice_ratio, bread_ratio, noodle_ratio)))
+    total = sum(ratios.values())
+    if total <= 0:
+        return None
+    exact = {staple: slot_count * ratio / total for staple, ratio in ratios.items()}
+    quotas = {staple: int(value) for staple, value in exact.items()}
+    remaining = slot_count - sum(quotas.values())
+    for staple in sorted(STAPLES, key=lambda s: -(exact[s] - quotas[s]))[:remaining]:
+        quotas[staple] += 1
+    return quotas
+
+
+def slot_cost(meal_type, recipe, rank):
+    # 小さいほど良い。朝食は材料が少ないほど、夕食は多いほど良く、ランキング上位を少し優先する
+    effort = len(recipe.get("recipeMaterial", []))
+    if meal_type == "朝食":
+        cost = effort
+    elif meal_type == "夕食":
+        cost = -effort
+    else:
+        cost = 0
+    return cost + rank * RANK_WEIGHT
+
+
+class _Plan:
+    def __init__(self, recipes, threshold):
+        self.recipes = recipes
+        self.threshold = threshold
+        self.assigned = {}
+        self._similar = {}
+
+    def similar(self, a, b):
+        key = (a, b) if a < b else (b, a)
+        if key not in self._similar:
+            self._similar[key] = a == b or title_similarity(
+                self.recipes[a]["recipeTitle"], self.recipes[b]["recipeTitle"]) >= self.threshold
+        return self._similar[key]
+
+    def conflicts(self, index, ignore_slot=None):
+        return any(self.similar(index, other) for slot, other in self.assigned.items() if slot != ignore_slot)
+
+
+def solve_meal_plan(recipes, meal_types, dates, rice_ratio, bread_ratio, noodle_ratio, threshold=SIMILAR_TITLE_THRESHOLD):
+    # {日付: {食事タイプ: レシピの番号（1始まり）}} を返す
+    # 条件を満たせない枠は、主食の比重 → 似た料理の順に条件を緩めて埋め、それでも埋まらなければ空のまま
+    slots = [(date, meal_type) for date in dates for meal_type in meal_types]
+    staples = [staple_of(recipe) for recipe in recipes]
+    allowed = [i for i, recipe in enumerate(recipes) if not is_excluded(recipe)]
+    quotas = staple_quotas(len(slots), rice_ratio, bread_ratio, noodle_ratio)
+    costs = {(slot, i): slot_cost(slot[1], recipes[i], i) for slot in slots for i in range(len(recipes))}
+    plan = _Plan(recipes, threshold)
+
+    pairs = sorted(((slot, i) for slot in slots for i in allowed), key=lambda pair: costs[pair])
+    used_staples = dict.fromkeys(STAPLES, 0)
+    for use_quota, use_similarity in ((True, True), (False, True), (False, False)):
+        for slot, i in pairs:
+            if slot in plan.assigned or i in plan.assigned.values():
+                continue
+            if use_quota and quotas is not None and used_staples[staples[i]] >= quotas[staples[i]]:
+                continue
+            if use_similarity and plan.conflicts(i):
+                continue
+            plan.assigned[slot] = i
+            used_staples[staples[i]] += 1
+
+    _improve(plan, slots, allowed, staples, costs)
+    result = {date: {} for date in dates}
+    for (date, meal_type), i in plan.assigned.items():
+        result[date][meal_type] = i + 1
+    return {date: {meal_type: meals[meal_type] for meal_type in meal_types if meal_type in meals}
+            for date, meals in result.items()}
+
+
+def _improve(plan, slots, allowed, staples, costs):
+    # 枠どうしの入れ替えと、使っていない同じ主食のレシピへの差し替えで合計コストを下げる
+    # どちらの操作も主食ごとの品数と「似た料理なし」を保つ
+    for _ in range(MAX_SEARCH_ROUNDS):
+        improved = False
+        filled = [slot for slot in slots if slot in plan.assigned]
+        for a_pos, a in enumerate(filled):
+            for b in filled[a_pos + 1:]:
+                ra, rb = plan.assigned[a], plan.assigned[b]
+                if costs[(a, rb)] + costs[(b, ra)] < costs[(a, ra)] + costs[(b, rb)]:
+                    plan.assigned[a], plan.assigned[b] = rb, ra
+                    improved = True
+        used = set(plan.assigned.values())
+        for slot in filled:
+            current = plan.assigned[slot]
+            for i in allowed:
+                if i in used or staples[i] != staples[current] or costs[(slot, i)] >= costs[(slot, current)]:
+                    continue
+                if plan.conflicts(i, ignore_slot=slot):
+                    continue
+                used.discard(current)
+                used.add(i)
+                plan.assigned[slot] = current = i
+                improved = True
+        if not improved:
+            break
+
+
+def local_reason(meal_type, recipe):
+    # モデルを使わない場合の短い理由
+    label = STAPLE_LABELS[staple_of(recipe)]
+    count = len(recipe.get("recipeMaterial", []))
+    if meal_type == "朝食":
+        return f"材料が{count}品と少なく、朝に手早く作れる{label}です。"
+    if meal_type == "夕食":
+        return f"材料を{count}品使う手の込んだ{label}で、夕食に向いています。"
+    return f"他の日と重ならない{label}です。"
@@ -0,0 +1,81 @@
+# カテゴリ表の全カテゴリについて楽天のランキングを取得し、ローカルのランキングキャッシュとレシピストアに保存する
+# 夜間に cron などから実行する想定。レート制限は画面と同じ設定（RAKUTEN_QPS）に従う
+#   python prewarm.py                 取得から RAKUTEN_PREWARM_MAX_AGE 秒以上たったカテゴリだけを取り直す
+#   python prewarm.py --force         全カテゴリを取り直す
+#   python prewarm.py --root 10 --root 14   指定した大カテゴリの配下だけ
+#   python prewarm.py --rebuild-store       キャッシュ済みの全カテゴリをレシピストアに取り込み直す
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from settings import RAKUTEN_MAX_WORKERS, RAKUTEN_PREWARM_MAX_AGE
+from clients import load_category_data, get_ranking_cache, get_rakuten_client, get_recipe_store
+from rakuten import fetch_ranking
+from generation import fetch_recipe_ranking
+
+
+def prewarm_targets(categories, fetched_times, max_age, roots=None, now=None):
+    # 取り直すカテゴリを、未取得のもの → 取得が古いものの順に並べる
+    now = time.time() if now is None else now
+    if roots:
+        category_ids = [category_id for root in roots for category_id in [root] + categories.descendants(root)]
+    else:
+        category_ids = categories.ids
+    targets = [category_id for category_id in category_ids
+               if now - fetched_times.get(category_id, 0) >= max_age]
+    return sorted(targets, key=lambda category_id: fetched_times.get(category_id, 0))
+
+
+def prewarm(category_ids, cache, store=None, max_workers=RAKUTEN_MAX_WORKERS, report_every=50):
+    # 取得できたものだけを保存する（失敗したカテゴリは前回のデータを残す）
+    # ランキングが変わったカテゴリと、まだストアにないカテゴリだけをレシピストアに取り込む
+    counts = {"changed": 0, "unchanged": 0, "errors": 0}
+    stored = store.categories() if store is not None else set()
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        results = executor.map(lambda category_id: fetch_ranking(category_id, fetch_recipe_ranking), category_ids)
+        for i, result in enumerate(results, 1):
+            if result["error"]:
+                counts["errors"] += 1
+                print(f"{result['category_id']}: {result['error']}", file=sys.stderr)
+            else:
+                changed = cache.put(result["category_id"], result["recipes"])
+                counts["changed" if changed else "unchanged"] += 1
+                if store is not None and (changed or result["category_id"] not in stored):
+                    store.ingest(result["category_id"], result["recipes"])
+            if i % report_every == 0 or i == len(category_ids):
+                print(f"{i}/{len(category_ids)} 件 ({time.monotonic() - start:.0f}秒) {counts}")
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="楽天レシピのカテゴリ別ランキングを事前に取得する")
+    parser.add_argument("--force", action="store_true", help="取得時刻に関係なく全カテゴリを取り直す")
+    parser.add_argument("--max-age", type=int, default=RAKUTEN_PREWARM_MAX_AGE, help="この秒数より前に取得したカテゴリを取り直す")
+    parser.add_argument("--root", action="append", help="この大カテゴリの配下だけを対象にする（複数指定可）")
+    parser.add_argument("--limit", type=int, help="1回で取得するカテゴリ数の上限")
+    parser.add_argument("--rebuild-store", action="store_true", help="取得せずに、キャッシュからレシピストアを作り直す")
+    args = parser.parse_args(argv)
+
+    categories = load_category_data()
+    cache = get_ranking_cache()
+    store = get_recipe_store()
+    if args.rebuild_store:
+        print(f"{store.rebuild(cache)} カテゴリを取り込みました {store.stats()}")
+        return 0
+    targets = prewarm_targets(categories, cache.fetched_times(), 0 if args.force else args.max_age, args.root)
+    if args.limit is not None:
+        targets = targets[:args.limit]
+    print(f"{len(targets)} / {len(categories)} カテゴリを取得します")
+    if not targets:
+        return 0
+
+    counts = prewarm(targets, cache, store)
+    print(f"完了: {counts} 楽天API: {get_rakuten_client().stats()} レシピストア: {store.stats()}")
+    # 1件も取得できなかったときだけ失敗として終了する
+    return 1 if counts["errors"] == len(targets) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
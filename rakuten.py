@@ -0,0 +1,196 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+
+from tracing import METRICS
+
+# 楽天レシピAPIのアプリIDごとのリクエスト上限（目安: 1秒に1回）
+DEFAULT_QPS = 1.0
+DEFAULT_BURST = 1
+DEFAULT_MAX_WORKERS = 4
+
+RANKING_URL = "https://app.rakuten.co.jp/services/api/Recipe/CategoryRanking/20170426"
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF = 0.5  # 秒。試行ごとに2倍にし、0〜その値のあいだでランダムに待つ
+DEFAULT_MAX_BACKOFF = 8.0
+DEFAULT_MAX_RETRY_WAIT = 60.0  # 秒。Retry-After がこれより長ければ再試行せずに失敗にする
+
+
+class RateLimiter:
+    # トークンバケット方式のレートリミッター（スレッドセーフ）
+    # トークンを前借りで予約するので、同時に呼ばれても順番に待ち時間が割り当てられる
+    def __init__(self, qps=DEFAULT_QPS, burst=DEFAULT_BURST):
+        if qps <= 0:
+            raise ValueError("qps は正の値を指定してください")
+        self.qps = float(qps)
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.qps)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.qps if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+def parse_category_ids(category_ids, limit=20):
+    # "10-275, 14-121,..." のような文字列から重複と空要素を除いたIDのリストを作る
+    if isinstance(category_ids, str):
+        category_ids = category_ids.split(",")
+    ids = []
+    for category_id in category_ids:
+        category_id = category_id.strip()
+        if category_id and category_id not in ids:
+            ids.append(category_id)
+    return ids[:limit]
+
+
+def fetch_ranking(category_id, fetch, limiter=None, cache=None):
+    # 1カテゴリ分を取得し {"category_id", "recipes", "elapsed", "waited", "cache", "error"} の辞書を返す
+    # cache を渡すとキャッシュを読み通し、実際に通信するときだけレート制限を受ける
+    # limiter=None のときは fetch 側（RakutenClient など）でレート制限を行う前提
+    start = time.monotonic()
+    waited = 0.0
+
+    def limited_fetch(category_id):
+        nonlocal waited
+        if limiter is not None:
+            waited = limiter.acquire()
+        return fetch(category_id)
+
+    try:
+        if cache is not None:
+            recipes, state = cache.get_or_fetch(category_id, limited_fetch)
+        else:
+            recipes, state = limited_fetch(category_id), None
+        error = None
+    except Exception as e:
+        recipes, state = [], None
+        error = str(e)
+    return {
+        "category_id": category_id,
+        "recipes": recipes,
+        "elapsed": time.monotonic() - start,
+        "waited": waited,
+        "cache": state,
+        "error": error,
+    }
+
+
+def fetch_rankings(category_ids, fetch, limiter, max_workers=DEFAULT_MAX_WORKERS, cache=None):
+    # fetch_ranking を並列に呼び出し、要求された順番で結果を返す
+    if not category_ids:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(category_ids)))) as executor:
+        return list(executor.map(lambda category_id: fetch_ranking(category_id, fetch, limiter, cache), category_ids))
+
+
+def retry_delay(attempt, retry_after=None, backoff=DEFAULT_BACKOFF, max_backoff=DEFAULT_MAX_BACKOFF,
+                max_wait=DEFAULT_MAX_RETRY_WAIT):
+    # ジッター付きの指数バックオフ。Retry-After があれば、指定どおりの時間まで待つ
+    # Retry-After が max_wait を超えるときは、早すぎる再試行をしないように None（再試行しない）を返す
+    delay = random.uniform(0, min(max_backoff, backoff * (2 ** attempt)))
+    if retry_after:
+        try:
+            wait = float(retry_after)
+        except ValueError:
+            try:
+                wait = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                wait = 0.0
+        if max_wait is not None and wait > max_wait:
+            return None
+        delay = max(delay, wait)
+    return delay
+
+
+class RakutenClient:
+    # 楽天レシピAPIのクライアント。keep-alive の Session を使い回し、
+    # 429・5xx・通信エラーはジッター付きの指数バックオフで再試行する（試行ごとにレート制限を受ける）
+    def __init__(self, application_id, limiter=None, max_retries=DEFAULT_MAX_RETRIES, timeout=10,
+                 pool_size=DEFAULT_MAX_WORKERS, backoff=DEFAULT_BACKOFF, max_backoff=DEFAULT_MAX_BACKOFF,
+                 max_retry_wait=DEFAULT_MAX_RETRY_WAIT):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self._requests = requests
+        self.application_id = application_id
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_wait = max_retry_wait
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+        self._lock = threading.Lock()
+        self._totals = {"requests": 0, "retries": 0, "failures": 0}
+        self._categories = {}
+
+    def _record(self, category_id, key, amount=1):
+        METRICS.inc("rakuten_wait_seconds_total" if key == "waited" else f"rakuten_{key}_total", amount)
+        with self._lock:
+            if key in self._totals:
+                self._totals[key] += amount
+            stats = self._categories.setdefault(category_id, {"requests": 0, "retries": 0, "failures": 0, "waited": 0.0})
+            stats[key] += amount
+
+    def ranking(self, category_id, hits=10):
+        category_id = category_id.strip()
+        params = {
+            "applicationId": self.application_id,
+            "categoryId": category_id,
+            "format": "json",
+            "elements": "recipeTitle,recipeUrl,recipeMaterial",
+            "hits": hits,
+        }
+        for attempt in range(self.max_retries + 1):
+            if self.limiter is not None:
+                self._record(category_id, "waited", self.limiter.acquire())
+            self._record(category_id, "requests")
+            try:
+                response = self.session.get(RANKING_URL, params=params, timeout=self.timeout)
+            except (self._requests.exceptions.ConnectionError, self._requests.exceptions.Timeout):
+                if attempt >= self.max_retries:
+                    self._record(category_id, "failures")
+                    raise
+                self._record(category_id, "retries")
+                time.sleep(retry_delay(attempt, None, self.backoff, self.max_backoff))
+                continue
+
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                delay = retry_delay(attempt, response.headers.get("Retry-After"), self.backoff, self.max_backoff,
+                                    self.max_retry_wait)
+                if delay is not None:
+                    self._record(category_id, "retries")
+                    time.sleep(delay)
+                    continue
+                # 待つように言われた時間が長すぎるので、すぐに失敗として返す（下の raise_for_status で例外になる）
+            try:
+                response.raise_for_status()
+                return response.json().get("result", [])
+            except (self._requests.exceptions.HTTPError, ValueError):
+                self._record(category_id, "failures")
+                raise
+
+    def category_stats(self, category_id):
+        with self._lock:
+            return dict(self._categories.get(category_id.strip(), {}))
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._totals)
+            stats["failed_categories"] = {
+                category_id: s["failures"] for category_id, s in self._categories.items() if s["failures"]
+            }
+        return stats
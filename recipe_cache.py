@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_TTL = 3600  # この秒数以内のデータは新鮮とみなす
+DEFAULT_MAX_STALE = 7 * 24 * 3600  # TTL切れ後もこの秒数までは古いデータを返しつつ裏で更新する
+
+
+class RankingCache:
+    # カテゴリIDごとの楽天ランキング結果をSQLiteに保存するキャッシュ
+    # プロセスを再起動しても残り、複数プロセスから同じファイルを共有できる
+    # offline=True なら保存済みのデータだけを年齢に関係なく返し、通信しない（事前取得した前提）
+    def __init__(self, path, ttl=DEFAULT_TTL, max_stale=DEFAULT_MAX_STALE, refresh_workers=2, offline=False):
+        self.path = path
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.offline = offline
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rankings ("
+            " category_id TEXT PRIMARY KEY,"
+            " payload TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL,"
+            " digest TEXT,"
+            " changed_at REAL)"
+        )
+        # 変更検出用の列がない古いファイルには列を足す
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(rankings)")}
+        for column, kind in (("digest", "TEXT"), ("changed_at", "REAL")):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE rankings ADD COLUMN {column} {kind}")
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._refresher = ThreadPoolExecutor(max_workers=refresh_workers)
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "errors": 0, "unchanged": 0}
+
+    def _count(self, key):
+        with self._lock:
+            self._stats[key] += 1
+
+    def lookup(self, category_id):
+        # (recipes, 状態) を返す。状態は "fresh" / "stale" / "miss"
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, fetched_at FROM rankings WHERE category_id = ?", (category_id,)
+            ).fetchone()
+        if row is None:
+            return None, "miss"
+        age = time.time() - row[1]
+        if age <= self.ttl or self.offline:
+            return json.loads(row[0]), "fresh"
+        if age <= self.ttl + self.max_stale:
+            return json.loads(row[0]), "stale"
+        return None, "miss"
+
+    def put(self, category_id, recipes):
+        # 保存し、内容が変わったかどうかを返す
+        # ランキングが前回と同じなら本文は書き換えず、取得時刻だけを更新する
+        payload = json.dumps(recipes, ensure_ascii=False, separators=(",", ":"))
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT digest FROM rankings WHERE category_id = ?", (category_id,)).fetchone()
+            if row is not None and row[0] == digest:
+                self._conn.execute("UPDATE rankings SET fetched_at = ? WHERE category_id = ?", (now, category_id))
+                self._stats["unchanged"] += 1
+                changed = False
+            else:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO rankings (category_id, payload, fetched_at, digest, changed_at) VALUES (?, ?, ?, ?, ?)",
+                    (category_id, payload, now, digest, now),
+                )
+                changed = True
+            self._conn.commit()
+        return changed
+
+    def rankings(self):
+        # 保存済みの (カテゴリID, recipes) をすべて返す
+        with self._lock:
+            rows = self._conn.execute("SELECT category_id, payload FROM rankings").fetchall()
+        for category_id, payload in rows:
+            yield category_id, json.loads(payload)
+
+    def fetched_times(self):
+        # {カテゴリID: 最後に取得した時刻} をまとめて返す
+        with self._lock:
+            return dict(self._conn.execute("SELECT category_id, fetched_at FROM rankings"))
+
+    def get_or_fetch(self, category_id, fetch):
+        # キャッシュを読み通し、(recipes, 状態) を返す
+        # 古いデータはそのまま返し、バックグラウンドで1度だけ再取得する
+        recipes, state = self.lookup(category_id)
+        if state == "fresh":
+            self._count("hits")
+            return recipes, state
+        if state == "stale":
+            self._count("stale_hits")
+            self._refresh_async(category_id, fetch)
+            return recipes, state
+        self._count("misses")
+        if self.offline:
+            return [], state
+        recipes = fetch(category_id)
+        self.put(category_id, recipes)
+        return recipes, state
+
+    def _refresh_async(self, category_id, fetch):
+        with self._lock:
+            if category_id in self._refreshing:
+                return
+            self._refreshing.add(category_id)
+
+        def refresh():
+            try:
+                self.put(category_id, fetch(category_id))
+                self._count("refreshes")
+            except Exception:
+                self._count("errors")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(category_id)
+
+        self._refresher.submit(refresh)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = self._conn.execute("SELECT COUNT(*) FROM rankings").fetchone()[0]
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["hits"] + stats["stale_hits"]) / lookups, 3) if lookups else 0.0
+        return stats
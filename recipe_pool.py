@@ -0,0 +1,123 @@
+import re
+import unicodedata
+
+from category_search import EXCLUDED_ROOTS
+
+# 献立に入れない料理（カテゴリ検索で外している大カテゴリと同じ扱いにする）
+EXCLUDED_KEYWORDS = (
+    "サラダ", "味噌汁", "みそ汁", "お味噌汁", "ケーキ", "クッキー", "プリン", "ゼリー", "マフィン", "タルト",
+    "スイーツ", "デザート", "アイス", "おやつ",
+)
+
+# 全角記号・装飾文字・括弧内の補足を除いてタイトルを比較する
+_BRACKET_PATTERN = re.compile(r"[【\[（(「『〈《].*?[】\]）)」』〉》]")
+_SYMBOL_PATTERN = re.compile(r"[\s\W_]+")
+_RECIPE_NO_PATTERN = re.compile(r"^\s*\[?\s*(?:No\.?|NO\.?|no\.?)?\s*(\d+)\s*\]?\s*[.．、:：)]?\s*")
+
+
+def normalize_title(title):
+    title = unicodedata.normalize("NFKC", title or "").lower()
+    title = _BRACKET_PATTERN.sub("", title)
+    return _SYMBOL_PATTERN.sub("", title)
+
+
+def is_excluded(recipe):
+    # サラダ・お菓子などの大カテゴリのレシピか、タイトルがそれらの料理のもの
+    category_id = recipe.get("categoryId")
+    if category_id and category_id.split("-")[0] in EXCLUDED_ROOTS:
+        return True
+    title = unicodedata.normalize("NFKC", recipe.get("recipeTitle", ""))
+    return any(word in title for word in EXCLUDED_KEYWORDS)
+
+
+def dedupe_recipes(recipes):
+    # カテゴリをまたいで重複するレシピを、URLと正規化したタイトルで取り除く（先に出たものを残す）
+    seen_urls = set()
+    seen_titles = set()
+    unique = []
+    for recipe in recipes:
+        url = recipe.get("recipeUrl")
+        title = normalize_title(recipe.get("recipeTitle", ""))
+        if (url and url in seen_urls) or (title and title in seen_titles):
+            continue
+        if url:
+            seen_urls.add(url)
+        if title:
+            seen_titles.add(title)
+        unique.append(recipe)
+    return unique
+
+
+def title_similarity(a, b):
+    # 正規化したタイトルの文字 bigram の Jaccard 係数
+    a, b = normalize_title(a), normalize_title(b)
+    if not a or not b:
+        return 0.0
+    if a == b:
+        return 1.0
+    grams_a = {a[i:i + 2] for i in range(max(1, len(a) - 1))}
+    grams_b = {b[i:i + 2] for i in range(max(1, len(b) - 1))}
+    return len(grams_a & grams_b) / len(grams_a | grams_b)
+
+
+def estimate_tokens(text):
+    # おおよそのトークン数（英数字は4文字で1トークン、日本語は1文字1トークンとみなす）
+    ascii_chars = sum(1 for c in text if ord(c) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars)
+
+
+def format_recipe_line(number, recipe, material_limit=None):
+    materials = recipe.get("recipeMaterial", [])
+    if material_limit is not None and len(materials) > material_limit:
+        materials = materials[:material_limit]
+    return f"{number}. {recipe['recipeTitle']} - 材料: {', '.join(materials)}"
+
+
+def format_recipe_list(recipes, token_budget=None, min_materials=3):
+    # レシピ番号・タイトル・材料だけの一覧を作る（URLは番号から後で引く）
+    # token_budget を超える場合は、材料を先頭から数えて少しずつ切り詰める
+    lines = [format_recipe_line(i + 1, recipe) for i, recipe in enumerate(recipes)]
+    text = "\n".join(lines)
+    if token_budget is None or estimate_tokens(text) <= token_budget:
+        return text
+
+    longest = max((len(recipe.get("recipeMaterial", [])) for recipe in recipes), default=0)
+    for limit in range(longest - 1, min_materials - 1, -1):
+        text = "\n".join(format_recipe_line(i + 1, recipe, limit) for i, recipe in enumerate(recipes))
+        if estimate_tokens(text) <= token_budget:
+            break
+    return text
+
+
+def find_recipe_no(recipe_text):
+    match = _RECIPE_NO_PATTERN.match(recipe_text)
+    return int(match.group(1)) if match else None
+
+
+def find_recipe(recipe_text, recipes):
+    # "12.鶏の照り焼き" のような出力から、番号（なければタイトル）でレシピを探す
+    match = _RECIPE_NO_PATTERN.match(recipe_text)
+    if match:
+        number = int(match.group(1))
+        if 1 <= number <= len(recipes):
+            return recipes[number - 1]
+    title = normalize_title(_RECIPE_NO_PATTERN.sub("", recipe_text))
+    if title:
+        for recipe in recipes:
+            if normalize_title(recipe.get("recipeTitle", "")) == title:
+                return recipe
+    return None
+
+
+def attach_recipe_details(meal_plan, recipes):
+    # 解析済みの献立に、レシピ番号からURLと材料を埋める
+    for meals in meal_plan.values():
+        for meal_info in meals.values():
+            recipe = find_recipe(meal_info.get("recipe", ""), recipes)
+            if recipe is None:
+                continue
+            if not meal_info.get("url"):
+                meal_info["url"] = recipe.get("recipeUrl", "")
+            if not meal_info.get("materials"):
+                meal_info["materials"] = ", ".join(recipe.get("recipeMaterial", []))
+    return meal_plan
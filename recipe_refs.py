@@ -0,0 +1,61 @@
+# セッションに献立を小さく持たせるための、プロセス全体で共有するレシピの参照
+# URL と材料はセッションごとに複製せず、同じレシピなら同じオブジェクトを指す
+# 参照しているセッションがなくなれば、共有側からも自動で消える
+import sys
+import threading
+import weakref
+
+
+class RecipeRef:
+    __slots__ = ("url", "materials", "__weakref__")
+
+    def __init__(self, url, materials):
+        self.url = url
+        self.materials = materials
+
+
+class RecipeRefs:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._refs = weakref.WeakValueDictionary()
+
+    def get(self, url, materials):
+        url = sys.intern(url or "")
+        materials = sys.intern(materials or "")
+        key = (url, materials)
+        with self._lock:
+            ref = self._refs.get(key)
+            if ref is None:
+                ref = RecipeRef(url, materials)
+                self._refs[key] = ref
+        return ref
+
+    def stats(self):
+        with self._lock:
+            return {"recipes": len(self._refs)}
+
+
+def compact_meal_plan(meal_plan, refs):
+    # {日付: {区分: (レシピ名, 理由, RecipeRef)}} にする。レシピ名・日付・区分も intern して共有する
+    return {
+        sys.intern(date): {
+            sys.intern(meal_type): (
+                sys.intern(meal_info.get("recipe", "")),
+                meal_info.get("reason", ""),
+                refs.get(meal_info.get("url"), meal_info.get("materials")),
+            )
+            for meal_type, meal_info in meals.items()
+        }
+        for date, meals in meal_plan.items()
+    }
+
+
+def expand_meal_plan(compact):
+    # 表示・保存・書き出しのときだけ、元の辞書の形に戻す
+    return {
+        date: {
+            meal_type: {"recipe": recipe, "reason": reason, "materials": ref.materials, "url": ref.url}
+            for meal_type, (recipe, reason, ref) in meals.items()
+        }
+        for date, meals in compact.items()
+    }
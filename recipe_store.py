@@ -0,0 +1,162 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from materials import normalize_material
+
+
+def _fts_phrase(text):
+    # FTS5 の検索式に入れる語を二重引用符でくくる
+    return '"' + text.replace('"', '""') + '"'
+
+
+class RecipeStore:
+    # 取得済みのレシピをSQLiteに保存し、タイトル・材料の全文検索とカテゴリでの絞り込みを行う
+    # 全文検索は FTS5 の trigram を使う（3文字未満の語は部分一致で探す）
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS recipes ("
+            " id INTEGER PRIMARY KEY,"
+            " url TEXT NOT NULL UNIQUE,"
+            " title TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS recipe_categories ("
+            " category_id TEXT NOT NULL,"
+            " recipe_id INTEGER NOT NULL,"
+            " rank INTEGER NOT NULL,"
+            " PRIMARY KEY (category_id, recipe_id))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS recipe_categories_recipe ON recipe_categories (recipe_id)")
+        # rowid を recipes.id とそろえる
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS recipes_fts USING fts5(title, materials, tokenize='trigram')"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def ingest(self, category_id, recipes):
+        # カテゴリのランキングを入れ替える（以前のランキングにだけあったレシピの所属は外す）
+        now = time.time()
+        with self._lock:
+            self._conn.execute("DELETE FROM recipe_categories WHERE category_id = ?", (category_id,))
+            for rank, recipe in enumerate(recipes, 1):
+                url = recipe.get("recipeUrl")
+                if not url:
+                    continue
+                title = recipe.get("recipeTitle", "")
+                payload = json.dumps(recipe, ensure_ascii=False)
+                materials = " ".join(normalize_material(m) for m in recipe.get("recipeMaterial", []))
+                row = self._conn.execute("SELECT id FROM recipes WHERE url = ?", (url,)).fetchone()
+                if row is None:
+                    recipe_id = self._conn.execute(
+                        "INSERT INTO recipes (url, title, payload, updated_at) VALUES (?, ?, ?, ?)",
+                        (url, title, payload, now),
+                    ).lastrowid
+                else:
+                    recipe_id = row[0]
+                    self._conn.execute(
+                        "UPDATE recipes SET title = ?, payload = ?, updated_at = ? WHERE id = ?",
+                        (title, payload, now, recipe_id),
+                    )
+                    self._conn.execute("DELETE FROM recipes_fts WHERE rowid = ?", (recipe_id,))
+                self._conn.execute(
+                    "INSERT INTO recipes_fts (rowid, title, materials) VALUES (?, ?, ?)",
+                    (recipe_id, title, materials),
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO recipe_categories (category_id, recipe_id, rank) VALUES (?, ?, ?)",
+                    (category_id, recipe_id, rank),
+                )
+            self._conn.commit()
+
+    def rebuild(self, cache):
+        # ランキングキャッシュに保存済みの全カテゴリを取り込み直す
+        count = 0
+        for category_id, recipes in cache.rankings():
+            self.ingest(category_id, recipes)
+            count += 1
+        return count
+
+    def categories(self):
+        # レシピが保存されているカテゴリID
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT DISTINCT category_id FROM recipe_categories")}
+
+    def by_categories(self, category_ids, per_category=10):
+        # {カテゴリID: レシピのリスト（ランキング順）} を1回の問い合わせで返す
+        if not category_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in category_ids)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT c.category_id, r.payload FROM recipe_categories c JOIN recipes r ON r.id = c.recipe_id"
+                f" WHERE c.category_id IN ({placeholders}) AND c.rank <= ? ORDER BY c.category_id, c.rank",
+                (*category_ids, per_category),
+            ).fetchall()
+        found = {}
+        for category_id, payload in rows:
+            found.setdefault(category_id, []).append(json.loads(payload))
+        return found
+
+    def search(self, keywords=(), materials=(), exclude_materials=(), roots=(), limit=100):
+        # キーワード（タイトルか材料）・材料・大カテゴリで絞り込む。条件はすべて AND
+        #   search(materials=["豚"])     豚肉を使うレシピ
+        #   search(roots=["15", "16"])   麺類のカテゴリに入っているレシピ
+        conditions = []
+        params = []
+        for keyword in keywords:
+            conditions.append(self._text_condition(None, keyword, params))
+        for material in materials:
+            conditions.append(self._text_condition("materials", normalize_material(material), params))
+        for material in exclude_materials:
+            conditions.append("NOT " + self._text_condition("materials", normalize_material(material), params))
+        if roots:
+            conditions.append(
+                "f.rowid IN (SELECT recipe_id FROM recipe_categories WHERE "
+                + " OR ".join("category_id = ? OR category_id LIKE ?" for _ in roots) + ")"
+            )
+            for root in roots:
+                params.extend([root, f"{root}-%"])
+
+        # 順位の良いカテゴリに入っているものから返す
+        sql = (
+            "SELECT r.payload FROM recipes_fts f JOIN recipes r ON r.id = f.rowid"
+            " JOIN (SELECT recipe_id, MIN(rank) AS best FROM recipe_categories GROUP BY recipe_id) c ON c.recipe_id = f.rowid"
+        )
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY c.best, r.title LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    @staticmethod
+    def _text_condition(column, text, params):
+        if len(text) >= 3:
+            query = _fts_phrase(text) if column is None else f"{column} : {_fts_phrase(text)}"
+            params.append(query)
+            return "f.rowid IN (SELECT rowid FROM recipes_fts WHERE recipes_fts MATCH ?)"
+        # trigram のテーブルでは3文字未満の LIKE が一致しないことがあるので instr で探す
+        params.append(text)
+        if column is None:
+            params.append(text)
+            return "(instr(f.title, ?) > 0 OR instr(f.materials, ?) > 0)"
+        return f"instr(f.{column}, ?) > 0"
+
+    def stats(self):
+        with self._lock:
+            recipes = self._conn.execute("SELECT COUNT(*) FROM recipes").fetchone()[0]
+            categories = self._conn.execute("SELECT COUNT(DISTINCT category_id) FROM recipe_categories").fetchone()[0]
+        return {"recipes": recipes, "categories": categories}
@@ -0,0 +1,116 @@
+import os
+
+from dotenv import load_dotenv
+
+# .env ファイルから環境変数を読み込む
+load_dotenv()
+
+# Gemini のモデルと生成設定
+MODEL_NAME = "gemini-2.5-flash-preview-04-17"
+
+generation_config = {
+    "temperature": 0.9,
+    "top_p": 0.95,
+    "top_k": 64,
+    "max_output_tokens": 8192,
+}
+
+# Gemini を同時に呼び出す数の上限（0なら制限しない）
+GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "0"))
+
+# 楽天APIのレート制限（アプリIDごとの上限に合わせる。全セッションで共有）
+RAKUTEN_QPS = float(os.getenv("RAKUTEN_QPS", "1"))
+RAKUTEN_BURST = int(os.getenv("RAKUTEN_BURST", "1"))
+RAKUTEN_MAX_WORKERS = int(os.getenv("RAKUTEN_MAX_WORKERS", "4"))
+# 429・5xx・通信エラーのときの再試行回数
+RAKUTEN_MAX_RETRIES = int(os.getenv("RAKUTEN_MAX_RETRIES", "3"))
+# Retry-After がこの秒数より長いときは、待たずにそのカテゴリを失敗にする
+RAKUTEN_MAX_RETRY_WAIT = float(os.getenv("RAKUTEN_MAX_RETRY_WAIT", "60"))
+
+# カテゴリごとのランキングをディスクにキャッシュする（再起動後も再利用）
+RAKUTEN_CACHE_PATH = os.getenv("RAKUTEN_CACHE_PATH", os.path.join(".cache", "rakuten_rankings.sqlite3"))
+RAKUTEN_CACHE_TTL = int(os.getenv("RAKUTEN_CACHE_TTL", "3600"))
+RAKUTEN_CACHE_MAX_STALE = int(os.getenv("RAKUTEN_CACHE_MAX_STALE", str(7 * 24 * 3600)))
+# 1 にすると画面からの要求では通信せず、prewarm.py で事前に取得したデータだけを使う
+RAKUTEN_OFFLINE = os.getenv("RAKUTEN_OFFLINE", "0") == "1"
+# prewarm.py はこの秒数より前に取得したカテゴリだけを取り直す
+RAKUTEN_PREWARM_MAX_AGE = int(os.getenv("RAKUTEN_PREWARM_MAX_AGE", str(20 * 3600)))
+
+# 全文検索できるローカルのレシピストア（prewarm.py で取り込む）
+#   RECIPE_SOURCE="store" ならカテゴリのレシピをストアから1回の問い合わせで読み、ないカテゴリだけ楽天から取得する
+RECIPE_STORE_PATH = os.getenv("RECIPE_STORE_PATH", os.path.join(".cache", "recipes.sqlite3"))
+RECIPE_SOURCE = os.getenv("RECIPE_SOURCE", "api")
+
+# カテゴリ選択とレシピ取得の進め方
+#   "async":      選ばれたカテゴリから順に取得を始め、主食のカテゴリは選択を待たずに先読みする
+#   "sequential": カテゴリをすべて選んでからまとめて取得する
+PIPELINE_MODE = os.getenv("PIPELINE_MODE", "async")
+
+# カテゴリ選択の方式
+#   "prefilter":    ローカルで順位付けした上位候補だけをモデルに渡す
+#   "local":        順位付けの確信度が高ければモデルを呼ばずに決める（低ければ prefilter と同じ）
+#   "hierarchical": 大カテゴリ→配下の2段階でモデルに選ばせる
+#   "flat":         全カテゴリを一度に渡す
+CATEGORY_SELECTION_MODE = os.getenv("CATEGORY_SELECTION_MODE", "prefilter")
+TOP_CATEGORY_COUNT = int(os.getenv("TOP_CATEGORY_COUNT", "6"))
+CATEGORY_PREFILTER_TOP_K = int(os.getenv("CATEGORY_PREFILTER_TOP_K", "150"))
+CATEGORY_CONFIDENT_MATCH = float(os.getenv("CATEGORY_CONFIDENT_MATCH", "0.2"))
+CATEGORY_CONFIDENT_COUNT = int(os.getenv("CATEGORY_CONFIDENT_COUNT", "3"))
+
+# select_recipes に渡すレシピ一覧のおおよそのトークン上限（超える分は材料を切り詰める）
+RECIPE_PROMPT_TOKEN_BUDGET = int(os.getenv("RECIPE_PROMPT_TOKEN_BUDGET", "6000"))
+
+# 献立の生成をストリーミングで受け取り、書き終わった日から順にカレンダーを表示する
+MEAL_PLAN_STREAMING = os.getenv("MEAL_PLAN_STREAMING", "1") == "1"
+
+# 献立の出力形式
+#   "text":     見出し付きテキストを解析する
+#   "json":     スキーマ付きの構造化出力
+#   "parallel": 数日ずつ構造化出力で並列に生成してまとめる
+#   "solver":   ローカルのプランナーで割り当てる（主食の比重・似た料理の禁止を必ず守る）
+MEAL_PLAN_FORMAT = os.getenv("MEAL_PLAN_FORMAT", "text")
+# solver のときの理由: "local"（定型文。モデルを呼ばない）または "llm"（理由だけをモデルに書かせる）
+PLANNER_REASONS = os.getenv("PLANNER_REASONS", "local")
+JSON_SECTION_RETRIES = int(os.getenv("JSON_SECTION_RETRIES", "2"))
+
+# parallel のときに1回の呼び出しで作る日数と同時実行数
+DAYS_PER_CALL = max(1, int(os.getenv("DAYS_PER_CALL", "1")))
+PARALLEL_MAX_WORKERS = int(os.getenv("PARALLEL_MAX_WORKERS", "7"))
+
+# 材料まとめの作り方: "local"（選ばれたレシピの材料をローカルで集計）または "llm"（モデルに書かせる）
+MATERIALS_SUMMARY = os.getenv("MATERIALS_SUMMARY", "local")
+
+# Gemini の応答キャッシュ（正規化した要求パラメータをキーにする）
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join(".cache", "llm_responses.sqlite3"))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000"))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+LLM_CACHE_BYPASS = os.getenv("LLM_CACHE_BYPASS", "0") == "1"
+
+# 献立作成のバックグラウンドジョブ（状態と結果はSQLiteに保存し、画面から定期的に確認する）
+JOB_DB_PATH = os.getenv("JOB_DB_PATH", os.path.join(".cache", "jobs.sqlite3"))
+JOB_MAX_WORKERS = int(os.getenv("JOB_MAX_WORKERS", "2"))
+JOB_RETENTION = int(os.getenv("JOB_RETENTION", str(24 * 3600)))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1"))
+# 各プロセスが生存を書き込む間隔（3回分途絶えたプロセスの実行中ジョブは失敗にする）
+JOB_HEARTBEAT = int(os.getenv("JOB_HEARTBEAT", "10"))
+
+# 完成した献立の共有キャッシュ（正規化した条件をキーに、同じサーバーのプロセス間で共有する）
+#   PLAN_CACHE_TTL:   楽天のランキングが変わるので、この秒数より古い献立は使わない
+#   PLAN_CACHE_LEASE: 作成中の印の有効期限。作成中のプロセスが落ちても、この秒数後にほかが引き継ぐ
+PLAN_CACHE_PATH = os.getenv("PLAN_CACHE_PATH", os.path.join(".cache", "plan_results.sqlite3"))
+PLAN_CACHE_MAX_ENTRIES = int(os.getenv("PLAN_CACHE_MAX_ENTRIES", "200"))
+PLAN_CACHE_MAX_BYTES = int(os.getenv("PLAN_CACHE_MAX_BYTES", str(100 * 1024 * 1024)))
+PLAN_CACHE_TTL = int(os.getenv("PLAN_CACHE_TTL", str(24 * 3600)))
+PLAN_CACHE_LEASE = int(os.getenv("PLAN_CACHE_LEASE", "600"))
+
+# 保存した献立の置き場所（期間・要望・レシピ・材料で検索できる）
+PLAN_ARCHIVE_PATH = os.getenv("PLAN_ARCHIVE_PATH", os.path.join("data", "plans.sqlite3"))
+
+# 段階ごとの計測
+#   METRICS_LOG_PATH: 献立を1回作るごとに、段階ごとの時間・トークン数・楽天の呼び出し回数を1行のJSONで追記する（空なら書かない）
+#   METRICS_PORT:     0より大きければ、このポートの /metrics で Prometheus のテキスト形式を返す
+METRICS_LOG_PATH = os.getenv("METRICS_LOG_PATH", os.path.join(".cache", "metrics.jsonl"))
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+
+# まとめて献立を作るときの同時実行数（1週分ずつ並べて処理する）
+BATCH_MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", "4"))
@@ -0,0 +1,67 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("dotenv")  # batch は settings 経由で .env を読む
+
+from batch import SharedCalls
+
+
+def test_same_key_runs_once():
+    shared = SharedCalls()
+    calls = []
+    barrier = threading.Event()
+
+    def slow(value):
+        calls.append(value)
+        barrier.wait(5)
+        return value * 2
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(shared("k", slow, 21))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    barrier.set()
+    for thread in threads:
+        thread.join(5)
+    assert results == [42] * 4
+    assert calls == [21]
+    assert shared("k", slow, 0) == 42
+    assert shared.stats() == {"calls": 5, "unique": 1}
+
+
+def test_failure_is_shared_with_waiters_but_not_remembered():
+    shared = SharedCalls()
+    attempts = []
+    barrier = threading.Event()
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            barrier.wait(5)
+            raise RuntimeError("一時的なエラー")
+        return "ok"
+
+    errors = []
+
+    def call():
+        try:
+            shared("k", flaky)
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    barrier.set()
+    for thread in threads:
+        thread.join(5)
+    # 実行中に待っていた呼び出しは同じ例外を受け取る
+    assert len(errors) == 3 and len(attempts) == 1
+    # 後から呼んだものはやり直して成功し、その結果は共有される
+    assert shared("k", flaky) == "ok"
+    assert shared("k", flaky) == "ok"
+    assert len(attempts) == 2
@@ -0,0 +1,51 @@
+from datetime import date
+
+import pytest
+
+from categories import CATEGORY_FILE, load_category_index
+from category_search import CategoryRanker, char_ngrams, is_confident
+
+TYPICAL_REQUESTS = ["和食メイン", "野菜中心", "簡単な料理", "魚料理多め", "鶏肉を使った料理", "ヘルシー 低カロリー",
+                    "中華", "パスタ", "カレー", "お弁当", "節約"]
+
+
+@pytest.fixture(scope="module")
+def categories():
+    return load_category_index(CATEGORY_FILE)
+
+
+@pytest.fixture(scope="module")
+def ranker(categories):
+    return CategoryRanker(categories)
+
+
+def local_ranking(ranker, user_request, start_date=date(2026, 2, 9)):
+    # generation.select_category_ids の "local" と同じ条件で順位付けする
+    return ranker.rank(user_request, start_date, 50, 25, 25, top_k=20, per_root=4)
+
+
+def test_char_ngrams_skip_unigrams():
+    assert char_ngrams("鶏肉料理") == ["鶏肉", "肉料", "料理", "鶏肉料", "肉料理"]
+    assert char_ngrams("鍋") == ["鍋"]
+
+
+@pytest.mark.parametrize("user_request", TYPICAL_REQUESTS)
+def test_typical_requests_are_confident(ranker, user_request):
+    # "local" で Gemini を呼ばずに決められる
+    assert is_confident(local_ranking(ranker, user_request))
+
+
+def test_unrelated_request_is_not_confident(ranker):
+    assert not is_confident(local_ranking(ranker, "ほげほげ"))
+
+
+def test_short_ranking_is_not_confident():
+    assert not is_confident([("1", 1.0, 1.0)] * 5)
+
+
+def test_sweets_are_not_ranked_in_february(categories, ranker):
+    # 2月の行事カテゴリ（バレンタイン）の下のお菓子は献立の候補にしない
+    for user_request in TYPICAL_REQUESTS:
+        for category_id, _, _ in local_ranking(ranker, user_request):
+            assert "バレンタイン" not in categories.name(category_id)
+            assert "チョコ" not in categories.name(category_id)
@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from llm_cache import ResponseCache
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "responses.sqlite3")
+
+
+def put_all(cache, keys, value="x"):
+    for key in keys:
+        cache.put(key, "test", value)
+        time.sleep(0.01)
+
+
+def test_evicts_least_recently_used_over_max_entries(path):
+    cache = ResponseCache(path, max_entries=3)
+    put_all(cache, ["a", "b", "c"])
+    assert cache.get("a") == "x"
+    time.sleep(0.01)
+    put_all(cache, ["d", "e"])
+    stats = cache.stats()
+    assert stats["entries"] == 3
+    assert stats["evictions"] == 2
+    assert cache.get("b") is None and cache.get("c") is None
+    assert [cache.get(key) for key in ("a", "d", "e")] == ["x", "x", "x"]
+
+
+def test_evicts_over_max_bytes(path):
+    value = "あ" * 100  # JSON で 300 バイト程度
+    cache = ResponseCache(path, max_bytes=1000)
+    put_all(cache, ["a", "b", "c", "d", "e"], value)
+    stats = cache.stats()
+    assert stats["bytes"] <= 1000
+    assert stats["entries"] == 3
+    assert cache.get("a") is None and cache.get("e") == value
+
+
+def test_entry_larger_than_limit_is_not_kept(path):
+    cache = ResponseCache(path, max_bytes=100)
+    cache.put("big", "test", "x" * 200)
+    assert cache.stats()["entries"] == 0
+
+
+def test_invalid_value_is_returned_but_not_stored(path):
+    cache = ResponseCache(path)
+    calls = []
+
+    def generate():
+        calls.append(1)
+        return {"partial": len(calls)}
+
+    def validate(value):
+        return "欠けがあります" if "partial" in value else None
+
+    for n in range(1, 4):
+        assert cache.get_or_generate("k", "plan", generate, validate=validate) == ({"partial": n}, False)
+    assert len(calls) == 3
+    assert cache.stats()["entries"] == 0
+    # 欠けのない値は保存され、次から使われる
+    assert cache.get_or_generate("k", "plan", lambda: {"v": 1}, validate=validate) == ({"v": 1}, False)
+    assert cache.get_or_generate("k", "plan", generate, validate=validate) == ({"v": 1}, True)
+
+
+def test_cached_value_is_reused_unless_bypassed(path):
+    cache = ResponseCache(path)
+    assert cache.get_or_generate("k", "plan", lambda: {"v": 1}) == ({"v": 1}, False)
+    assert cache.get_or_generate("k", "plan", lambda: {"v": 2}) == ({"v": 1}, True)
+    assert cache.get_or_generate("k", "plan", lambda: {"v": 3}, bypass=True) == ({"v": 3}, False)
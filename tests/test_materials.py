@@ -0,0 +1,69 @@
+import pytest
+
+from categories import CATEGORY_FILE, load_category_index
+from materials import MaterialClassifier, aggregate_materials, normalize_material
+
+
+@pytest.fixture(scope="module", params=["categories", "keywords_only"])
+def classifier(request):
+    # カテゴリ表あり（アプリと同じ）となしの両方で同じ区分になること
+    return MaterialClassifier(load_category_index(CATEGORY_FILE) if request.param == "categories" else None)
+
+
+@pytest.mark.parametrize("name, section", [
+    # キーワードの部分一致で誤っていたもの
+    ("牛乳", "卵・大豆・乳製品"),
+    ("うどん", "ごはん・麺・パン"),
+    ("冷凍うどん", "ごはん・麺・パン"),
+    ("卵", "卵・大豆・乳製品"),
+    ("たまご", "卵・大豆・乳製品"),
+    ("豆腐", "卵・大豆・乳製品"),
+    ("絹ごし豆腐", "卵・大豆・乳製品"),
+    ("ご飯", "ごはん・麺・パン"),
+    ("米", "ごはん・麺・パン"),
+    ("チーズ", "卵・大豆・乳製品"),
+    ("ピザ用チーズ", "卵・大豆・乳製品"),
+    ("納豆", "卵・大豆・乳製品"),
+    ("中華麺", "ごはん・麺・パン"),
+    ("スパゲッティ", "ごはん・麺・パン"),
+    ("わかめ", "野菜"),
+    # 語尾・語頭で決まるもの
+    ("鶏もも肉", "肉・魚"),
+    ("豚バラ", "肉・魚"),
+    ("塩鮭", "肉・魚"),
+    ("ツナ缶", "肉・魚"),
+    ("玉ねぎ", "野菜"),
+    ("大豆もやし", "野菜"),
+    ("鶏がらスープの素", "調味料など"),
+    ("鶏ガラスープ", "調味料など"),
+    ("トマトケチャップ", "調味料など"),
+    ("米酢", "調味料など"),
+    ("パン粉", "調味料など"),
+    ("そばつゆ", "調味料など"),
+    ("食パン", "ごはん・麺・パン"),
+])
+def test_classify(classifier, name, section):
+    assert classifier.classify(normalize_material(name)) == section
+
+
+def test_category_names_match_only_whole_words_or_endings():
+    classifier = MaterialClassifier(load_category_index(CATEGORY_FILE))
+    # カテゴリ "うど"（野菜）は "うどん" には一致しない
+    assert classifier.classify("うど") == "野菜"
+    assert classifier.classify("うどん") == "ごはん・麺・パン"
+    assert classifier.classify("エリンギ") == "野菜"
+
+
+def test_aggregate_groups_everyday_items():
+    meal_plan = {"2026-11-02": {
+        "朝食": {"recipe": "卵かけご飯", "materials": "卵,ご飯,しょうゆ"},
+        "夕食": {"recipe": "肉うどん", "materials": "うどん,牛こま切れ肉,長ねぎ,めんつゆ,牛乳,水"},
+    }}
+    lines = aggregate_materials(meal_plan, [], MaterialClassifier())
+    assert lines == [
+        "**肉・魚:**", "牛こま切れ肉: 1品で使用",
+        "**野菜:**", "長ねぎ: 1品で使用",
+        "**卵・大豆・乳製品:**", "卵: 1品で使用", "牛乳: 1品で使用",
+        "**ごはん・麺・パン:**", "うどん: 1品で使用", "ご飯: 1品で使用",
+        "**調味料など:**", "しょうゆ: 1品で使用", "めんつゆ: 1品で使用",
+    ]
@@ -0,0 +1,121 @@
+from datetime import date
+
+from meal_plan import MealPlanParser, merge_day_plans, missing_meals, parse_meal_plan, plan_dates, plan_problem
+
+MEAL_TYPES = ["朝食", "昼食", "夕食"]
+
+
+def plan_text(days=7, meal_types=MEAL_TYPES):
+    lines = ["はい、献立を作りました。", ""]
+    for i, day in enumerate(plan_dates(date(2026, 11, 2), days)):
+        lines.append(f"**{day} (月)**")
+        for meal_type in meal_types:
+            lines += [f"{meal_type}: レシピ{i}-{meal_type}", "理由: 簡単", "材料: 卵、ねぎ", f"URL: https://example.com/{i}/{meal_type}"]
+        lines.append("")
+    lines += ["## 1週間分の材料まとめ:", "- 卵: 21個", "- ねぎ: 3本"]
+    return "\n".join(lines)
+
+
+def full_plan(days=7):
+    plan, _ = parse_meal_plan(plan_text(days), MEAL_TYPES)
+    return plan
+
+
+def test_complete_plan_has_no_problem():
+    assert missing_meals(full_plan(), MEAL_TYPES) == []
+    assert plan_problem(full_plan(), MEAL_TYPES) is None
+
+
+def test_empty_plan_is_a_problem():
+    assert missing_meals({}, MEAL_TYPES) == ["7日分"]
+    assert "7日分" in plan_problem({}, MEAL_TYPES)
+
+
+def test_missing_days_and_meals_are_reported():
+    plan = full_plan(6)
+    first = next(iter(plan))
+    del plan[first]["昼食"]
+    plan[first]["夕食"]["recipe"] = ""
+    assert missing_meals(plan, MEAL_TYPES) == ["1日分", f"{first}の昼食", f"{first}の夕食"]
+
+
+def test_long_problem_list_is_shortened():
+    plan = {day: {} for day in plan_dates(date(2026, 11, 2))}
+    assert "ほか16件" in plan_problem(plan, MEAL_TYPES)
+
+
+def test_only_requested_meal_types_are_required():
+    plan, _ = parse_meal_plan(plan_text(meal_types=["夕食"]), ["夕食"])
+    assert plan_problem(plan, ["夕食"]) is None
+    assert plan_problem(plan, MEAL_TYPES) is not None
+
+
+def test_streamed_chunks_match_whole_text():
+    text = plan_text()
+    whole_plan, whole_summary = parse_meal_plan(text, MEAL_TYPES)
+    parser = MealPlanParser(MEAL_TYPES)
+    completed = []
+    for start in range(0, len(text), 7):
+        completed += parser.feed(text[start:start + 7])
+    completed += parser.finish()
+    assert parser.plan == whole_plan
+    assert parser.materials_summary == whole_summary == ["- 卵: 21個", "- ねぎ: 3本"]
+    assert completed == list(whole_plan)
+
+
+def test_day_is_completed_only_after_the_next_heading():
+    parser = MealPlanParser(MEAL_TYPES)
+    text = plan_text(2)
+    second = text.index("**", text.index("**", text.index("**") + 2) + 2)
+    assert parser.feed(text[:second]) == []
+    assert parser.completed_plan() == {}
+    # 次の日付の見出しが途中で切れていても、行が終わるまでは前の日を閉じない
+    assert parser.feed(text[second:second + 5]) == []
+    assert parser.feed(text[second + 5:second + 20]) == ["2026-11-02"]
+    assert list(parser.completed_plan()) == ["2026-11-02"]
+
+
+def test_truncated_stream_keeps_finished_days():
+    # 途中で切れた応答でも、書き終わった日までは使え、欠けは plan_problem でわかる
+    text = plan_text(3)
+    cut = text.index("昼食: レシピ2") + len("昼食: レシピ2")
+    parser = MealPlanParser(MEAL_TYPES)
+    parser.feed(text[:cut])
+    parser.finish()
+    assert parser.completed_dates == ["2026-11-02", "2026-11-03", "2026-11-04"]
+    assert parser.plan["2026-11-04"]["朝食"]["url"] == "https://example.com/2/朝食"
+    assert parser.plan["2026-11-04"]["昼食"]["recipe"] == "レシピ2"
+    assert missing_meals(parser.plan, MEAL_TYPES) == ["4日分", "2026-11-04の夕食"]
+
+
+def test_lines_before_first_date_and_unknown_lines_are_ignored():
+    parser = MealPlanParser(MEAL_TYPES)
+    parser.feed("朝食: 日付より前\nメモ: なし\n**2026-11-02 (月)**\n**ポイント**\n朝食: トースト\nメモ: 無視\n")
+    parser.finish()
+    assert parser.plan == {"2026-11-02": {"朝食": {"recipe": "トースト", "reason": "", "materials": "", "url": ""}}}
+
+
+def test_replacements_skip_excluded_recipes():
+    # 材料の多いサラダとお菓子があっても、夕食の差し替えには使わない
+    recipes = [
+        {"recipeTitle": "肉じゃが", "categoryId": "31-1", "recipeMaterial": ["牛肉", "じゃがいも"]},
+        {"recipeTitle": "具だくさんシーザーサラダ", "categoryId": "30-1", "recipeMaterial": ["材料"] * 9},
+        {"recipeTitle": "ガトーショコラ", "categoryId": "21-1", "recipeMaterial": ["材料"] * 8},
+        {"recipeTitle": "豚の生姜焼き", "categoryId": "31-2", "recipeMaterial": ["豚肉", "しょうが", "しょうゆ"]},
+    ]
+    dates = ["2026-11-02", "2026-11-03"]
+    day_plans = {date: {"夕食": {"recipe": "1.肉じゃが", "reason": "", "materials": "", "url": ""}} for date in dates}
+    merged = merge_day_plans(day_plans, dates, ["夕食"], recipes)
+    assert merged["2026-11-02"]["夕食"]["recipe"] == "1.肉じゃが"
+    assert merged["2026-11-03"]["夕食"]["recipe"] == "4.豚の生姜焼き"
+
+
+def test_no_replacement_when_only_excluded_recipes_remain():
+    recipes = [
+        {"recipeTitle": "肉じゃが", "categoryId": "31-1", "recipeMaterial": ["牛肉"]},
+        {"recipeTitle": "ポテトサラダ", "categoryId": "18-1", "recipeMaterial": ["じゃがいも"]},
+    ]
+    dates = ["2026-11-02", "2026-11-03"]
+    day_plans = {date: {"夕食": {"recipe": "1.肉じゃが", "reason": "", "materials": "", "url": ""}} for date in dates}
+    merged = merge_day_plans(day_plans, dates, ["夕食"], recipes)
+    assert merged["2026-11-03"]["夕食"]["recipe"] == "1.肉じゃが"
@@ -0,0 +1,56 @@
+import pytest
+
+from plan_archive import PlanArchive
+
+
+def meal_plan(start_day, materials):
+    return {
+        f"2026-11-{start_day + i:02d}": {"夕食": {"recipe": f"料理{i}", "reason": "", "materials": materials,
+                                                "url": f"https://example.com/{start_day}/{i}"}}
+        for i in range(7)
+    }
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = PlanArchive(str(tmp_path / "plans.sqlite3"))
+    archive.ids = {
+        "japanese": archive.save(meal_plan(2, "鶏もも肉,しょうゆ"), [], "和食メイン 簡単"),
+        "chinese": archive.save(meal_plan(9, "豚バラ肉,キャベツ"), [], "中華、野菜多め"),
+        "pasta": archive.save(meal_plan(16, "スパゲッティ,ベーコン"), [], "パスタ中心"),
+    }
+    return archive
+
+
+def found(archive, **conditions):
+    ids = {plan["id"] for plan in archive.search(**conditions)}
+    return {name for name, plan_id in archive.ids.items() if plan_id in ids}
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("和食メイン 簡単", {"japanese"}),
+    ("和食メイン　簡単", {"japanese"}),
+    ("簡単 和食", {"japanese"}),
+    ("和食メイン、中華", set()),
+    ("中華 野菜多め", {"chinese"}),
+    ("野菜多め", {"chinese"}),
+    ("パスタ", {"pasta"}),
+    ("中", {"chinese", "pasta"}),
+])
+def test_search_by_request_text(archive, text, expected):
+    assert found(archive, text=text) == expected
+
+
+def test_search_by_material_family(archive):
+    assert found(archive, material="鶏肉") == {"japanese"}
+    assert found(archive, material="キャベツ") == {"chinese"}
+
+
+def test_search_combines_conditions(archive):
+    assert found(archive, text="簡単", start="2026-11-01", end="2026-11-05") == {"japanese"}
+    assert found(archive, text="簡単", start="2026-11-20") == set()
+
+
+def test_deleted_plan_is_not_found(archive):
+    archive.delete(archive.ids["japanese"])
+    assert found(archive, text="和食メイン 簡単") == set()
@@ -0,0 +1,150 @@
+import threading
+import time
+
+import pytest
+
+from plan_cache import COMPUTED, HIT, WAITED, PlanCache
+
+
+def complete(value):
+    return None if value.get("complete") else "足りません"
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "plans.sqlite3")
+
+
+def run_together(count, function):
+    results = [None] * count
+    errors = [None] * count
+
+    def run(i):
+        try:
+            results[i] = function()
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    return results, errors
+
+
+def test_concurrent_calls_compute_once(path):
+    cache = PlanCache(path)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"complete": True, "n": len(calls)}
+
+    results, errors = run_together(5, lambda: cache.get_or_compute("k", compute))
+    assert errors == [None] * 5
+    assert len(calls) == 1
+    assert sorted(state for _, state in results) == [COMPUTED] + [WAITED] * 4
+    assert all(value == {"complete": True, "n": 1} for value, _ in results)
+    assert cache.get_or_compute("k", compute) == ({"complete": True, "n": 1}, HIT)
+
+
+def test_failure_is_shared_and_not_stored(path):
+    cache = PlanCache(path)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        raise RuntimeError("boom")
+
+    _, errors = run_together(4, lambda: cache.get_or_compute("k", compute))
+    assert len(calls) == 1
+    assert all(isinstance(e, RuntimeError) for e in errors)
+    assert cache.get("k") is None
+    assert cache.stats()["inflight"] == 0
+
+
+def test_incomplete_plan_is_returned_but_not_stored(path):
+    cache = PlanCache(path)
+    assert cache.get_or_compute("k", lambda: {"complete": False}, validate=complete) == ({"complete": False}, COMPUTED)
+    assert cache.get("k") is None
+    # 検証なしで書かれていた不完全な値も、検証ありなら使わずに作り直す
+    cache.put("k", {"complete": False})
+    assert cache.get_or_compute("k", lambda: {"complete": True}, validate=complete) == ({"complete": True}, COMPUTED)
+
+
+def test_bypass_recomputes_and_overwrites(path):
+    cache = PlanCache(path)
+    cache.put("k", {"v": "old"})
+    assert cache.get_or_compute("k", lambda: {"v": "new"}, bypass=True) == ({"v": "new"}, COMPUTED)
+    assert cache.get("k") == {"v": "new"}
+
+
+def test_get_since_rejects_older_rows(path):
+    cache = PlanCache(path)
+    cache.put("k", {"v": 1})
+    assert cache.get("k", since=time.time() + 1) is None
+    assert cache.get("k", since=time.time() - 60) == {"v": 1}
+
+
+def test_bypass_waits_for_a_fresh_value_from_another_process(path):
+    # 別のプロセス（別のインスタンス）が計算中の間、古い行は受け取らずに新しい結果を待つ
+    other = PlanCache(path)
+    cache = PlanCache(path, poll_interval=0.02)
+    other.put("k", {"v": "old"})
+    assert other._acquire("k")
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(value=cache.get_or_compute("k", lambda: {"v": "mine"}, bypass=True)))
+    thread.start()
+    time.sleep(0.2)
+    assert thread.is_alive()
+    other.put("k", {"v": "fresh"})
+    other._release("k")
+    thread.join(5)
+    assert result["value"] == ({"v": "fresh"}, WAITED)
+
+
+def test_bypass_computes_when_other_process_gives_up(path):
+    other = PlanCache(path)
+    cache = PlanCache(path, poll_interval=0.02)
+    other.put("k", {"v": "old"})
+    assert other._acquire("k")
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(value=cache.get_or_compute("k", lambda: {"v": "mine"}, bypass=True)))
+    thread.start()
+    time.sleep(0.1)
+    other._release("k")
+    thread.join(5)
+    assert result["value"] == ({"v": "mine"}, COMPUTED)
+
+
+def test_lru_eviction_by_entries(path):
+    cache = PlanCache(path, max_entries=2)
+    for key in ("a", "b"):
+        cache.put(key, {"key": key})
+        time.sleep(0.01)
+    cache.get("a")
+    time.sleep(0.01)
+    cache.put("c", {"key": "c"})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"key": "a"}
+    assert cache.stats()["entries"] == 2
+
+
+def test_incomplete_plan_is_shared_with_waiters_and_recomputed_later(path):
+    cache = PlanCache(path)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"complete": False}
+
+    results, errors = run_together(3, lambda: cache.get_or_compute("k", compute, validate=complete))
+    assert errors == [None] * 3
+    assert len(calls) == 1
+    assert all(value == {"complete": False} for value, _ in results)
+    cache.get_or_compute("k", compute, validate=complete)
+    assert len(calls) == 2
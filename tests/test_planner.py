@@ -0,0 +1,81 @@
+from collections import Counter
+from datetime import date
+
+import pytest
+
+from meal_plan import plan_dates
+from planner import solve_meal_plan, staple_of, staple_quotas
+
+MEAL_TYPES = ["朝食", "昼食", "夕食"]
+DATES = plan_dates(date(2026, 11, 2))
+STAPLE_CATEGORIES = {"rice": "14-121", "bread": "22-433", "noodle": "15-687"}
+
+
+def recipe(title, category_id, materials=3):
+    return {"recipeTitle": title, "categoryId": category_id, "recipeMaterial": ["材料"] * materials}
+
+
+def unique_title(n):
+    # 似た料理と判定されないように、レシピごとに別の文字だけでタイトルを作る
+    return "".join(chr(0x4E00 + n * 4 + i) for i in range(4))
+
+
+def recipes_by_staple(count):
+    recipes = []
+    for staple, category_id in STAPLE_CATEGORIES.items():
+        for _ in range(count):
+            recipes.append(recipe(unique_title(len(recipes)), category_id, materials=len(recipes) % 7 + 1))
+    return recipes
+
+
+@pytest.mark.parametrize("slots, ratios, expected", [
+    (21, (50, 25, 25), {"rice": 11, "bread": 5, "noodle": 5}),
+    (21, (100, 0, 0), {"rice": 21, "bread": 0, "noodle": 0}),
+    (7, (1, 1, 1), {"rice": 3, "bread": 2, "noodle": 2}),
+    (10, (2, 4, 4), {"rice": 2, "bread": 4, "noodle": 4}),
+])
+def test_staple_quotas(slots, ratios, expected):
+    quotas = staple_quotas(slots, *ratios)
+    assert quotas == expected
+    assert sum(quotas.values()) == slots
+
+
+def test_staple_quotas_without_ratios():
+    assert staple_quotas(21, 0, 0, 0) is None
+
+
+@pytest.mark.parametrize("ratios", [(50, 25, 25), (100, 0, 0), (20, 40, 40)])
+def test_solver_follows_quotas(ratios):
+    recipes = recipes_by_staple(30)
+    plan = solve_meal_plan(recipes, MEAL_TYPES, DATES, *ratios)
+    numbers = [number for meals in plan.values() for number in meals.values()]
+    assert len(numbers) == 21
+    assert len(set(numbers)) == 21
+    used = Counter(staple_of(recipes[number - 1]) for number in numbers)
+    assert {staple: used[staple] for staple in STAPLE_CATEGORIES} == staple_quotas(21, *ratios)
+
+
+def test_solver_relaxes_quota_when_staple_runs_out():
+    # パンのレシピが足りなければ、枠を空けずにほかの主食で埋める
+    recipes = recipes_by_staple(30)
+    recipes = [r for r in recipes if staple_of(r) != "bread"] + [recipe(unique_title(200), STAPLE_CATEGORIES["bread"])]
+    plan = solve_meal_plan(recipes, MEAL_TYPES, DATES, 0, 100, 0)
+    numbers = [number for meals in plan.values() for number in meals.values()]
+    assert len(numbers) == 21
+    assert Counter(staple_of(recipes[number - 1]) for number in numbers)["bread"] == 1
+
+
+def test_solver_skips_excluded_and_similar_recipes():
+    recipes = recipes_by_staple(10) + [recipe("ショートケーキ", "14-121"), recipe("シーザーサラダ", "14-121")]
+    recipes.append(dict(recipes[0], recipeTitle=recipes[0]["recipeTitle"] + "風"))
+    plan = solve_meal_plan(recipes, MEAL_TYPES, DATES, 50, 25, 25)
+    titles = [recipes[number - 1]["recipeTitle"] for meals in plan.values() for number in meals.values()]
+    assert "ショートケーキ" not in titles and "シーザーサラダ" not in titles
+    assert not (recipes[0]["recipeTitle"] in titles and recipes[-1]["recipeTitle"] in titles)
+
+
+def test_solver_leaves_slots_empty_without_recipes():
+    recipes = recipes_by_staple(2)
+    plan = solve_meal_plan(recipes, MEAL_TYPES, DATES, 50, 25, 25)
+    assert list(plan) == DATES
+    assert sum(len(meals) for meals in plan.values()) == 6
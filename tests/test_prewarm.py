@@ -0,0 +1,72 @@
+import pytest
+
+pytest.importorskip("dotenv")  # prewarm は settings 経由で .env を読む
+
+import prewarm
+from recipe_cache import RankingCache
+
+
+class Categories:
+    def __init__(self, tree):
+        self.tree = tree
+        self.ids = [category_id for root, children in tree.items() for category_id in [root] + children]
+
+    def descendants(self, root):
+        return list(self.tree.get(root, []))
+
+
+class Store:
+    def __init__(self, categories=()):
+        self.stored = set(categories)
+        self.ingested = []
+
+    def categories(self):
+        return set(self.stored)
+
+    def ingest(self, category_id, recipes):
+        self.ingested.append(category_id)
+        self.stored.add(category_id)
+
+
+CATEGORIES = Categories({"10": ["10-1", "10-2"], "11": ["11-1"]})
+
+
+def test_targets_are_missing_then_oldest():
+    fetched = {"10": 900, "10-1": 100, "10-2": 500, "11": 950}
+    assert prewarm.prewarm_targets(CATEGORIES, fetched, max_age=200, now=1000) == ["11-1", "10-1", "10-2"]
+
+
+def test_targets_force_and_roots():
+    fetched = {category_id: 1000 for category_id in CATEGORIES.ids}
+    assert prewarm.prewarm_targets(CATEGORIES, fetched, max_age=0, now=1000) == CATEGORIES.ids
+    assert prewarm.prewarm_targets(CATEGORIES, {}, max_age=3600, roots=["11"], now=10_000) == ["11", "11-1"]
+
+
+def test_prewarm_ingests_only_changed_or_missing_categories(tmp_path, monkeypatch, capsys):
+    rankings = {category_id: [{"recipeTitle": category_id}] for category_id in ("10", "10-1", "10-2")}
+
+    def fetch(category_id):
+        if category_id == "10-2":
+            raise RuntimeError("timeout")
+        return rankings[category_id]
+
+    monkeypatch.setattr(prewarm, "fetch_recipe_ranking", fetch)
+    cache = RankingCache(str(tmp_path / "rankings.sqlite3"))
+    cache.put("10", rankings["10"])
+    cache.put("10-1", [{"recipeTitle": "古いランキング"}])
+    old_10_2 = [{"recipeTitle": "前回のデータ"}]
+    cache.put("10-2", old_10_2)
+    store = Store(["10", "10-1"])
+
+    counts = prewarm.prewarm(["10", "10-1", "10-2"], cache, store, max_workers=2)
+    assert counts == {"changed": 1, "unchanged": 1, "errors": 1}
+    # 変わった 10-1 だけを取り込み直す。失敗した 10-2 は前回のデータを残す
+    assert store.ingested == ["10-1"]
+    assert cache.lookup("10-2")[0] == old_10_2
+    assert "10-2: timeout" in capsys.readouterr().err
+
+    # ストアにまだないカテゴリは、ランキングが同じでも取り込む
+    store = Store()
+    counts = prewarm.prewarm(["10", "10-1"], cache, store, max_workers=1)
+    assert counts == {"changed": 0, "unchanged": 2, "errors": 0}
+    assert sorted(store.ingested) == ["10", "10-1"]
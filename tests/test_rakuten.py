@@ -0,0 +1,65 @@
+import pytest
+
+from rakuten import RakutenClient, retry_delay
+
+
+def test_retry_after_is_honoured_in_full():
+    # 以前は max_backoff * 4（32秒）で打ち切っていた
+    assert retry_delay(0, "45", max_backoff=8.0, max_wait=60.0) == 45.0
+
+
+def test_retry_after_over_max_wait_gives_up():
+    assert retry_delay(0, "120", max_wait=60.0) is None
+
+
+def test_unparsable_retry_after_uses_backoff():
+    assert 0 <= retry_delay(2, "soon", backoff=0.5, max_backoff=8.0) <= 2.0
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None, body=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.body = body
+
+    def raise_for_status(self):
+        import requests
+
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(str(self.status_code))
+
+    def json(self):
+        return self.body
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def get(self, *args, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def test_client_fails_at_once_on_long_retry_after(monkeypatch):
+    requests = pytest.importorskip("requests")
+    sleeps = []
+    monkeypatch.setattr("rakuten.time.sleep", sleeps.append)
+    client = RakutenClient("app", max_retries=3, max_retry_wait=60.0)
+    client.session = FakeSession([FakeResponse(429, {"Retry-After": "600"})])
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.ranking("10")
+    assert client.session.calls == 1
+    assert sleeps == []
+    assert client.stats()["failures"] == 1
+
+
+def test_client_waits_full_retry_after(monkeypatch):
+    pytest.importorskip("requests")
+    sleeps = []
+    monkeypatch.setattr("rakuten.time.sleep", sleeps.append)
+    client = RakutenClient("app", max_retries=3, max_retry_wait=60.0)
+    client.session = FakeSession([FakeResponse(429, {"Retry-After": "40"}), FakeResponse(200, body={"result": [1]})])
+    assert client.ranking("10") == [1]
+    assert sleeps == [40.0]
@@ -0,0 +1,55 @@
+import hashlib
+import json
+import sqlite3
+import time
+
+import pytest
+
+from recipe_cache import RankingCache
+
+RECIPES = [{"recipeTitle": "肉じゃが", "recipeUrl": "https://example.com/1", "recipeMaterial": ["牛肉", "じゃがいも"]}]
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "rankings.sqlite3")
+
+
+def row(path, category_id):
+    with sqlite3.connect(path) as conn:
+        return conn.execute(
+            "SELECT payload, fetched_at, digest, changed_at FROM rankings WHERE category_id = ?", (category_id,)
+        ).fetchone()
+
+
+def test_put_reports_changes_by_digest(path):
+    cache = RankingCache(path)
+    assert cache.put("10", RECIPES) is True
+    payload, fetched_at, digest, changed_at = row(path, "10")
+    assert digest == hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    assert json.loads(payload) == RECIPES
+
+    time.sleep(0.01)
+    # 同じランキングなら取得時刻だけが進む
+    assert cache.put("10", [dict(recipe) for recipe in RECIPES]) is False
+    _, fetched_again, digest_again, changed_again = row(path, "10")
+    assert fetched_again > fetched_at
+    assert (digest_again, changed_again) == (digest, changed_at)
+    assert cache.stats()["unchanged"] == 1
+
+    time.sleep(0.01)
+    assert cache.put("10", RECIPES + [{"recipeTitle": "親子丼"}]) is True
+    _, _, digest_changed, changed_later = row(path, "10")
+    assert digest_changed != digest and changed_later > changed_at
+
+
+def test_old_file_without_digest_is_migrated(path):
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE rankings (category_id TEXT PRIMARY KEY, payload TEXT NOT NULL, fetched_at REAL NOT NULL)")
+        conn.execute("INSERT INTO rankings VALUES ('10', ?, 0)", (json.dumps(RECIPES, ensure_ascii=False),))
+    cache = RankingCache(path)
+    assert cache.lookup("10") == (None, "miss")
+    # 前回の digest がないので、同じ内容でも変わったものとして保存し直す
+    assert cache.put("10", RECIPES) is True
+    assert cache.put("10", RECIPES) is False
+    assert cache.fetched_times()["10"] > 0
@@ -0,0 +1,241 @@
+# パイプラインの段階ごとの計測
+#   trace():   1回の献立作成を囲み、段階ごとの時間・トークン数・回数をまとめる（終わったらログに1行書く）
+#   stage():   段階を囲む。中で呼ばれたモデルのトークン数などはその段階に加算される
+#   METRICS:   プロセス全体の累計。Prometheus のテキスト形式で出力できる
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_current_trace = contextvars.ContextVar("current_trace", default=None)
+_current_stage = contextvars.ContextVar("current_stage", default=None)
+
+
+class Metrics:
+    # カウンターと合計・回数だけのサマリー。ラベルはキーワード引数で渡す
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._summaries = {}
+        self._collectors = []
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            count, total = self._summaries.get(key, (0, 0.0))
+            self._summaries[key] = (count + 1, total + value)
+
+    def register(self, collect):
+        # collect() は [(名前, ラベルの辞書, 値)] を返す。出力のたびに呼ばれる（キャッシュの件数など）
+        with self._lock:
+            self._collectors.append(collect)
+
+    def render(self):
+        # Prometheus のテキスト形式
+        with self._lock:
+            counters = dict(self._counters)
+            summaries = dict(self._summaries)
+            collectors = list(self._collectors)
+        lines = []
+        for name in sorted({name for name, _ in counters}):
+            lines.append(f"# TYPE {name} counter")
+            lines.extend(f"{name}{_labels(labels)} {value}" for (n, labels), value in counters.items() if n == name)
+        for name in sorted({name for name, _ in summaries}):
+            lines.append(f"# TYPE {name} summary")
+            for (n, labels), (count, total) in summaries.items():
+                if n == name:
+                    lines.append(f"{name}_count{_labels(labels)} {count}")
+                    lines.append(f"{name}_sum{_labels(labels)} {round(total, 6)}")
+        gauges = {}
+        for collect in collectors:
+            try:
+                for name, labels, value in collect():
+                    gauges.setdefault(name, []).append((tuple(sorted(labels.items())), value))
+            except Exception:
+                continue
+        for name in sorted(gauges):
+            lines.append(f"# TYPE {name} gauge")
+            lines.extend(f"{name}{_labels(labels)} {value}" for labels, value in gauges[name])
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    parts = []
+    for name, value in labels:
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{name}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+METRICS = Metrics()
+
+
+class Trace:
+    def __init__(self, name):
+        self.name = name
+        self.started_at = time.time()
+        self.stages = {}
+        self._order = []
+        self._lock = threading.Lock()
+
+    def add(self, stage, **values):
+        stage = stage or "other"
+        with self._lock:
+            if stage not in self.stages:
+                self.stages[stage] = {"stage": stage, "seconds": 0.0}
+                self._order.append(stage)
+            entry = self.stages[stage]
+            for key, value in values.items():
+                entry[key] = entry.get(key, 0) + value
+
+    def summary(self):
+        with self._lock:
+            stages = [{key: round(value, 3) if isinstance(value, float) else value
+                       for key, value in self.stages[stage].items()} for stage in self._order]
+        totals = {}
+        for entry in stages:
+            for key, value in entry.items():
+                if key != "stage":
+                    totals[key] = round(totals.get(key, 0) + value, 3)
+        return {"name": self.name, "started_at": self.started_at, "stages": stages, "totals": totals}
+
+
+@contextmanager
+def trace(name, log_path=None, **fields):
+    # log_path を渡すと、終わったときに summary と fields を1行のJSONとして追記する
+    current = Trace(name)
+    token = _current_trace.set(current)
+    try:
+        yield current
+    finally:
+        _current_trace.reset(token)
+        if log_path:
+            write_log(log_path, dict(current.summary(), **fields))
+
+
+@contextmanager
+def stage(name):
+    stage_token = _current_stage.set(name)
+    start = time.perf_counter()
+    status = "ok"
+    try:
+        yield
+    except Exception:
+        status = "error"
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        _current_stage.reset(stage_token)
+        METRICS.observe("pipeline_stage_seconds", elapsed, stage=name, status=status)
+        current = _current_trace.get()
+        if current is not None:
+            current.add(name, seconds=elapsed)
+
+
+def count(**values):
+    # 実行中の段階に回数などを加える（trace の外では何もしない）
+    current = _current_trace.get()
+    if current is not None:
+        current.add(_current_stage.get(), **values)
+
+
+def bind(function):
+    # 別のスレッドで呼ぶ関数にも、呼び出し元の trace と段階を引き継ぐ
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        return context.copy().run(function, *args, **kwargs)
+    return run
+
+
+def record_model_call(response, elapsed, prompt=None):
+    # Gemini の usage_metadata からトークン数を記録する（ない場合はプロンプトの長さから見積もる）
+    from recipe_pool import estimate_tokens
+
+    usage = getattr(response, "usage_metadata", None)
+    prompt_tokens = getattr(usage, "prompt_token_count", None)
+    output_tokens = getattr(usage, "candidates_token_count", None)
+    if prompt_tokens is None and prompt is not None:
+        prompt_tokens = estimate_tokens(prompt)
+    stage_name = _current_stage.get() or "other"
+    METRICS.inc("gemini_calls_total", stage=stage_name)
+    METRICS.observe("gemini_call_seconds", elapsed, stage=stage_name)
+    values = {"model_calls": 1, "model_seconds": elapsed}
+    if prompt_tokens:
+        METRICS.inc("gemini_prompt_tokens_total", prompt_tokens, stage=stage_name)
+        values["prompt_tokens"] = prompt_tokens
+    if output_tokens:
+        METRICS.inc("gemini_output_tokens_total", output_tokens, stage=stage_name)
+        values["output_tokens"] = output_tokens
+    count(**values)
+
+
+class TracedModel:
+    # GenerativeModel を包み、generate_content の時間とトークン数を記録する
+    def __init__(self, model):
+        self._model = model
+
+    def generate_content(self, prompt, stream=False, **kwargs):
+        start = time.perf_counter()
+        response = self._model.generate_content(prompt, stream=stream, **kwargs)
+        if not stream:
+            record_model_call(response, time.perf_counter() - start, prompt)
+            return response
+        return self._traced_stream(response, start, prompt)
+
+    def _traced_stream(self, response, start, prompt):
+        # トークン数はストリームの最後のチャンクに入っている
+        last = None
+        try:
+            for chunk in response:
+                last = chunk
+                yield chunk
+        finally:
+            record_model_call(last, time.perf_counter() - start, prompt)
+
+    def __getattr__(self, name):
+        return getattr(self._model, name)
+
+
+_log_lock = threading.Lock()
+
+
+def write_log(path, record):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    line = json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str)
+    with _log_lock, open(path, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+
+def start_metrics_server(port, host="127.0.0.1"):
+    # /metrics で METRICS を返すHTTPサーバーをデーモンスレッドで動かす
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = METRICS.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server